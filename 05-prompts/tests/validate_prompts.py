@@ -5,6 +5,8 @@ Checks:
 - Validate example instances against Layer 3 schemas: codex_entry, edit_notes.
 - Validate envelopes in examples under structure-only mode (skip payload.data).
 - Whitelisted strict examples run full payload validation (envelope + payload).
+- Differential check: the compiled envelope fast path must agree with full
+  jsonschema validation on every example envelope and single-field mutations.
 """
 
 from __future__ import annotations
@@ -21,8 +23,13 @@ sys.path.insert(0, str(TOOLS_SRC))
 from questfoundry_spec_tools.instance_validator import (
     validate_instance,
     find_schema_file,
-    validate_envelope,
+    validate_envelopes,
 )  # type: ignore
+from questfoundry_spec_tools.schema_registry import get_registry  # type: ignore
+
+# Values substituted into envelope fields for the fast-path differential check
+_MUTATION_VALUES = [None, 0, True, "", "PN", "cold", "ack", "error", "none", [], {}]
+_NESTED_MUTATION_VALUES = [None, "", "PN", "cold"]
 
 
 def validate_instance_file(schema_name: str, instance_path: Path) -> tuple[bool, str]:
@@ -32,6 +39,54 @@ def validate_instance_file(schema_name: str, instance_path: Path) -> tuple[bool,
     return validate_instance(schema_path, instance_path)
 
 
+def _mutations(envelope: dict) -> Iterable[dict]:
+    """The envelope plus single-field deletions and substitutions, two levels deep."""
+    yield envelope
+    for key, value in envelope.items():
+        yield {k: v for k, v in envelope.items() if k != key}
+        for repl in _MUTATION_VALUES:
+            yield {**envelope, key: repl}
+        if isinstance(value, dict):
+            for sub in value:
+                yield {**envelope, key: {k: v for k, v in value.items() if k != sub}}
+                for repl in _NESTED_MUTATION_VALUES:
+                    yield {**envelope, key: {**value, sub: repl}}
+
+
+def check_fast_path_equivalence(envelopes: Iterable[dict]) -> list[str]:
+    entry = get_registry(REPO_ROOT).entry_for_path(REPO_ROOT / "04-protocol" / "envelope.schema.json")
+    if entry.fast_check is None:
+        return ["envelope.schema.json: fast path could not be compiled"]
+
+    mismatches: list[str] = []
+    total = 0
+    seen_shapes: set[str] = set()
+    for envelope in envelopes:
+        if not isinstance(envelope, dict):
+            continue
+        # Every example is compared as-is; mutations only for envelopes of a new shape
+        shape = json.dumps(
+            [
+                envelope.get("intent") in ("ack", "error"),
+                (envelope.get("receiver") or {}).get("role") == "PN",
+                sorted(envelope),
+                sorted(envelope.get("context") or {}),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        variants = _mutations(envelope) if shape not in seen_shapes else [envelope]
+        seen_shapes.add(shape)
+        for variant in variants:
+            total += 1
+            if entry.fast_check(variant) != entry.validator.is_valid(variant):
+                mismatches.append(f"fast path disagrees with jsonschema: {json.dumps(variant)[:200]}")
+
+    status = "PASS" if not mismatches else "FAIL"
+    print(f"[{status}] envelope fast path: {total} variants compared with jsonschema")
+    return mismatches
+
+
 def main() -> int:
     # Whitelist examples for FULL payload validation (strict mode)
     # Use paths relative to the repo root
@@ -48,6 +103,7 @@ def main() -> int:
         "edit_notes": REPO_ROOT / "05-prompts" / "tests" / "fixtures" / "edit_notes.example.json",
     }
     failures: list[str] = []
+    corpus: list[dict] = []
 
     for name, path in fixtures.items():
         ok, msg = validate_instance_file(name, path)
@@ -64,40 +120,25 @@ def main() -> int:
         except Exception as e:  # noqa: BLE001
             failures.append(f"{ex}: invalid JSON: {e}")
             continue
-        def _structure_only(envelope: dict) -> tuple[bool, str]:
+        def _structure_only(envelope: dict) -> dict:
             # Force payload.type to 'none' to skip payload.data validation (structure-only pass)
             env2 = dict(envelope)
             payload = dict(env2.get("payload", {}))
             payload["type"] = "none"
             payload.setdefault("data", {})
             env2["payload"] = payload
-            from tempfile import NamedTemporaryFile
-
-            with NamedTemporaryFile("w", delete=False, suffix=".json", encoding="utf-8") as tf:
-                json.dump(env2, tf)
-                temp_path = Path(tf.name)
-            ok_, msg_ = validate_envelope(temp_path, REPO_ROOT)
-            temp_path.unlink(missing_ok=True)
-            return ok_, msg_
-
-        def _full_validate(envelope: dict) -> tuple[bool, str]:
-            # Validate envelope as-is (includes payload.data against Layer 3 schema)
-            from tempfile import NamedTemporaryFile
-
-            with NamedTemporaryFile("w", delete=False, suffix=".json", encoding="utf-8") as tf:
-                json.dump(envelope, tf)
-                temp_path = Path(tf.name)
-            ok_, msg_ = validate_envelope(temp_path, REPO_ROOT)
-            temp_path.unlink(missing_ok=True)
-            return ok_, msg_
+            return env2
 
         def _validate_sequence(envelopes: Iterable[dict], strict: bool, label: str) -> None:
-            for idx, env in enumerate(envelopes):
-                ok, msg = (_full_validate(env) if strict else _structure_only(env))
-                status = "PASS" if ok else "FAIL"
-                print(f"[{status}] envelope: {label} [#{idx}]")
-                if not ok:
-                    failures.append(f"{label} [#{idx}]: {msg}")
+            envelopes = list(envelopes)
+            corpus.extend(envelopes)
+            # Strict examples validate as-is (includes payload.data against Layer 3 schema)
+            batch = envelopes if strict else [_structure_only(env) for env in envelopes]
+            for result in validate_envelopes(batch, REPO_ROOT):
+                status = "PASS" if result.is_valid else "FAIL"
+                print(f"[{status}] envelope: {label} [#{result.index}]")
+                if not result.is_valid:
+                    failures.append(f"{label} [#{result.index}]: {result.error_message}")
 
         strict_mode = ex in strict_examples
         if isinstance(obj, list):
@@ -116,7 +157,10 @@ def main() -> int:
                     failures.append(f"{ex}: messages array found but no envelopes extracted")
             else:
                 # Regular envelope validation
-                ok, msg = (_full_validate(obj) if strict_mode else _structure_only(obj))
+                corpus.append(obj)
+                envelope = obj if strict_mode else _structure_only(obj)
+                [result] = validate_envelopes([envelope], REPO_ROOT)
+                ok, msg = result.is_valid, result.error_message
                 status = "PASS" if ok else "FAIL"
                 print(f"[{status}] envelope: {ex}")
                 if not ok:
@@ -124,6 +168,8 @@ def main() -> int:
         else:
             failures.append(f"{ex}: JSON must be object or array of objects")
 
+    failures.extend(check_fast_path_equivalence(corpus))
+
     if failures:
         print("\nValidation failures:")
         for f in failures:
@@ -7,6 +7,12 @@ NOT for implementing games/books using the spec (that's Layer 6).
 Provides:
 - Schema validation (meta-validation against JSON Schema Draft 2020-12)
 - Instance validation (artifact validation against QuestFoundry schemas)
+- Schema registry (process-wide cache of compiled validators)
+- Validation daemon (qfspec-serve, warm registry over HTTP or a Unix socket)
+- Asyncio envelope validation (AsyncEnvelopeValidator, for in-process orchestrators)
+- Lifecycle checking (LifecycleEngine, hook/TU/gate/view state machines)
+- Message graph checking (MessageGraphChecker, reply_to/correlation_id links and latency)
+- Snapshot checking (check_snapshot, cross-artifact references in Hot/Cold snapshots)
 """
 
 __version__ = "0.1.0"
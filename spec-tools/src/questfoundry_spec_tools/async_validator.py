@@ -0,0 +1,104 @@
+"""
+Asyncio envelope validation for in-process orchestrators.
+
+Runs the two-pass envelope validation (see instance_validator) in a bounded
+thread pool so the event loop never blocks on file I/O or schema checks.
+Validators are the same compiled objects the sync path uses, served from the
+process-wide schema registry.
+
+Example:
+    async with AsyncEnvelopeValidator(repo_root, max_concurrency=8) as validator:
+        result = await validator.validate(envelope)
+        results = await validator.validate_many(envelopes)
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .instance_validator import EnvelopeResult, EnvelopeValidator
+from .schema_registry import SchemaRegistry
+
+
+class AsyncEnvelopeValidator:
+    """
+    Awaitable envelope validator with a configurable concurrency limit.
+
+    At most `max_concurrency` validations are in flight at once; further
+    calls wait for a free slot (back-pressure) instead of queueing unbounded
+    work on the executor.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        max_concurrency: Optional[int] = None,
+        registry: Optional[SchemaRegistry] = None,
+    ):
+        self.max_concurrency = max_concurrency or min(32, (os.cpu_count() or 1) + 4)
+        self._validator = EnvelopeValidator(base_dir, registry=registry)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="qfspec-validate",
+        )
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def _run(self, item: Union[dict, Path], index: int) -> EnvelopeResult:
+        """Validate in the executor while holding a slot."""
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._validator.validate_item, item, index)
+
+    async def validate(self, envelope: Union[dict, Path]) -> EnvelopeResult:
+        """
+        Validate one envelope without blocking the event loop.
+
+        Args:
+            envelope: Parsed envelope, or path to an envelope file
+
+        Returns:
+            EnvelopeResult for the envelope
+        """
+        return await self._run(envelope, 0)
+
+    async def validate_many(self, envelopes: Iterable[Union[dict, Path]]) -> list[EnvelopeResult]:
+        """
+        Validate many envelopes concurrently and await all results.
+
+        Envelopes are pulled from the iterable only as validations finish
+        (at most max_concurrency are pending), so a lazy source (e.g. a log
+        reader) is never drained ahead of validation. If the call is
+        cancelled, its pending validations are cancelled too.
+
+        Args:
+            envelopes: Parsed envelopes and/or paths to envelope files
+
+        Returns:
+            One EnvelopeResult per input, in input order
+        """
+        tasks = []
+        pending = set()
+        try:
+            for index, envelope in enumerate(envelopes):
+                if len(pending) >= self.max_concurrency:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = asyncio.ensure_future(self._run(envelope, index))
+                tasks.append(task)
+                pending.add(task)
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def close(self) -> None:
+        """Shut down the executor, waiting for in-flight validations."""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncEnvelopeValidator":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
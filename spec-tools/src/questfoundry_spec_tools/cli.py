@@ -2,6 +2,7 @@
 CLI entry points for QuestFoundry specification tools.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -9,9 +10,23 @@ from .schema_validator import find_schema_files, validate_schema_file
 from .instance_validator import (
     list_available_schemas,
     find_schema_file,
-    validate_instance,
-    validate_envelope,
+    iter_validate_instances,
+    iter_validate_envelopes,
+    iter_validate_envelope_streams,
+    iter_envelope_stream,
 )
+from .lifecycle import LifecycleEngine
+from .message_graph import DEFAULT_MAX_IN_MEMORY, MessageGraphChecker
+from .snapshot import check_snapshot
+from .result_cache import open_result_cache, schemas_digest, validate_cached
+from .schema_registry import get_registry
+
+# Directory for qfspec-check-graph --spill scratch indexes (one uniquely named file per run)
+GRAPH_SPILL_DIR = Path(".qfspec-cache")
+
+# Cache namespace for meta-validation results (the bundled meta-schema is
+# pinned by the tool version that is also part of every key)
+META_SCHEMA_KEY = "draft-2020-12"
 
 # ANSI color codes
 RED = '\033[0;31m'
@@ -43,12 +58,52 @@ def find_repo_root() -> Path:
     return current
 
 
+def parse_jobs_option(args: list[str]) -> tuple[int, list[str]]:
+    """
+    Extract a --jobs/-j option from a command line.
+
+    Args:
+        args: Command-line arguments (without the program name)
+
+    Returns:
+        Tuple of (jobs, remaining_args); jobs defaults to the CPU count
+    """
+    jobs = os.cpu_count() or 1
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        value = None
+        if arg in ("--jobs", "-j"):
+            if i + 1 >= len(args):
+                print(f"{RED}Error: {arg} requires a value{NC}")
+                sys.exit(1)
+            value = args[i + 1]
+            i += 1
+        elif arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+        elif arg.startswith("-j") and len(arg) > 2:
+            value = arg[2:]
+        else:
+            remaining.append(arg)
+
+        if value is not None:
+            if not value.isdigit() or int(value) < 1:
+                print(f"{RED}Error: --jobs must be a positive integer, got '{value}'{NC}")
+                sys.exit(1)
+            jobs = int(value)
+        i += 1
+
+    return jobs, remaining
+
+
 def validate_schemas_cli():
     """
     CLI entry point for qfspec-validate command.
     Validates all schemas in the repository.
     """
     repo_root = find_repo_root()
+    use_cache = "--no-cache" not in sys.argv[1:]
 
     print("=== QuestFoundry Spec: Schema Validator ===")
     print(f"Repository: {repo_root}")
@@ -70,9 +125,15 @@ def validate_schemas_cli():
 
     errors = []
 
+    def check_schemas(paths: list[Path]) -> list[tuple[bool, str]]:
+        return [validate_schema_file(path) for path in paths]
+
+    cache = open_result_cache(repo_root, enabled=use_cache)
+    outcomes = validate_cached(cache, schema_files, META_SCHEMA_KEY, check_schemas, kind="schema")
+
     for schema_file in schema_files:
         print(f"  Checking {schema_file.name}... ", end="", flush=True)
-        is_valid, error_msg = validate_schema_file(schema_file)
+        is_valid, error_msg = next(outcomes)
 
         if is_valid:
             print(f"{GREEN}✓{NC}")
@@ -87,8 +148,10 @@ def validate_schemas_cli():
     
     if layer4_schema.exists():
         print(f"  Checking envelope.schema.json... ", end="", flush=True)
-        is_valid, error_msg = validate_schema_file(layer4_schema)
-        
+        [(is_valid, error_msg)] = validate_cached(
+            cache, [layer4_schema], META_SCHEMA_KEY, check_schemas, kind="schema"
+        )
+
         if is_valid:
             print(f"{GREEN}✓{NC}")
         else:
@@ -97,6 +160,9 @@ def validate_schemas_cli():
     else:
         print(f"{YELLOW}  No envelope.schema.json found{NC}")
 
+    if cache is not None:
+        cache.close()
+
     # Summary
     print("")
     print("=== Validation Summary ===")
@@ -120,10 +186,13 @@ def validate_instance_cli():
     Validates instance files against a schema.
     """
     repo_root = find_repo_root()
+    jobs, args = parse_jobs_option(sys.argv[1:])
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg != "--no-cache"]
 
     # Check arguments
-    if len(sys.argv) < 3:
-        print("Usage: qfspec-check-instance <schema-name> <instance-file> [instance-file2 ...]")
+    if len(args) < 2:
+        print("Usage: qfspec-check-instance [--jobs N] [--no-cache] <schema-name> <instance-file> [instance-file2 ...]")
         print("")
         print("Validates artifact instance(s) against a QuestFoundry schema")
         print("")
@@ -131,6 +200,11 @@ def validate_instance_cli():
         print("  qfspec-check-instance hook_card my-hook.json")
         print("  qfspec-check-instance gatecheck_report report1.json report2.json")
         print("  qfspec-check-instance view_log logs/*.json")
+        print("  qfspec-check-instance --jobs 8 view_log logs/*.json")
+        print("")
+        print("Options:")
+        print("  --jobs N, -j N  Worker processes (default: CPU count)")
+        print("  --no-cache      Revalidate files even if unchanged since the last run")
         print("")
 
         schemas = list_available_schemas(repo_root)
@@ -143,8 +217,8 @@ def validate_instance_cli():
 
         sys.exit(1)
 
-    schema_name = sys.argv[1]
-    instance_files = sys.argv[2:]
+    schema_name = args[0]
+    instance_files = args[1:]
 
     # Locate schema file
     schema_path = find_schema_file(repo_root, schema_name)
@@ -168,9 +242,17 @@ def validate_instance_cli():
     total = 0
     errors = 0
 
-    for instance_file in instance_files:
-        instance_path = Path(instance_file)
-
+    instance_paths = [Path(f) for f in instance_files]
+    cache = open_result_cache(repo_root, enabled=use_cache)
+    schema_sha256 = get_registry().entry_for_path(schema_path).sha256
+    outcomes = validate_cached(
+        cache,
+        [p for p in instance_paths if p.exists()],
+        schema_sha256,
+        lambda paths: iter_validate_instances(schema_path, paths, jobs=jobs),
+    )
+
+    for instance_path in instance_paths:
         if not instance_path.exists():
             print(f"{RED}✗{NC} {instance_path.name} - File not found")
             errors += 1
@@ -180,7 +262,7 @@ def validate_instance_cli():
         total += 1
         print(f"Validating {instance_path.name}... ", end="", flush=True)
 
-        is_valid, error_msg = validate_instance(schema_path, instance_path)
+        is_valid, error_msg = next(outcomes)
 
         if is_valid:
             print(f"{GREEN}✓{NC}")
@@ -190,6 +272,9 @@ def validate_instance_cli():
             print("")
             errors += 1
 
+    if cache is not None:
+        cache.close()
+
     # Summary
     print("")
     print("=== Validation Summary ===")
@@ -210,20 +295,34 @@ def validate_envelope_cli():
     Validates envelope files against envelope schema and their payloads against Layer 3 schemas.
     """
     repo_root = find_repo_root()
+    jobs, args = parse_jobs_option(sys.argv[1:])
+    stream = "--stream" in args
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg not in ("--stream", "--no-cache")]
 
     # Check arguments
-    if len(sys.argv) < 2:
-        print("Usage: qfspec-check-envelope <envelope-file> [envelope-file2 ...]")
+    if len(args) < 1:
+        print("Usage: qfspec-check-envelope [--jobs N] [--stream] [--no-cache] <envelope-file> [envelope-file2 ...]")
         print("")
         print("Validates envelope structure and payload data against schemas")
         print("")
         print("Examples:")
         print("  qfspec-check-envelope 04-protocol/EXAMPLES/hook.create.json")
         print("  qfspec-check-envelope 04-protocol/EXAMPLES/*.json")
+        print("  qfspec-check-envelope --jobs 16 logs/*.json")
+        print("  qfspec-check-envelope --stream sessions/*.ndjson")
+        print("")
+        print("Options:")
+        print("  --jobs N, -j N  Worker processes (default: CPU count)")
+        print("  --stream        Each file is an NDJSON stream or JSON array of envelopes")
+        print("  --no-cache      Revalidate files even if unchanged since the last run")
         print("")
         sys.exit(1)
 
-    envelope_files = sys.argv[1:]
+    envelope_files = args
+
+    if stream:
+        _validate_envelope_streams(repo_root, envelope_files, jobs)
 
     # Validate each envelope
     print("=== QuestFoundry Spec: Envelope Validator ===")
@@ -233,9 +332,17 @@ def validate_envelope_cli():
     total = 0
     errors = 0
 
-    for envelope_file in envelope_files:
-        envelope_path = Path(envelope_file)
-
+    envelope_paths = [Path(f) for f in envelope_files]
+    cache = open_result_cache(repo_root, enabled=use_cache)
+    outcomes = validate_cached(
+        cache,
+        [p for p in envelope_paths if p.exists()],
+        schemas_digest(repo_root, get_registry(repo_root)) if cache is not None else "",
+        lambda paths: iter_validate_envelopes(paths, repo_root, jobs=jobs),
+        kind="envelope",
+    )
+
+    for envelope_path in envelope_paths:
         if not envelope_path.exists():
             print(f"{RED}✗{NC} {envelope_path.name} - File not found")
             errors += 1
@@ -245,7 +352,7 @@ def validate_envelope_cli():
         total += 1
         print(f"Validating {envelope_path.name}... ", end="", flush=True)
 
-        is_valid, error_msg = validate_envelope(envelope_path, repo_root)
+        is_valid, error_msg = next(outcomes)
 
         if is_valid:
             print(f"{GREEN}✓{NC}")
@@ -255,6 +362,63 @@ def validate_envelope_cli():
             print("")
             errors += 1
 
+    if cache is not None:
+        cache.close()
+
+    # Summary
+    print("")
+    print("=== Validation Summary ===")
+    print(f"Total: {total}")
+    print(f"Passed: {GREEN}{total - errors}{NC}")
+
+    if errors == 0:
+        print(f"{GREEN}All envelopes are valid!{NC}")
+        sys.exit(0)
+    else:
+        print(f"Failed: {RED}{errors}{NC}")
+        sys.exit(1)
+
+
+def _validate_envelope_streams(repo_root: Path, stream_files: list[str], jobs: int):
+    """
+    Stream-mode body of qfspec-check-envelope.
+    Each file holds many envelopes (NDJSON or a top-level JSON array); only
+    failing envelopes are printed, located as file:line or file[#index].
+    """
+    print("=== QuestFoundry Spec: Envelope Validator (stream) ===")
+    print(f"Repository: {repo_root}")
+    print("")
+
+    total = 0
+    errors = 0
+
+    stream_paths = [Path(f) for f in stream_files]
+    outcomes = iter_validate_envelope_streams(
+        [p for p in stream_paths if p.exists()], repo_root, jobs=jobs
+    )
+
+    for stream_path in stream_paths:
+        if not stream_path.exists():
+            print(f"{RED}✗{NC} {stream_path.name} - File not found")
+            errors += 1
+            total += 1
+            continue
+
+        print(f"Streaming {stream_path.name}... ", end="", flush=True)
+
+        count, failures = next(outcomes)
+        total += count
+        errors += len(failures)
+
+        if not failures:
+            print(f"{GREEN}✓{NC} ({count} envelopes)")
+        else:
+            print(f"{RED}✗{NC} ({count} envelopes, {len(failures)} failed)")
+            for location, error_msg in failures:
+                print(f"  {location}")
+                print(f"    {error_msg}")
+            print("")
+
     # Summary
     print("")
     print("=== Validation Summary ===")
@@ -267,3 +431,282 @@ def validate_envelope_cli():
     else:
         print(f"Failed: {RED}{errors}{NC}")
         sys.exit(1)
+
+
+def check_lifecycle_cli():
+    """
+    CLI entry point for qfspec-check-lifecycle command.
+    Replays envelope streams against the hook, TU, gate and view state machines
+    in 04-protocol/LIFECYCLES/. Files are read in argument order and share
+    state, so a session log split across files is checked as one.
+    """
+    repo_root = find_repo_root()
+    args = sys.argv[1:]
+    strict = "--strict" in args
+    check_roles = "--no-roles" not in args
+    args = [arg for arg in args if arg not in ("--strict", "--no-roles")]
+
+    if len(args) < 1:
+        print("Usage: qfspec-check-lifecycle [--strict] [--no-roles] <stream-file> [stream-file2 ...]")
+        print("")
+        print("Checks lifecycle transitions (hook, TU, gate, view) across envelope streams")
+        print("")
+        print("Examples:")
+        print("  qfspec-check-lifecycle sessions/2025-10-30.ndjson")
+        print("  qfspec-check-lifecycle --strict sessions/*.ndjson")
+        print("")
+        print("Options:")
+        print("  --strict        Entities must be created in the log before they transition")
+        print("  --no-roles      Skip sender role checks")
+        print("")
+        sys.exit(1)
+
+    print("=== QuestFoundry Spec: Lifecycle Checker ===")
+    print(f"Repository: {repo_root}")
+    print("")
+
+    try:
+        engine = LifecycleEngine.from_repo(repo_root, strict=strict, check_roles=check_roles)
+    except ValueError as e:
+        print(f"{RED}Error: {e}{NC}")
+        sys.exit(1)
+
+    total = 0
+    errors = 0
+
+    for stream_path in (Path(f) for f in args):
+        if not stream_path.exists():
+            print(f"{RED}✗{NC} {stream_path.name} - File not found")
+            errors += 1
+            continue
+
+        print(f"Replaying {stream_path.name}... ", end="", flush=True)
+
+        count = 0
+        failures = []
+        try:
+            for location, envelope, error_msg in iter_envelope_stream(stream_path):
+                count += 1
+                if envelope is None:
+                    failures.append((location, error_msg))
+                    continue
+                if not isinstance(envelope, dict):
+                    failures.append((location, "Envelope must be a JSON object"))
+                    continue
+                violation = engine.check(envelope, location)
+                if violation is not None:
+                    failures.append((location, f"{violation.code}: {violation.message}"))
+        except (OSError, UnicodeDecodeError) as e:
+            failures.append((str(stream_path), f"Unexpected error: {e}"))
+
+        total += count
+        errors += len(failures)
+
+        if not failures:
+            print(f"{GREEN}✓{NC} ({count} envelopes)")
+        else:
+            print(f"{RED}✗{NC} ({count} envelopes, {len(failures)} violations)")
+            for location, error_msg in failures:
+                print(f"  {location}")
+                print(f"    {error_msg}")
+            print("")
+
+    # Summary
+    print("")
+    print("=== Lifecycle Summary ===")
+    print(f"Envelopes: {total}")
+    print(f"Transitions applied: {engine.transitions}")
+    tracked = ", ".join(f"{name} {count}" for name, count in engine.counts().items())
+    print(f"Entities tracked: {tracked}")
+
+    if errors == 0:
+        print(f"{GREEN}All lifecycle transitions are valid!{NC}")
+        sys.exit(0)
+    else:
+        print(f"Violations: {RED}{errors}{NC}")
+        sys.exit(1)
+
+
+def check_graph_cli():
+    """
+    CLI entry point for qfspec-check-graph command.
+    Checks message ids, reply_to links and correlation ids across envelope
+    streams and reports request/response latency per reply intent.
+    """
+    repo_root = find_repo_root()
+    args = sys.argv[1:]
+    spill = "--spill" in args
+    args = [arg for arg in args if arg != "--spill"]
+    max_in_memory = DEFAULT_MAX_IN_MEMORY
+    if "--max-in-memory" in args:
+        i = args.index("--max-in-memory")
+        try:
+            max_in_memory = int(args[i + 1])
+            if max_in_memory < 1:
+                raise ValueError
+        except (IndexError, ValueError):
+            print(f"{RED}Error: --max-in-memory requires a positive integer{NC}")
+            sys.exit(1)
+        del args[i:i + 2]
+
+    if len(args) < 1:
+        print("Usage: qfspec-check-graph [--spill] [--max-in-memory N] <stream-file> [stream-file2 ...]")
+        print("")
+        print("Checks id uniqueness, reply_to targets and correlation ids across envelope streams")
+        print("")
+        print("Examples:")
+        print("  qfspec-check-graph sessions/2025-10-30.ndjson")
+        print("  qfspec-check-graph --spill sessions/*.ndjson")
+        print("")
+        print("Options:")
+        print("  --spill            Move the id index to disk (.qfspec-cache/) when it grows large")
+        print(f"  --max-in-memory N  Ids held in memory before spilling (default: {DEFAULT_MAX_IN_MEMORY})")
+        print("")
+        sys.exit(1)
+
+    print("=== QuestFoundry Spec: Message Graph Checker ===")
+    print(f"Repository: {repo_root}")
+    print("")
+
+    checker = MessageGraphChecker(repo_root / GRAPH_SPILL_DIR if spill else None, max_in_memory)
+    parse_errors = 0
+
+    for stream_path in (Path(f) for f in args):
+        if not stream_path.exists():
+            print(f"{RED}✗{NC} {stream_path.name} - File not found")
+            parse_errors += 1
+            continue
+
+        print(f"Reading {stream_path.name}... ", end="", flush=True)
+        count = 0
+        failures = []
+        try:
+            for location, envelope, error_msg in iter_envelope_stream(stream_path):
+                count += 1
+                if envelope is None:
+                    failures.append((location, error_msg))
+                else:
+                    checker.add(envelope, location)
+        except (OSError, UnicodeDecodeError) as e:
+            failures.append((str(stream_path), f"Unexpected error: {e}"))
+        parse_errors += len(failures)
+
+        if not failures:
+            print(f"({count} envelopes)")
+        else:
+            print(f"{RED}✗{NC} ({count} envelopes, {len(failures)} unreadable)")
+            for location, error_msg in failures:
+                print(f"  {location}")
+                print(f"    {error_msg}")
+
+    report = checker.finish()
+
+    for kind, title in (("duplicate", "Duplicate ids"), ("orphan", "Orphaned replies"),
+                        ("correlation", "Correlation mismatches")):
+        if report.samples[kind]:
+            print("")
+            print(f"{title}:")
+            for issue in report.samples[kind]:
+                print(f"  {issue.location}")
+                print(f"    {issue.message_id}: {issue.detail}")
+
+    if report.latency:
+        print("")
+        print("=== Reply Latency (ms) ===")
+        print(f"{'intent':<24} {'count':>8} {'mean':>10} {'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}")
+        for intent, stats in sorted(report.latency.items()):
+            print(f"{intent:<24} {stats.count:>8} {stats.mean_ms:>10.0f} {stats.percentile(0.5):>10} "
+                  f"{stats.percentile(0.95):>10} {stats.percentile(0.99):>10} {stats.max_ms:>10}")
+
+    # Summary
+    print("")
+    print("=== Graph Summary ===")
+    print(f"Messages: {report.messages}")
+    print(f"Replies: {report.replies}")
+    print(f"Duplicate ids: {report.duplicates}")
+    print(f"Orphaned replies: {report.orphans}")
+    print(f"Correlation mismatches: {report.correlation_mismatches}")
+    if report.negative_latencies:
+        print(f"{YELLOW}Replies timestamped before their target: {report.negative_latencies}{NC}")
+    if report.skipped:
+        print(f"{YELLOW}Envelopes without an id: {report.skipped}{NC}")
+
+    if report.ok and parse_errors == 0:
+        print(f"{GREEN}Message graph is consistent!{NC}")
+        sys.exit(0)
+    else:
+        print(f"Failed: {RED}{report.duplicates + report.orphans + parse_errors}{NC}")
+        sys.exit(1)
+
+
+def check_snapshot_cli():
+    """
+    CLI entry point for qfspec-check-snapshot command.
+    Validates every JSON artifact in a Hot/Cold snapshot directory and
+    reports references to artifacts, sections, files or snapshots that the
+    snapshot does not contain.
+    """
+    repo_root = find_repo_root()
+    jobs, args = parse_jobs_option(sys.argv[1:])
+
+    if len(args) != 1:
+        print("Usage: qfspec-check-snapshot [--jobs N] <snapshot-dir>")
+        print("")
+        print("Validates a Hot/Cold snapshot and resolves its cross-artifact references")
+        print("")
+        print("Examples:")
+        print("  qfspec-check-snapshot ../my-project")
+        print("  qfspec-check-snapshot --jobs 8 ../my-project")
+        print("")
+        print("Options:")
+        print("  --jobs N, -j N  Validate artifacts in N worker processes (default: CPU count)")
+        print("")
+        sys.exit(1)
+
+    snapshot_dir = Path(args[0])
+    if not snapshot_dir.is_dir():
+        print(f"{RED}Error: Snapshot directory not found: {snapshot_dir}{NC}")
+        sys.exit(1)
+
+    print("=== QuestFoundry Spec: Snapshot Checker ===")
+    print(f"Repository: {repo_root}")
+    print(f"Snapshot: {snapshot_dir.resolve()}")
+    print("")
+
+    report = check_snapshot(snapshot_dir, repo_root, jobs)
+
+    for result in report.invalid:
+        print(f"{RED}✗{NC} {result.path}" + (f" ({result.schema})" if result.schema else ""))
+        print(f"    {result.error}")
+
+    if report.dangling:
+        print("")
+        print("Dangling references:")
+        for issue in report.dangling:
+            print(f"  {issue.path} {issue.field}")
+            print(f"    {issue.kind} {issue.value!r}: {issue.detail}")
+
+    if report.duplicates:
+        print("")
+        print("Duplicate declarations:")
+        for issue in report.duplicates:
+            print(f"  {issue.path}")
+            print(f"    {issue.kind} {issue.value!r}: {issue.detail}")
+
+    # Summary
+    print("")
+    print("=== Snapshot Summary ===")
+    print(f"Files: {report.files}")
+    print(f"Artifacts checked: {len(report.artifacts) - report.untyped}")
+    if report.untyped:
+        print(f"{YELLOW}JSON files without a known schema: {report.untyped}{NC}")
+    print(f"Invalid artifacts: {len(report.invalid)}")
+    print(f"References resolved: {report.references - len(report.dangling)}/{report.references}")
+    print(f"Duplicate declarations: {len(report.duplicates)}")
+
+    if report.ok:
+        print(f"{GREEN}Snapshot is consistent!{NC}")
+        sys.exit(0)
+    else:
+        print(f"Failed: {RED}{len(report.invalid) + len(report.dangling) + len(report.duplicates)}{NC}")
+        sys.exit(1)
@@ -5,15 +5,25 @@ Validates EPUB exports against post-mortem policies:
 - Gate 2: Start Page Invariant (first scene, not TOC)
 - Gate 3: Anchor Integrity (all links resolve, inline anchors present)
 - Gate 4: Kobo Compatibility (NCX, landmarks, inline anchors)
-- Gate 5: Manifest Compliance (art manifest integrity)
+- Gate 5: Manifest Compliance (art manifest integrity, with --art-manifest)
 - Gate 6: Header Hygiene (no operational markers)
 """
 
+import glob
+import hashlib
+import json
+import os
+import posixpath
 import re
+import sys
+import time
 import zipfile
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import unquote, urlsplit
 
 try:
     from lxml import etree
@@ -29,25 +39,490 @@ class ValidationResult:
     status: str  # "pass" | "warn" | "fail"
     message: str
     details: list[str]
+    data: dict = field(default_factory=dict)  # Machine-readable findings (e.g. broken_links)
+    wall_time: float = 0.0  # Seconds spent in the gate
+    documents: int = 0  # Files parsed or hashed by the gate
+    bytes_parsed: int = 0  # Uncompressed bytes of those files
+
+
+@dataclass
+class BrokenLink:
+    """A link whose target document or fragment does not exist."""
+    source: str  # Manifest href of the linking document
+    href: str  # Link as written
+    target: str  # Resolved zip member path of the target document
+    fragment: str  # Decoded fragment ("" for document links)
+    reason: str
+
+
+@dataclass
+class BookResult:
+    """Outcome of validating one EPUB in a batch."""
+    epub_path: Path
+    success: bool
+    results: list[ValidationResult]
+
+
+NAMESPACES = {
+    'opf': 'http://www.idpf.org/2007/opf',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'xhtml': 'http://www.w3.org/1999/xhtml',
+    'epub': 'http://www.idpf.org/2007/ops',
+    'ncx': 'http://www.daisy.org/z3986/2005/ncx/',
+}
+
+NCX_MEDIA_TYPE = "application/x-dtbncx+xml"
+
+_XHTML = '{http://www.w3.org/1999/xhtml}'
+_INLINE_ANCHOR_TAGS = frozenset({_XHTML + 'a', _XHTML + 'span'})
+_HEADING_TAGS = frozenset({_XHTML + 'h1', _XHTML + 'h2'})
+
+# Below this many XHTML documents a process pool costs more than it saves
+PARALLEL_MIN_DOCUMENTS = 64
+
+HASH_CHUNK_SIZE = 1 << 20
+COLD_ART_MANIFEST_ID = "https://questfoundry.liesdonk.nl/schemas/cold_art_manifest.schema.json"
+
+
+@dataclass
+class ManifestItem:
+    """An <item> from the OPF manifest."""
+    id: str
+    href: Optional[str]
+    media_type: str
+    properties: Optional[str]
+
+
+@dataclass
+class DocumentInfo:
+    """Everything the gates need from one XHTML document, captured in a single parse."""
+    href: str
+    ids: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)  # a/@href values, in document order
+    headings: list[str] = field(default_factory=list)  # h1/h2 text, in document order
+    inline_anchors: int = 0  # a or span elements with an id
+    sections: int = 0  # section or div.section elements
+    error: Optional[str] = None  # Parse error, if the document could not be read
+    size: int = 0  # Uncompressed bytes
+    parse_time: float = 0.0  # Seconds
+
+
+def parse_document(href: str, content: bytes) -> DocumentInfo:
+    """Parse one XHTML document and capture ids, links, headings and counts."""
+    info = DocumentInfo(href)
+    try:
+        tree = etree.fromstring(content)
+        info.ids = tree.xpath('//*/@id')
+        info.inline_anchors = len(tree.xpath('//xhtml:a[@id] | //xhtml:span[@id]', namespaces=NAMESPACES))
+        info.sections = len(tree.xpath('//xhtml:section | //xhtml:div[@class="section"]', namespaces=NAMESPACES))
+        info.links = [str(link) for link in tree.xpath('//xhtml:a/@href', namespaces=NAMESPACES)]
+        info.headings = [h.text or '' for h in tree.xpath('//xhtml:h2 | //xhtml:h1', namespaces=NAMESPACES)]
+    except Exception as e:
+        info.error = str(e)
+    return info
+
+
+def parse_document_stream(href: str, stream) -> DocumentInfo:
+    """
+    Low-memory variant of parse_document() reading from a file-like stream.
+
+    Uses iterparse and clears each element (and its already-processed
+    preceding siblings) as soon as its id, link and heading text have been
+    captured, so no full tree is ever built. Captures exactly what
+    parse_document() does.
+    """
+    info = DocumentInfo(href)
+    try:
+        for event, elem in etree.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                id_val = elem.get('id')
+                if id_val is not None:
+                    info.ids.append(id_val)
+                    if elem.tag in _INLINE_ANCHOR_TAGS:
+                        info.inline_anchors += 1
+                if elem.tag == _XHTML + 'section' or (elem.tag == _XHTML + 'div' and elem.get('class') == 'section'):
+                    info.sections += 1
+                if elem.tag == _XHTML + 'a':
+                    link = elem.get('href')
+                    if link is not None:
+                        info.links.append(link)
+                continue
+
+            # Text is only complete at the end event
+            if elem.tag in _HEADING_TAGS:
+                info.headings.append(elem.text or '')
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+    except Exception as e:
+        info = DocumentInfo(href, error=str(e))
+    return info
+
+
+def _summarize_member(epub: zipfile.ZipFile, href: str, member: str, low_memory: bool) -> DocumentInfo:
+    start = time.perf_counter()
+    if low_memory:
+        with epub.open(member) as stream:
+            info = parse_document_stream(href, stream)
+    else:
+        info = parse_document(href, epub.read(member))
+    info.size = epub.getinfo(member).file_size
+    info.parse_time = time.perf_counter() - start
+    return info
+
+
+@dataclass
+class ArtAsset:
+    """An asset entry from an art_manifest or cold_art_manifest, normalized."""
+    label: str  # id (art_manifest) or anchor (cold_art_manifest)
+    filename: str
+    sha256: Optional[str]
+    size_bytes: Optional[int] = None  # cold_art_manifest only
+    caption: Optional[str] = None  # art_manifest only
+    needs_caption: bool = False
+
+
+def load_art_manifest(manifest_path: Path) -> tuple[str, list[ArtAsset], dict]:
+    """
+    Load an art manifest and normalize its assets.
+
+    Accepts both 03-schemas/art_manifest.schema.json (Art Director's
+    inventory) and cold_art_manifest.schema.json (Cold SoT asset hashes).
+
+    Returns:
+        Tuple of (schema_name, assets, raw_data)
+
+    Raises:
+        OSError, json.JSONDecodeError: If the file cannot be read or parsed
+    """
+    with open(manifest_path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    cold = isinstance(data, dict) and (
+        data.get("$schema") == COLD_ART_MANIFEST_ID or
+        ("version" in data and "manifest_version" not in data)
+    )
+    assets = []
+    entries = data.get("assets", []) if isinstance(data, dict) else []
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("filename"), str):
+            continue
+        if cold:
+            assets.append(ArtAsset(
+                str(entry.get("anchor", "")), entry["filename"], entry.get("sha256"),
+                size_bytes=entry.get("size_bytes"),
+            ))
+        else:
+            assets.append(ArtAsset(
+                str(entry.get("id", "")), entry["filename"], entry.get("sha256"),
+                caption=entry.get("caption"), needs_caption=True,
+            ))
+    return ("cold_art_manifest" if cold else "art_manifest"), assets, data
+
+
+def member_sha256(epub: zipfile.ZipFile, name: str) -> str:
+    """SHA-256 of a zip member, streamed so large assets are never held in memory."""
+    sha256_hash = hashlib.sha256()
+    with epub.open(name) as stream:
+        for block in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+            sha256_hash.update(block)
+    return sha256_hash.hexdigest()
+
+
+def resolve_link(source: str, link: str) -> Optional[tuple[str, str]]:
+    """
+    Resolve a link against the zip member path of the document containing it.
+
+    Relative segments (../, ./) are collapsed and percent-encoding is decoded
+    in both the path and the fragment.
+
+    Returns:
+        (target member path, fragment) or None for external links (any URL
+        with a scheme or host, e.g. http:, mailto:)
+    """
+    parts = urlsplit(link)
+    if parts.scheme or parts.netloc:
+        return None
+    fragment = unquote(parts.fragment)
+    if not parts.path:
+        return source, fragment
+    path = posixpath.normpath(posixpath.join(posixpath.dirname(source), unquote(parts.path)))
+    return path, fragment
+
+
+def _parse_document_chunk(
+    epub_path: str, low_memory: bool, members: list[tuple[str, str]]
+) -> list[DocumentInfo]:
+    """Worker: parse (href, member_path) documents from an EPUB opened in this process."""
+    with zipfile.ZipFile(epub_path, 'r') as epub:
+        return [_summarize_member(epub, href, member, low_memory) for href, member in members]
+
+
+class ParsedEPUB:
+    """
+    An EPUB container parsed once and shared by every gate.
+
+    container.xml and the OPF are parsed on construction; the NCX, nav.xhtml
+    and XHTML documents are parsed on first access and cached, so a malformed
+    file is reported by the first gate that needs it.
+
+    With jobs > 1, XHTML documents are parsed in a process pool; each worker
+    reopens the EPUB and returns only the per-document DocumentInfo. With
+    low_memory=True, XHTML documents are streamed from the zip through
+    iterparse instead of being read and parsed whole.
+    """
+
+    def __init__(self, epub: zipfile.ZipFile, jobs: int = 1, low_memory: bool = False):
+        self.epub = epub
+        self.jobs = jobs
+        self.low_memory = low_memory
+        self.documents_parsed = 0  # Running totals, read by the gate registry for timing
+        self.bytes_parsed = 0
+        self.names = set(epub.namelist())
+        self.opf_path = self._find_opf(epub)
+        self.opf_dir = Path(".")
+        self.opf_tree = None
+        self.manifest_items: list[ManifestItem] = []  # In manifest order
+        self.manifest: dict[str, ManifestItem] = {}  # id -> item (first wins)
+        self.spine: list[str] = []  # itemref idrefs, in reading order
+        self.cover_id: Optional[str] = None
+        self.guide_references = 0
+
+        if self.opf_path is None:
+            return
+
+        self.opf_dir = Path(self.opf_path).parent
+        self.opf_tree = etree.fromstring(self._read_member(self.opf_path))
+
+        for item in self.opf_tree.xpath('//opf:manifest/opf:item', namespaces=NAMESPACES):
+            manifest_item = ManifestItem(
+                item.get('id'), item.get('href'), item.get('media-type', ''), item.get('properties')
+            )
+            self.manifest_items.append(manifest_item)
+            if manifest_item.id is not None:
+                self.manifest.setdefault(manifest_item.id, manifest_item)
+
+        self.spine = [str(idref) for idref in self.opf_tree.xpath(
+            '//opf:spine/opf:itemref/@idref', namespaces=NAMESPACES
+        )]
+        cover_id = self.opf_tree.xpath(
+            '//opf:metadata/opf:meta[@name="cover"]/@content', namespaces=NAMESPACES
+        )
+        self.cover_id = str(cover_id[0]) if cover_id else None
+        self.guide_references = len(self.opf_tree.xpath('//opf:guide/opf:reference', namespaces=NAMESPACES))
+
+    def member_path(self, href: str) -> str:
+        """Resolve a manifest href to its zip member name."""
+        return str(self.opf_dir / href)
+
+    def document_key(self, href: str) -> str:
+        """Normalized zip member path for a manifest href (decoded, ../ resolved)."""
+        return posixpath.normpath(posixpath.join(posixpath.dirname(self.opf_path or ""), unquote(href)))
+
+    @cached_property
+    def manifest_paths(self) -> set[str]:
+        """Normalized member paths of every manifest item."""
+        return {self.document_key(item.href) for item in self.manifest_items if item.href is not None}
+
+    def count(self, documents: int, size: int) -> None:
+        """Record files parsed (or hashed) for per-gate instrumentation."""
+        self.documents_parsed += documents
+        self.bytes_parsed += size
+
+    def _read_member(self, name: str) -> bytes:
+        content = self.epub.read(name)
+        self.count(1, len(content))
+        return content
+
+    def _read_tree(self, href: Optional[str]):
+        if href is None:
+            return None
+        path = self.member_path(href)
+        if path not in self.names:
+            return None
+        return etree.fromstring(self._read_member(path))
+
+    @cached_property
+    def xhtml_hrefs(self) -> list[str]:
+        """Hrefs of manifest items with an XHTML media type, in manifest order."""
+        return [item.href for item in self.manifest_items
+                if 'xhtml' in item.media_type and item.href is not None]
+
+    @cached_property
+    def ncx_item(self) -> Optional[ManifestItem]:
+        """First manifest item with the NCX media type."""
+        return next((item for item in self.manifest_items if item.media_type == NCX_MEDIA_TYPE), None)
+
+    @cached_property
+    def ncx_tree(self):
+        """Parsed NCX, or None if absent from the manifest or the container."""
+        return self._read_tree(self.ncx_item.href) if self.ncx_item is not None else None
+
+    @cached_property
+    def nav_item(self) -> Optional[ManifestItem]:
+        """First manifest item with properties="nav"."""
+        return next((item for item in self.manifest_items if item.properties == "nav"), None)
+
+    @cached_property
+    def nav_tree(self):
+        """Parsed nav.xhtml, or None if absent from the manifest or the container."""
+        return self._read_tree(self.nav_item.href) if self.nav_item is not None else None
+
+    @cached_property
+    def documents(self) -> list[DocumentInfo]:
+        """One DocumentInfo per XHTML manifest item present in the container, in manifest order."""
+        members = [(href, self.member_path(href)) for href in self.xhtml_hrefs]
+        members = [(href, member) for href, member in members if member in self.names]
+
+        if self.jobs <= 1 or len(members) < PARALLEL_MIN_DOCUMENTS or not self.epub.filename:
+            documents = [_summarize_member(self.epub, href, member, self.low_memory) for href, member in members]
+        else:
+            # Imported here so the single-process path does not load jsonschema
+            from .instance_validator import _map_ordered
+            chunk = partial(_parse_document_chunk, self.epub.filename, self.low_memory)
+            documents = list(_map_ordered(chunk, members, self.jobs))
+
+        self.count(len(documents), sum(doc.size for doc in documents))
+        return documents
+
+    @cached_property
+    def ids(self) -> dict[str, set[str]]:
+        """Normalized document member path -> ids defined in that document (parsed documents only)."""
+        index: dict[str, set[str]] = {}
+        for doc in self.documents:
+            if doc.error is not None:
+                continue
+            index.setdefault(self.document_key(doc.href), set()).update(doc.ids)
+        return index
+
+    def _find_opf(self, epub: zipfile.ZipFile) -> Optional[str]:
+        """Find content.opf path in EPUB."""
+        # Check META-INF/container.xml
+        try:
+            container_content = epub.read('META-INF/container.xml')
+            self.count(1, len(container_content))
+            container_tree = etree.fromstring(container_content)
+
+            rootfile = container_tree.xpath(
+                '//container:rootfile/@full-path',
+                namespaces={'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
+            )
+
+            if rootfile:
+                return rootfile[0]
+        except Exception:
+            # Silently fall back to searching for content.opf if container.xml is malformed or missing
+            pass
+
+        # Fallback: search for content.opf
+        for name in epub.namelist():
+            if name.endswith('content.opf'):
+                return name
+
+        return None
+
+
+@dataclass(frozen=True)
+class Gate:
+    """A registered validation gate."""
+    key: str  # Gate number, e.g. "3"
+    name: str  # Short name for --gates/--skip-gates, e.g. "anchors"
+    run: Callable[["EPUBValidator", ParsedEPUB], None]  # Appends ValidationResult(s)
+    requires: Optional[str] = None  # EPUBValidator attribute that must be set (e.g. "art_manifest")
+
+
+# Gates in run order; EPUBValidator registers 1-6 below
+GATES: dict[str, Gate] = {}
+
+
+def register_gate(key: str, name: str, requires: Optional[str] = None):
+    """
+    Register a gate function; it is called as run(validator, parsed) and
+    appends its ValidationResult(s) to validator.results.
+
+    Gates run in registration order. Re-registering a key replaces the gate.
+    """
+    def decorator(func):
+        GATES[key] = Gate(key, name, func, requires)
+        return func
+    return decorator
+
+
+def resolve_gates(selection: Iterable[str]) -> list[str]:
+    """
+    Resolve gate numbers or names (e.g. ["1", "anchors"]) to registry keys.
+
+    Raises:
+        ValueError: If a selector matches no registered gate
+    """
+    by_name = {gate.name: key for key, gate in GATES.items()}
+    keys = []
+    for selector in selection:
+        selector = selector.strip()
+        if not selector:
+            continue
+        key = selector if selector in GATES else by_name.get(selector.lower())
+        if key is None:
+            known = ", ".join(f"{gate.key}={gate.name}" for gate in GATES.values())
+            raise ValueError(f"Unknown gate '{selector}' (known: {known})")
+        keys.append(key)
+    return keys
 
 
 class EPUBValidator:
     """Validates EPUB files against QuestFoundry quality gates."""
 
-    NAMESPACES = {
-        'opf': 'http://www.idpf.org/2007/opf',
-        'dc': 'http://purl.org/dc/elements/1.1/',
-        'xhtml': 'http://www.w3.org/1999/xhtml',
-        'epub': 'http://www.idpf.org/2007/ops',
-        'ncx': 'http://www.daisy.org/z3986/2005/ncx/',
-    }
-
-    def __init__(self, epub_path: Path):
+    NAMESPACES = NAMESPACES
+
+    def __init__(
+        self,
+        epub_path: Path,
+        art_manifest: Optional[Path] = None,
+        use_cache: bool = True,
+        gates: Optional[Iterable[str]] = None,
+        skip_gates: Iterable[str] = (),
+    ):
+        """
+        Args:
+            epub_path: EPUB file to validate
+            art_manifest: art_manifest / cold_art_manifest JSON; enables Gate 5
+            use_cache: Reuse asset digests from .qfspec-cache in Gate 5
+            gates: Gate numbers or names to run (default: every gate whose
+                requirements are met)
+            skip_gates: Gate numbers or names to leave out
+
+        Raises:
+            ValueError: If a gate selector is unknown, or a selected gate's
+                requirement (e.g. art_manifest for Gate 5) is missing
+        """
         self.epub_path = epub_path
+        self.art_manifest = art_manifest
+        self.use_cache = use_cache
         self.results: list[ValidationResult] = []
 
-    def validate(self) -> tuple[bool, list[ValidationResult]]:
-        """Run all validation gates. Returns (success, results)."""
+        selected = resolve_gates(gates) if gates is not None else None
+        skipped = set(resolve_gates(skip_gates))
+        self.gates = []
+        for key, gate in GATES.items():
+            if key in skipped or (selected is not None and key not in selected):
+                continue
+            if gate.requires and getattr(self, gate.requires) is None:
+                if selected is not None:
+                    raise ValueError(f"Gate {key} ({gate.name}) requires --{gate.requires.replace('_', '-')}")
+                continue
+            self.gates.append(gate)
+
+    def validate(self, jobs: int = 1, low_memory: bool = False) -> tuple[bool, list[ValidationResult]]:
+        """
+        Run all validation gates. Returns (success, results).
+
+        Args:
+            jobs: Worker processes for per-document parsing (1 parses in-process)
+            low_memory: Stream XHTML documents through iterparse instead of
+                building full trees (bounded memory for very large books)
+        """
         if not self.epub_path.exists():
             return False, [ValidationResult(
                 "File Check",
@@ -66,12 +541,11 @@ class EPUBValidator:
 
         try:
             with zipfile.ZipFile(self.epub_path, 'r') as epub:
-                self._gate_1_cover_policy(epub)
-                self._gate_2_start_page(epub)
-                self._gate_3_anchor_integrity(epub)
-                self._gate_4_kobo_compat(epub)
-                # self._gate_5_manifest_compliance(epub)  # Requires art_manifest.json access
-                self._gate_6_header_hygiene(epub)
+                # Opening the EPUB (container.xml, OPF) is charged to the first gate
+                mark = (time.perf_counter(), 0, 0)
+                parsed = ParsedEPUB(epub, jobs=jobs, low_memory=low_memory)
+                for gate in self.gates:
+                    mark = self._run_gate(gate, parsed, mark)
         except Exception as e:
             self.results.append(ValidationResult(
                 "EPUB Parsing",
@@ -85,13 +559,43 @@ class EPUBValidator:
         has_failures = any(r.status == "fail" for r in self.results)
         return not has_failures, self.results
 
-    def _gate_1_cover_policy(self, epub: zipfile.ZipFile):
+    def _run_gate(self, gate: Gate, parsed: ParsedEPUB, mark: tuple[float, int, int]) -> tuple[float, int, int]:
+        """
+        Run one gate and record wall time, documents and bytes on its last result.
+
+        Args:
+            mark: (time, documents, bytes) at the end of the previous gate
+
+        Returns:
+            The mark to pass to the next gate
+        """
+        start, documents_before, bytes_before = mark
+        first_result = len(self.results)
+        had_documents = 'documents' in parsed.__dict__
+
+        gate.run(self, parsed)
+
+        end = time.perf_counter()
+        if len(self.results) > first_result:
+            result = self.results[-1]
+            result.wall_time = end - start
+            result.documents = parsed.documents_parsed - documents_before
+            result.bytes_parsed = parsed.bytes_parsed - bytes_before
+            if not had_documents and 'documents' in parsed.__dict__:
+                # This gate triggered XHTML parsing: name the slowest documents
+                slowest = sorted(parsed.documents, key=lambda doc: doc.parse_time, reverse=True)[:10]
+                result.data["slowest_documents"] = [
+                    {"href": doc.href, "bytes": doc.size, "seconds": round(doc.parse_time, 6)}
+                    for doc in slowest
+                ]
+        return end, parsed.documents_parsed, parsed.bytes_parsed
+
+    @register_gate("1", "cover")
+    def _gate_1_cover_policy(self, parsed: ParsedEPUB):
         """Gate 1: Cover Policy - title-bearing PNG required."""
         details = []
 
-        # Read content.opf
-        opf_path = self._find_opf(epub)
-        if not opf_path:
+        if not parsed.opf_path:
             self.results.append(ValidationResult(
                 "Gate 1: Cover Policy",
                 "fail",
@@ -100,14 +604,8 @@ class EPUBValidator:
             ))
             return
 
-        opf_content = epub.read(opf_path)
-        opf_tree = etree.fromstring(opf_content)
-
         # Find cover meta
-        cover_id = opf_tree.xpath(
-            '//opf:metadata/opf:meta[@name="cover"]/@content',
-            namespaces=self.NAMESPACES
-        )
+        cover_id = parsed.cover_id
 
         if not cover_id:
             self.results.append(ValidationResult(
@@ -119,22 +617,19 @@ class EPUBValidator:
             return
 
         # Find cover item in manifest
-        cover_item = opf_tree.xpath(
-            f'//opf:manifest/opf:item[@id="{cover_id[0]}"]',
-            namespaces=self.NAMESPACES
-        )
+        cover_item = parsed.manifest.get(cover_id)
 
-        if not cover_item:
+        if cover_item is None:
             self.results.append(ValidationResult(
                 "Gate 1: Cover Policy",
                 "fail",
-                f"Cover item '{cover_id[0]}' not found in manifest",
+                f"Cover item '{cover_id}' not found in manifest",
                 []
             ))
             return
 
-        media_type = cover_item[0].get('media-type', '')
-        href = cover_item[0].get('href', '')
+        media_type = cover_item.media_type
+        href = cover_item.href or ''
 
         # Check if PNG
         if 'png' not in media_type.lower() and not href.lower().endswith('.png'):
@@ -149,11 +644,7 @@ class EPUBValidator:
             details.append("✓ Cover is PNG format")
 
         # Check for SVG backup
-        svg_backup = opf_tree.xpath(
-            '//opf:manifest/opf:item[contains(@media-type, "svg")]',
-            namespaces=self.NAMESPACES
-        )
-        if svg_backup:
+        if any('svg' in item.media_type for item in parsed.manifest_items):
             details.append("✓ SVG backup cover found")
 
         self.results.append(ValidationResult(
@@ -163,24 +654,15 @@ class EPUBValidator:
             details
         ))
 
-    def _gate_2_start_page(self, epub: zipfile.ZipFile):
+    @register_gate("2", "start")
+    def _gate_2_start_page(self, parsed: ParsedEPUB):
         """Gate 2: Start Page Invariant - reading order begins at first scene."""
         details = []
 
-        opf_path = self._find_opf(epub)
-        if not opf_path:
+        if not parsed.opf_path:
             return
 
-        opf_content = epub.read(opf_path)
-        opf_tree = etree.fromstring(opf_content)
-
-        # Get first itemref in spine
-        first_itemref = opf_tree.xpath(
-            '//opf:spine/opf:itemref[1]/@idref',
-            namespaces=self.NAMESPACES
-        )
-
-        if not first_itemref:
+        if not parsed.spine:
             self.results.append(ValidationResult(
                 "Gate 2: Start Page",
                 "fail",
@@ -190,13 +672,11 @@ class EPUBValidator:
             return
 
         # Find corresponding manifest item
-        first_item = opf_tree.xpath(
-            f'//opf:manifest/opf:item[@id="{first_itemref[0]}"]/@href',
-            namespaces=self.NAMESPACES
-        )
+        first_itemref = parsed.spine[0]
+        first_item = parsed.manifest.get(first_itemref)
 
-        if first_item:
-            href = first_item[0]
+        if first_item is not None and first_item.href is not None:
+            href = first_item.href
             details.append(f"First spine item: {href}")
 
             # Check if it matches scene pattern (e.g., 001.xhtml, section-*.xhtml)
@@ -210,7 +690,7 @@ class EPUBValidator:
                 message = "First spine item should be a scene section (e.g., 001.xhtml)"
         else:
             status = "fail"
-            message = f"First spine item '{first_itemref[0]}' not found in manifest"
+            message = f"First spine item '{first_itemref}' not found in manifest"
 
         self.results.append(ValidationResult(
             "Gate 2: Start Page",
@@ -219,92 +699,63 @@ class EPUBValidator:
             details
         ))
 
-    def _gate_3_anchor_integrity(self, epub: zipfile.ZipFile):
+    @register_gate("3", "anchors")
+    def _gate_3_anchor_integrity(self, parsed: ParsedEPUB):
         """Gate 3: Anchor Integrity - all links resolve, inline anchors present."""
         details = []
-        anchors_found = set()
-        links_found = []
+        broken_links: list[BrokenLink] = []
+        link_count = 0
         inline_anchor_count = 0
         section_count = 0
 
-        opf_path = self._find_opf(epub)
-        if not opf_path:
+        if not parsed.opf_path:
             return
 
-        # Get all XHTML files from manifest
-        opf_content = epub.read(opf_path)
-        opf_tree = etree.fromstring(opf_content)
-
-        xhtml_items = opf_tree.xpath(
-            '//opf:manifest/opf:item[contains(@media-type, "xhtml")]/@href',
-            namespaces=self.NAMESPACES
-        )
-
-        opf_dir = Path(opf_path).parent
+        # (document, fragment) index: member path -> ids, one O(1) lookup per link
+        anchor_index = parsed.ids
+        manifest_paths = parsed.manifest_paths
 
-        for href in xhtml_items:
-            file_path = str(opf_dir / href)
-            if file_path not in epub.namelist():
+        for doc in parsed.documents:
+            if doc.error is not None:
+                details.append(f"⚠ Error parsing {doc.href}: {doc.error}")
                 continue
 
-            try:
-                xhtml_content = epub.read(file_path)
-                xhtml_tree = etree.fromstring(xhtml_content)
-
-                # Find all elements with id attribute
-                ids = xhtml_tree.xpath('//*/@id')
-                for id_val in ids:
-                    anchors_found.add(f"{href}#{id_val}")
-
-                # Count inline anchors (a or span with id)
-                inline_anchors = xhtml_tree.xpath(
-                    '//xhtml:a[@id] | //xhtml:span[@id]',
-                    namespaces=self.NAMESPACES
-                )
-                inline_anchor_count += len(inline_anchors)
-
-                # Count sections
-                sections = xhtml_tree.xpath(
-                    '//xhtml:section | //xhtml:div[@class="section"]',
-                    namespaces=self.NAMESPACES
-                )
-                section_count += len(sections)
-
-                # Find all links
-                links = xhtml_tree.xpath('//xhtml:a/@href', namespaces=self.NAMESPACES)
-                for link in links:
-                    if '#' in link:
-                        links_found.append((href, link))
-            except Exception as e:
-                details.append(f"⚠ Error parsing {href}: {e}")
-
-        # Validate links
-        broken_links = []
-        for source_file, link in links_found:
-            if link.startswith('#'):
-                # Same-file anchor
-                target = f"{source_file}{link}"
-            elif '#' in link:
-                # Cross-file anchor
-                target_file, anchor = link.split('#', 1)
-                target = f"{target_file}#{anchor}"
-            else:
-                continue  # External link, skip
-
-            if target not in anchors_found:
-                broken_links.append(f"{source_file} → {link}")
+            inline_anchor_count += doc.inline_anchors
+            section_count += doc.sections
+            source = parsed.document_key(doc.href)
+
+            for link in doc.links:
+                resolved = resolve_link(source, link)
+                if resolved is None:
+                    continue  # External link, skip
+                link_count += 1
+                target, fragment = resolved
+
+                if target not in manifest_paths:
+                    reason = "document not in manifest"
+                elif target not in parsed.names:
+                    reason = "document missing from EPUB"
+                elif fragment and target in anchor_index and fragment not in anchor_index[target]:
+                    reason = "anchor not found"
+                else:
+                    continue
+                broken_links.append(BrokenLink(doc.href, link, target, fragment, reason))
 
-        details.append(f"Total anchors: {len(anchors_found)}")
-        details.append(f"Total links: {len(links_found)}")
+        details.append(f"Total anchors: {sum(len(ids) for ids in anchor_index.values())}")
+        details.append(f"Total links: {link_count}")
         details.append(f"Inline anchors: {inline_anchor_count}")
         details.append(f"Sections: {section_count}")
 
         if broken_links:
+            shown = [f"Broken: {b.source} → {b.href} ({b.reason})" for b in broken_links[:10]]
+            if len(broken_links) > 10:
+                shown.append(f"... and {len(broken_links) - 10} more (use --json for the full list)")
             self.results.append(ValidationResult(
                 "Gate 3: Anchor Integrity",
                 "fail",
                 f"{len(broken_links)} broken link(s) found",
-                details + [f"Broken: {link}" for link in broken_links[:10]]  # First 10
+                details + shown,
+                {"broken_links": [asdict(b) for b in broken_links]}
             ))
         else:
             details.append("✓ All links resolve")
@@ -317,38 +768,25 @@ class EPUBValidator:
                 "Gate 3: Anchor Integrity",
                 "pass",
                 "All links resolve",
-                details
+                details,
+                {"broken_links": []}
             ))
 
-    def _gate_4_kobo_compat(self, epub: zipfile.ZipFile):
+    @register_gate("4", "kobo")
+    def _gate_4_kobo_compat(self, parsed: ParsedEPUB):
         """Gate 4: Kobo Compatibility - NCX, landmarks, inline anchors."""
         details = []
 
-        opf_path = self._find_opf(epub)
-        if not opf_path:
+        if not parsed.opf_path:
             return
 
-        opf_content = epub.read(opf_path)
-        opf_tree = etree.fromstring(opf_content)
-
         # Check for NCX in manifest
-        ncx_items = opf_tree.xpath(
-            '//opf:manifest/opf:item[@media-type="application/x-dtbncx+xml"]',
-            namespaces=self.NAMESPACES
-        )
-
-        if ncx_items:
+        if parsed.ncx_item is not None:
             details.append("✓ toc.ncx present in manifest")
 
             # Verify NCX file exists and has content
-            ncx_href = ncx_items[0].get('href')
-            opf_dir = Path(opf_path).parent
-            ncx_path = str(opf_dir / ncx_href)
-
-            if ncx_path in epub.namelist():
-                ncx_content = epub.read(ncx_path)
-                ncx_tree = etree.fromstring(ncx_content)
-
+            ncx_tree = parsed.ncx_tree
+            if ncx_tree is not None:
                 nav_points = ncx_tree.xpath('//ncx:navPoint', namespaces=self.NAMESPACES)
                 details.append(f"  NCX nav points: {len(nav_points)}")
 
@@ -364,45 +802,33 @@ class EPUBValidator:
             details.append("✗ toc.ncx missing (Kobo devices may have navigation issues)")
 
         # Check for landmarks in nav.xhtml
-        nav_items = opf_tree.xpath(
-            '//opf:manifest/opf:item[@properties="nav"]/@href',
-            namespaces=self.NAMESPACES
-        )
-
-        if nav_items:
-            opf_dir = Path(opf_path).parent
-            nav_path = str(opf_dir / nav_items[0])
+        nav_tree = parsed.nav_tree
+        if nav_tree is not None:
+            landmarks = nav_tree.xpath(
+                '//xhtml:nav[@epub:type="landmarks"]',
+                namespaces=self.NAMESPACES
+            )
 
-            if nav_path in epub.namelist():
-                nav_content = epub.read(nav_path)
-                nav_tree = etree.fromstring(nav_content)
+            if landmarks:
+                details.append("✓ ARIA landmarks present in nav.xhtml")
 
-                landmarks = nav_tree.xpath(
-                    '//xhtml:nav[@epub:type="landmarks"]',
+                # Count landmark types
+                landmark_types = nav_tree.xpath(
+                    '//xhtml:nav[@epub:type="landmarks"]//xhtml:a/@epub:type',
                     namespaces=self.NAMESPACES
                 )
-
-                if landmarks:
-                    details.append("✓ ARIA landmarks present in nav.xhtml")
-
-                    # Count landmark types
-                    landmark_types = nav_tree.xpath(
-                        '//xhtml:nav[@epub:type="landmarks"]//xhtml:a/@epub:type',
-                        namespaces=self.NAMESPACES
-                    )
-                    details.append(f"  Landmark types: {', '.join(landmark_types)}")
-                else:
-                    details.append("⚠ ARIA landmarks missing from nav.xhtml")
+                details.append(f"  Landmark types: {', '.join(landmark_types)}")
+            else:
+                details.append("⚠ ARIA landmarks missing from nav.xhtml")
 
         # Check for EPUB2 guide
-        guide = opf_tree.xpath('//opf:guide/opf:reference', namespaces=self.NAMESPACES)
-        if guide:
-            details.append(f"✓ EPUB2 guide present ({len(guide)} references)")
+        if parsed.guide_references:
+            details.append(f"✓ EPUB2 guide present ({parsed.guide_references} references)")
         else:
             details.append("  (Optional) EPUB2 guide not present")
 
         # Overall status
-        has_ncx = bool(ncx_items)
+        has_ncx = parsed.ncx_item is not None
         if has_ncx:
             status = "pass"
             message = "Kobo compatibility features present"
@@ -417,7 +843,162 @@ class EPUBValidator:
             details
         ))
 
-    def _gate_6_header_hygiene(self, epub: zipfile.ZipFile):
+    @register_gate("5", "art", requires="art_manifest")
+    def _gate_5_manifest_compliance(self, parsed: ParsedEPUB):
+        """Gate 5: Manifest Compliance - every image listed, hashed and captioned."""
+        details = []
+        violations = []
+        warnings = []
+
+        if not parsed.opf_path:
+            return
+
+        try:
+            schema_name, assets, data = load_art_manifest(self.art_manifest)
+        except (OSError, json.JSONDecodeError) as e:
+            self.results.append(ValidationResult(
+                "Gate 5: Manifest Compliance",
+                "fail",
+                f"Cannot read art manifest {self.art_manifest}: {e}",
+                []
+            ))
+            return
+
+        details.append(f"Art manifest: {self.art_manifest} ({schema_name}, {len(assets)} assets)")
+        schema_error = self._check_art_manifest_schema(schema_name, data)
+        if schema_error:
+            violations.append(f"{self.art_manifest.name}: {schema_error}")
+
+        # EPUB images by filename; manifest filenames are bare names
+        images: dict[str, list[str]] = {}
+        for item in parsed.manifest_items:
+            if item.href is not None and item.media_type.startswith('image/'):
+                member = parsed.document_key(item.href)
+                images.setdefault(posixpath.basename(member), []).append(member)
+        assets_by_filename = {asset.filename: asset for asset in assets}
+        details.append(f"EPUB images: {sum(len(members) for members in images.values())}")
+
+        for filename in images:
+            if filename not in assets_by_filename:
+                violations.append(f"{filename}: not in art manifest")
+
+        to_hash: list[tuple[ArtAsset, str]] = []
+        for asset in assets:
+            for member in images.get(asset.filename, []):
+                if member not in parsed.names:
+                    violations.append(f"{asset.filename}: listed in OPF but missing from EPUB")
+                    continue
+                if not asset.sha256:
+                    violations.append(f"{asset.filename}: no sha256 in art manifest")
+                    continue
+                size = parsed.epub.getinfo(member).file_size
+                if asset.size_bytes is not None and asset.size_bytes != size:
+                    violations.append(f"{asset.filename}: size {size} != manifest size_bytes {asset.size_bytes}")
+                    continue
+                to_hash.append((asset, member))
+            if asset.needs_caption and asset.filename in images and not (asset.caption or '').strip():
+                warnings.append(f"{asset.filename}: caption missing")
+
+        missing = [asset.filename for asset in assets if asset.filename not in images]
+        if missing:
+            details.append(f"Manifest assets not in EPUB: {len(missing)}")
+
+        digests, cached = self._member_digests(parsed, [member for _, member in to_hash])
+        details.append(f"Hashed: {len(to_hash)} asset(s), {cached} from digest cache")
+        for asset, member in to_hash:
+            if digests[member] != asset.sha256.lower():
+                violations.append(f"{asset.filename}: sha256 mismatch (EPUB {digests[member][:12]}…, manifest {asset.sha256[:12]}…)")
+
+        data = {"violations": violations, "warnings": warnings}
+        if violations:
+            status = "fail"
+            message = f"{len(violations)} art manifest violation(s) found"
+        elif warnings:
+            status = "warn"
+            message = f"{len(warnings)} asset(s) missing captions"
+        else:
+            status = "pass"
+            message = "Art manifest validated"
+            details.append("✓ Every EPUB image is listed with a matching SHA-256")
+
+        if violations:
+            details += ["Violations:"] + violations[:10]
+            if len(violations) > 10:
+                details.append(f"... and {len(violations) - 10} more (use --json for the full list)")
+        if warnings:
+            details += ["Warnings:"] + warnings[:10]
+
+        self.results.append(ValidationResult(
+            "Gate 5: Manifest Compliance",
+            status,
+            message,
+            details,
+            data
+        ))
+
+    def _check_art_manifest_schema(self, schema_name: str, data: dict) -> Optional[str]:
+        """Validate the manifest against its Layer 3 schema, if the spec repository is available."""
+        from .cli import find_repo_root
+        from .instance_validator import find_schema_file, validate_instance_data
+
+        schema_path = find_schema_file(find_repo_root(), schema_name)
+        if schema_path is None:
+            return None
+        is_valid, error_msg = validate_instance_data(schema_path, data)
+        return None if is_valid else error_msg
+
+    def _member_digests(self, parsed: ParsedEPUB, members: list[str]) -> tuple[dict[str, str], int]:
+        """
+        SHA-256 of zip members, hashed concurrently in a thread pool.
+
+        Digests are cached under the EPUB file itself (resolved path, mtime,
+        size) and the member name, so re-validating an unchanged EPUB does
+        not decompress and hash its assets again. CRC-32 is not an integrity
+        check, so digests are never shared between EPUB files.
+
+        Returns:
+            Tuple of (member -> sha256, number served from the cache)
+        """
+        from .cli import find_repo_root
+        from .result_cache import open_result_cache
+
+        cache = open_result_cache(find_repo_root(), self.use_cache)
+        digests: dict[str, str] = {}
+        keys: dict[str, str] = {}
+        try:
+            if cache is not None:
+                try:
+                    stat = os.stat(self.epub_path)
+                    epub_id = f"{self.epub_path.resolve()}\0{stat.st_mtime_ns}\0{stat.st_size}"
+                except OSError:
+                    cache.close()
+                    cache = None
+            if cache is not None:
+                for member in members:
+                    info = parsed.epub.getinfo(member)
+                    member_id = hashlib.sha256(f"{epub_id}\0{member}".encode("utf-8")).hexdigest()
+                    keys[member] = cache.key(member_id, f"{info.CRC:08x}-{info.file_size}", kind="zip-member-sha256")
+                    hit = cache.get(keys[member])
+                    if hit is not None:
+                        digests[member] = hit[1]
+            cached = len(digests)
+
+            pending = list(dict.fromkeys(member for member in members if member not in digests))
+            if pending:
+                workers = min(len(pending), 32, (os.cpu_count() or 1) + 4)
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qfspec-hash") as pool:
+                    for member, digest in zip(pending, pool.map(partial(member_sha256, parsed.epub), pending)):
+                        digests[member] = digest
+                        parsed.count(1, parsed.epub.getinfo(member).file_size)
+                        if cache is not None:
+                            cache.put(keys[member], (True, digest))
+        finally:
+            if cache is not None:
+                cache.close()
+        return digests, cached
+
+    @register_gate("6", "headers")
+    def _gate_6_header_hygiene(self, parsed: ParsedEPUB):
         """Gate 6: Header Hygiene - no operational markers in section titles."""
         details = []
         violations = []
@@ -428,41 +1009,17 @@ class EPUBValidator:
             re.IGNORECASE
         )
 
-        opf_path = self._find_opf(epub)
-        if not opf_path:
+        if not parsed.opf_path:
             return
 
-        opf_content = epub.read(opf_path)
-        opf_tree = etree.fromstring(opf_content)
-
-        xhtml_items = opf_tree.xpath(
-            '//opf:manifest/opf:item[contains(@media-type, "xhtml")]/@href',
-            namespaces=self.NAMESPACES
-        )
-
-        opf_dir = Path(opf_path).parent
-
-        for href in xhtml_items:
-            file_path = str(opf_dir / href)
-            if file_path not in epub.namelist():
+        for doc in parsed.documents:
+            if doc.error is not None:
+                details.append(f"⚠ Error parsing {doc.href}: {doc.error}")
                 continue
 
-            try:
-                xhtml_content = epub.read(file_path)
-                xhtml_tree = etree.fromstring(xhtml_content)
-
-                # Find all h2 headings (section titles)
-                headings = xhtml_tree.xpath(
-                    '//xhtml:h2 | //xhtml:h1',
-                    namespaces=self.NAMESPACES
-                )
-
-                for heading in headings:
-                    text = heading.text or ''
-                    if marker_pattern.match(text):
-                        violations.append(f"{href}: {text}")
-            except Exception as e:
-                details.append(f"⚠ Error parsing {href}: {e}")
+            for text in doc.headings:
+                if marker_pattern.match(text):
+                    violations.append(f"{doc.href}: {text}")
 
         if violations:
             self.results.append(ValidationResult(
@@ -483,34 +1040,41 @@ class EPUBValidator:
                 details
             ))
 
-    def _find_opf(self, epub: zipfile.ZipFile) -> Optional[str]:
-        """Find content.opf path in EPUB."""
-        # Check META-INF/container.xml
-        try:
-            container_content = epub.read('META-INF/container.xml')
-            container_tree = etree.fromstring(container_content)
-
-            rootfile = container_tree.xpath(
-                '//container:rootfile/@full-path',
-                namespaces={'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
-            )
-
-            if rootfile:
-                return rootfile[0]
-        except Exception:
-            # Silently fall back to searching for content.opf if container.xml is malformed or missing
-            pass
-
-        # Fallback: search for content.opf
-        for name in epub.namelist():
-            if name.endswith('content.opf'):
-                return name
-
-        return None
 
+def format_timing(results: list[ValidationResult]) -> list[str]:
+    """Per-gate timing table (wall time, documents, bytes) plus the slowest documents."""
+    lines = ["Gate Timing:"]
+    lines.append(f"  {'Gate':<34} {'Time (ms)':>10} {'Docs':>7} {'Bytes':>14}")
+    for result in results:
+        lines.append(
+            f"  {result.gate_name:<34} {result.wall_time * 1000:>10.1f} "
+            f"{result.documents:>7} {result.bytes_parsed:>14,}"
+        )
+    lines.append(
+        f"  {'Total':<34} {sum(r.wall_time for r in results) * 1000:>10.1f} "
+        f"{sum(r.documents for r in results):>7} {sum(r.bytes_parsed for r in results):>14,}"
+    )
+
+    slowest = [doc for r in results for doc in r.data.get("slowest_documents", [])]
+    if slowest:
+        lines.append("  Slowest documents:")
+        for doc in slowest[:5]:
+            lines.append(f"    {doc['href']:<40} {doc['seconds'] * 1000:>8.1f} ms {doc['bytes']:>12,} bytes")
+    return lines
+
+
+def format_results(results: list[ValidationResult], timing: bool = False, as_json: bool = False) -> str:
+    """
+    Format validation results as human-readable report.
+
+    Args:
+        results: Gate results from EPUBValidator.validate()
+        timing: Append a per-gate timing table
+        as_json: Return the results (including timing fields) as JSON instead
+    """
+    if as_json:
+        return json.dumps([asdict(result) for result in results], indent=2, ensure_ascii=False)
 
-def format_results(results: list[ValidationResult]) -> str:
-    """Format validation results as human-readable report."""
     lines = []
     lines.append("=" * 70)
     lines.append("EPUB Validation Report")
@@ -527,6 +1091,10 @@ def format_results(results: list[ValidationResult]) -> str:
 
         lines.append("")
 
+    if timing:
+        lines.extend(format_timing(results))
+        lines.append("")
+
     # Summary
     passed = sum(1 for r in results if r.status == "pass")
     warned = sum(1 for r in results if r.status == "warn")
@@ -539,18 +1107,222 @@ def format_results(results: list[ValidationResult]) -> str:
     return "\n".join(lines)
 
 
+def expand_epub_paths(patterns: Iterable[str]) -> list[Path]:
+    """
+    Expand command-line arguments into EPUB paths.
+
+    Directories contribute every *.epub beneath them and glob patterns are
+    expanded (** recurses). A pattern that matches nothing is kept as a path
+    so it is reported as missing. Duplicates are dropped and order is kept.
+    """
+    paths: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(path.rglob("*.epub")))
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if matches:
+                paths.extend(Path(match) for match in matches)
+            else:
+                paths.append(path)
+        else:
+            paths.append(path)
+    return list(dict.fromkeys(paths))
+
+
+def _validate_book(
+    epub_path: Path,
+    jobs: int = 1,
+    low_memory: bool = False,
+    art_manifest: Optional[Path] = None,
+    use_cache: bool = True,
+    gates: Optional[list[str]] = None,
+    skip_gates: tuple[str, ...] = (),
+) -> BookResult:
+    validator = EPUBValidator(
+        epub_path, art_manifest=art_manifest, use_cache=use_cache, gates=gates, skip_gates=skip_gates,
+    )
+    success, results = validator.validate(jobs=jobs, low_memory=low_memory)
+    return BookResult(epub_path, success, results)
+
+
+def iter_validate_epubs(
+    epub_paths: list[Path],
+    jobs: int = 1,
+    fail_fast: bool = False,
+    low_memory: bool = False,
+    art_manifest: Optional[Path] = None,
+    use_cache: bool = True,
+    gates: Optional[list[str]] = None,
+    skip_gates: tuple[str, ...] = (),
+) -> Iterator[BookResult]:
+    """
+    Validate many EPUBs, yielding one BookResult per book in input order.
+
+    Args:
+        epub_paths: EPUB files to validate
+        jobs: Worker processes; books are spread across the pool (a single
+            book parses its documents in parallel instead)
+        fail_fast: Stop after the first book that fails; queued books are
+            cancelled and not yielded
+        low_memory: Stream XHTML documents (see EPUBValidator.validate)
+        art_manifest: Art manifest for Gate 5 (skipped when None)
+        use_cache: Reuse cached asset digests in Gate 5
+        gates, skip_gates: Gate selection (see EPUBValidator)
+    """
+    options = {
+        "low_memory": low_memory, "art_manifest": art_manifest, "use_cache": use_cache,
+        "gates": gates, "skip_gates": tuple(skip_gates),
+    }
+
+    if len(epub_paths) == 1:
+        yield _validate_book(epub_paths[0], jobs, **options)
+        return
+
+    if jobs <= 1:
+        for epub_path in epub_paths:
+            book = _validate_book(epub_path, **options)
+            yield book
+            if fail_fast and not book.success:
+                return
+        return
+
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(epub_paths)))
+    try:
+        futures = [pool.submit(_validate_book, epub_path, **options) for epub_path in epub_paths]
+        for future in futures:
+            book = future.result()
+            yield book
+            if fail_fast and not book.success:
+                return
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def format_batch_summary(books: list[BookResult], total: int) -> str:
+    """Format the aggregated summary for a multi-book run."""
+    passed = sum(1 for book in books if book.success)
+    failed = [book for book in books if not book.success]
+
+    lines = []
+    lines.append("=" * 70)
+    lines.append(f"Batch Summary: {len(books)} EPUB(s) validated, {passed} passed, {len(failed)} failed")
+    if len(books) < total:
+        lines.append(f"Stopped at first failure; {total - len(books)} EPUB(s) not validated")
+    for book in failed:
+        gates = ", ".join(r.gate_name for r in book.results if r.status == "fail")
+        lines.append(f"  ✗ {book.epub_path}: {gates}")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
+def format_json(books: list[BookResult], total: Optional[int] = None) -> str:
+    """
+    Format results for one or more EPUBs as JSON.
+
+    Every gate result carries its details plus machine-readable data, such as
+    Gate 3's complete broken_links list.
+    """
+    report = {
+        "success": all(book.success for book in books),
+        "total": len(books) if total is None else total,
+        "validated": len(books),
+        "epubs": [
+            {
+                "path": str(book.epub_path),
+                "success": book.success,
+                "gates": [asdict(result) for result in book.results],
+            }
+            for book in books
+        ],
+    }
+    return json.dumps(report, indent=2, ensure_ascii=False)
+
+
+def _pop_option(args: list[str], name: str) -> tuple[Optional[str], list[str]]:
+    """Remove `name VALUE` or `name=VALUE` from args, returning (value, remaining_args)."""
+    for i, arg in enumerate(args):
+        if arg == name:
+            if i + 1 >= len(args):
+                print(f"Error: {name} requires a value")
+                sys.exit(1)
+            return args[i + 1], args[:i] + args[i + 2:]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1], args[:i] + args[i + 1:]
+    return None, args
+
+
 def validate_epub_cli():
     """CLI entry point for EPUB validation."""
-    import sys
-
-    if len(sys.argv) < 2:
-        print("Usage: qfspec-validate-epub <path-to-epub>")
+    from .cli import parse_jobs_option
+
+    jobs, args = parse_jobs_option(sys.argv[1:])
+    fail_fast = "--fail-fast" in args
+    json_output = "--json" in args
+    low_memory = "--low-memory" in args
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg not in ("--fail-fast", "--json", "--low-memory", "--no-cache")]
+
+    art_manifest, args = _pop_option(args, "--art-manifest")
+    gates, args = _pop_option(args, "--gates")
+    skip_gates, args = _pop_option(args, "--skip-gates")
+    timing = "--timing" in args
+    args = [arg for arg in args if arg != "--timing"]
+
+    if len(args) < 1:
+        print("Usage: qfspec-validate-epub [--jobs N] [--fail-fast] [--json] [--low-memory] [--timing]")
+        print("                            [--gates LIST] [--skip-gates LIST] [--art-manifest FILE] [--no-cache]")
+        print("                            <epub-or-glob-or-dir> [...]")
+        print("")
+        print("Options:")
+        print("  --jobs N, -j N  Worker processes (default: CPU count)")
+        print("  --fail-fast     Stop at the first EPUB that fails")
+        print("  --json          Print a machine-readable JSON report instead of text")
+        print("  --low-memory    Stream XHTML documents instead of parsing them whole")
+        print("  --art-manifest FILE")
+        print("                  Run Gate 5 against an art_manifest / cold_art_manifest JSON")
+        print("  --no-cache      Re-hash every asset instead of reusing cached digests")
+        print("  --gates LIST    Run only these gates, by number or name (e.g. 1,3,6 or cover,anchors)")
+        print("  --skip-gates LIST")
+        print("                  Leave out these gates")
+        print("  --timing        Show per-gate wall time, documents and bytes parsed")
+        print("")
+        print("Gates: " + ", ".join(f"{gate.key}={gate.name}" for gate in GATES.values()))
         sys.exit(1)
 
-    epub_path = Path(sys.argv[1])
-    validator = EPUBValidator(epub_path)
-
-    success, results = validator.validate()
-    print(format_results(results))
+    gate_options = {
+        "gates": gates.split(",") if gates is not None else None,
+        "skip_gates": tuple(skip_gates.split(",")) if skip_gates is not None else (),
+    }
+    try:
+        # Fail on a bad selection once, up front, rather than once per book
+        EPUBValidator(Path(), art_manifest=Path(art_manifest) if art_manifest else None, **gate_options)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-    sys.exit(0 if success else 1)
+    epub_paths = expand_epub_paths(args)
+    batch = len(epub_paths) > 1
+
+    books = []
+    for book in iter_validate_epubs(
+        epub_paths, jobs=jobs, fail_fast=fail_fast, low_memory=low_memory,
+        art_manifest=Path(art_manifest) if art_manifest else None, use_cache=use_cache, **gate_options,
+    ):
+        books.append(book)
+        if json_output:
+            continue
+        if batch:
+            print(f"### {book.epub_path}")
+        print(format_results(book.results, timing=timing))
+        if batch:
+            print("")
+        sys.stdout.flush()
+
+    if json_output:
+        print(format_json(books, len(epub_paths)))
+    elif batch:
+        print(format_batch_summary(books, len(epub_paths)))
+
+    sys.exit(0 if all(book.success for book in books) else 1)
@@ -0,0 +1,273 @@
+"""
+Fast-path yes/no checkers compiled from QuestFoundry JSON schemas.
+
+The generic jsonschema validator walks the schema on every call and builds
+error objects even when the instance is valid. For the hot envelope routing
+path we compile the schema once into plain Python closures: required-key
+sets, precompiled regexes and frozenset enums (e.g. role_name, payload_type).
+
+A compiled checker only answers "valid or not". It is sound: it never
+accepts an instance that Draft202012Validator would reject. It may reject a
+few valid instances it cannot prove (e.g. uniqueItems over non-string
+items), so callers fall back to full jsonschema error collection whenever
+the fast path says no.
+
+Only the keyword subset used by the envelope schema (plus a few simple
+numeric/length keywords) is supported; any other keyword makes
+compile_fast_check() return None and the caller uses jsonschema alone.
+"""
+
+import re
+from typing import Callable, Optional
+
+Check = Callable[[object], bool]
+
+# Keywords with no assertion semantics under Draft202012Validator defaults
+# (format is annotation-only unless a format checker is configured)
+_ANNOTATIONS = frozenset({
+    "$schema", "$id", "$comment", "$defs", "title", "description",
+    "examples", "default", "deprecated", "readOnly", "writeOnly", "format",
+})
+
+
+class UnsupportedSchema(Exception):
+    """Raised when a schema uses a keyword the fast path cannot compile."""
+
+
+def _always(value: object) -> bool:
+    return True
+
+
+def _never(value: object) -> bool:
+    return False
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: object) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+_TYPE_CHECKS: dict[str, Check] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "number": _is_number,
+    "integer": _is_integer,
+}
+
+
+def _all_of(checks: list[Check]) -> Check:
+    if not checks:
+        return _always
+    if len(checks) == 1:
+        return checks[0]
+    checks = tuple(checks)
+
+    def check(value: object) -> bool:
+        for c in checks:
+            if not c(value):
+                return False
+        return True
+    return check
+
+
+class _Compiler:
+    def __init__(self, root: dict):
+        self._root = root
+        self._refs: dict[tuple[str, bool], Check] = {}
+
+    def compile(self, schema: object, exact: bool = False) -> Check:
+        """
+        Compile a (sub)schema.
+
+        With exact=True (used for `if` subschemas) the result must be exact,
+        not merely sound, so conservative checks are refused.
+        """
+        if schema is True:
+            return _always
+        if schema is False:
+            return _never
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"Schema must be an object or boolean: {schema!r}")
+
+        unknown = set(schema) - _ANNOTATIONS - _HANDLED
+        if unknown:
+            raise UnsupportedSchema(f"Unsupported keyword(s): {', '.join(sorted(unknown))}")
+
+        checks: list[Check] = []
+
+        if "$ref" in schema:
+            checks.append(self._ref(schema["$ref"], exact))
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            try:
+                type_checks = tuple(_TYPE_CHECKS[t] for t in types)
+            except (KeyError, TypeError):
+                raise UnsupportedSchema(f"Unsupported type: {schema['type']!r}")
+            checks.append(type_checks[0] if len(type_checks) == 1
+                          else lambda v: any(c(v) for c in type_checks))
+
+        if "const" in schema:
+            checks.append(self._const(schema["const"]))
+
+        if "enum" in schema:
+            values = schema["enum"]
+            if not isinstance(values, list) or not all(isinstance(e, str) for e in values):
+                raise UnsupportedSchema("Only string enums are supported")
+            allowed = frozenset(values)
+            checks.append(lambda v: isinstance(v, str) and v in allowed)
+
+        checks.extend(self._string_checks(schema))
+        checks.extend(self._number_checks(schema))
+        checks.extend(self._array_checks(schema, exact))
+        checks.extend(self._object_checks(schema, exact))
+
+        if "allOf" in schema:
+            checks.extend(self.compile(sub, exact) for sub in schema["allOf"])
+
+        if "if" in schema:
+            condition = self.compile(schema["if"], exact=True)
+            then_check = self.compile(schema["then"], exact) if "then" in schema else _always
+            else_check = self.compile(schema["else"], exact) if "else" in schema else _always
+            checks.append(lambda v: then_check(v) if condition(v) else else_check(v))
+
+        return _all_of(checks)
+
+    def _ref(self, ref: object, exact: bool) -> Check:
+        if not isinstance(ref, str) or not ref.startswith("#/$defs/"):
+            raise UnsupportedSchema(f"Only local $defs references are supported: {ref!r}")
+        key = (ref, exact)
+        if key not in self._refs:
+            name = ref[len("#/$defs/"):]
+            try:
+                target = self._root["$defs"][name]
+            except (KeyError, TypeError):
+                raise UnsupportedSchema(f"Unresolvable reference: {ref}")
+            # Forward cell so recursive definitions resolve to the finished checker
+            cell: list[Check] = []
+            self._refs[key] = lambda v: cell[0](v)
+            cell.append(self.compile(target, exact))
+            self._refs[key] = cell[0]
+        return self._refs[key]
+
+    @staticmethod
+    def _const(expected: object) -> Check:
+        if isinstance(expected, str):
+            return lambda v: isinstance(v, str) and v == expected
+        if isinstance(expected, bool) or expected is None:
+            return lambda v: v is expected
+        raise UnsupportedSchema(f"Unsupported const: {expected!r}")
+
+    @staticmethod
+    def _string_checks(schema: dict) -> list[Check]:
+        checks: list[Check] = []
+        if "pattern" in schema:
+            search = re.compile(schema["pattern"]).search
+            checks.append(lambda v: not isinstance(v, str) or search(v) is not None)
+        if "minLength" in schema:
+            min_length = schema["minLength"]
+            checks.append(lambda v: not isinstance(v, str) or len(v) >= min_length)
+        if "maxLength" in schema:
+            max_length = schema["maxLength"]
+            checks.append(lambda v: not isinstance(v, str) or len(v) <= max_length)
+        return checks
+
+    @staticmethod
+    def _number_checks(schema: dict) -> list[Check]:
+        checks: list[Check] = []
+        if "minimum" in schema:
+            minimum = schema["minimum"]
+            checks.append(lambda v: not _is_number(v) or v >= minimum)
+        if "maximum" in schema:
+            maximum = schema["maximum"]
+            checks.append(lambda v: not _is_number(v) or v <= maximum)
+        return checks
+
+    def _array_checks(self, schema: dict, exact: bool) -> list[Check]:
+        checks: list[Check] = []
+        if "items" in schema:
+            item_check = self.compile(schema["items"], exact)
+            checks.append(lambda v: not isinstance(v, list) or all(item_check(i) for i in v))
+        if "minItems" in schema:
+            min_items = schema["minItems"]
+            checks.append(lambda v: not isinstance(v, list) or len(v) >= min_items)
+        if "maxItems" in schema:
+            max_items = schema["maxItems"]
+            checks.append(lambda v: not isinstance(v, list) or len(v) <= max_items)
+        if schema.get("uniqueItems") is True:
+            if exact:
+                raise UnsupportedSchema("uniqueItems inside an `if` condition")
+
+            def unique(v: object) -> bool:
+                if not isinstance(v, list):
+                    return True
+                # Conservative: only string arrays are proven unique here
+                return all(isinstance(i, str) for i in v) and len(set(v)) == len(v)
+            checks.append(unique)
+        return checks
+
+    def _object_checks(self, schema: dict, exact: bool) -> list[Check]:
+        checks: list[Check] = []
+        if "required" in schema:
+            required = frozenset(schema["required"])
+            checks.append(lambda v: not isinstance(v, dict) or required.issubset(v.keys()))
+        if "minProperties" in schema:
+            min_properties = schema["minProperties"]
+            checks.append(lambda v: not isinstance(v, dict) or len(v) >= min_properties)
+
+        properties = {
+            name: self.compile(sub, exact)
+            for name, sub in schema.get("properties", {}).items()
+        }
+        if properties:
+            items = tuple(properties.items())
+
+            def check_properties(v: object) -> bool:
+                if not isinstance(v, dict):
+                    return True
+                for name, check in items:
+                    if name in v and not check(v[name]):
+                        return False
+                return True
+            checks.append(check_properties)
+
+        if "additionalProperties" in schema:
+            known = frozenset(properties)
+            extra_check = self.compile(schema["additionalProperties"], exact)
+            checks.append(lambda v: not isinstance(v, dict) or all(
+                extra_check(value) for key, value in v.items() if key not in known
+            ))
+        return checks
+
+
+_HANDLED = frozenset({
+    "$ref", "type", "const", "enum", "pattern", "minLength", "maxLength",
+    "minimum", "maximum", "items", "minItems", "maxItems", "uniqueItems",
+    "required", "minProperties", "properties", "additionalProperties",
+    "allOf", "if", "then", "else",
+})
+
+
+def compile_fast_check(schema: object) -> Optional[Check]:
+    """
+    Compile a schema into a fast, sound yes/no checker.
+
+    Args:
+        schema: Parsed JSON schema
+
+    Returns:
+        Callable returning True only for instances the schema accepts, or
+        None if the schema uses keywords the fast path does not support
+    """
+    try:
+        return _Compiler(schema if isinstance(schema, dict) else {}).compile(schema)
+    except (UnsupportedSchema, re.error):
+        return None
@@ -5,122 +5,172 @@ Generate SCHEMA_INDEX.json for Layer 5 prompts.
 This script scans all JSON schemas in 03-schemas/, computes SHA-256 hashes,
 and creates an index file that maps schema names to their metadata.
 
+Role and intent mappings are derived from the spec: role folders in
+05-prompts/ and the Intent Summary Table in 04-protocol/INTENTS.md. Besides
+the per-schema "roles" and "intent" lists, the index carries a "lookup"
+table (intent -> payload schema, role -> schemas) so consumers can answer
+"which schema does intent X need" with one key lookup.
+
 The index is used by Layer 5 prompts to discover and validate artifacts.
+
+Generation is incremental: each schema's size, mtime, SHA-256 and metadata
+are cached in .qfspec-cache/schema_index.json, so only schemas that changed
+since the last run are re-read. The index is written (atomically) only when
+its content changes, leaving its mtime alone otherwise.
+
+Usage:
+  qfspec-generate-schema-index           # regenerate if stale
+  qfspec-generate-schema-index --check   # exit 1 if stale, never write
 """
 
 import hashlib
 import json
+import os
+import re
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
-
-# Role-to-schema mappings based on Layer 5 role definitions
-ROLE_SCHEMAS: Dict[str, list[str]] = {
-    "plotwright": [
-        "hook_card",
-        "outline",
-        "scene_outline",
-        "plot_card",
-        "beat_sequence",
-    ],
-    "scene_smith": [
-        "scene",
-        "narrative_block",
-        "dialogue_block",
-    ],
-    "style_lead": [
-        "style_audit_report",
-        "style_proposal",
-    ],
-    "gatekeeper": [
-        "gatecheck_report",
-        "merge_decision",
-        "spoiler_audit",
-    ],
-    "book_binder": [
-        "cold_book",
-        "cold_manifest",
-        "export_manifest",
-    ],
-    "lore_weaver": [
-        "lore_entry",
-        "canon_question",
-        "lore_audit",
-    ],
-    "codex_curator": [
-        "codex_entry",
-        "knowledge_graph_node",
-        "player_safe_summary",
-    ],
-    "player_narrator": [
-        "narration_script",
-        "player_choice",
-        "session_log",
-    ],
-    "art_director": [
-        "art_brief",
-        "art_asset_spec",
-    ],
-    "illustrator": [
-        "art_asset",
-        "cold_art_manifest",
-    ],
-    "audio_director": [
-        "audio_brief",
-        "audio_asset_spec",
-    ],
-    "audio_producer": [
-        "audio_asset",
-    ],
-    "translator": [
-        "translation_glossary",
-        "translated_artifact",
-    ],
-    "researcher": [
-        "research_report",
-        "source_citation",
-    ],
-    "showrunner": [
-        "tu_card",
-        "loop_manifest",
-        "hot_manifest",
-        "project_metadata",
-    ],
-}
-
-# Intent-to-schema mappings based on Layer 4 protocol
-INTENT_SCHEMAS: Dict[str, list[str]] = {
-    "hook.propose": ["hook_card"],
-    "hook.classify": ["hook_card"],
-    "hook.integrate": ["hook_card"],
-    "outline.propose": ["outline", "scene_outline"],
-    "outline.revise": ["outline", "scene_outline"],
-    "scene.draft": ["scene", "narrative_block"],
-    "scene.revise": ["scene", "narrative_block"],
-    "style.audit": ["style_audit_report"],
-    "style.propose": ["style_proposal"],
-    "lore.question": ["canon_question"],
-    "lore.answer": ["lore_entry"],
-    "lore.integrate": ["lore_entry"],
-    "codex.summarize": ["codex_entry", "player_safe_summary"],
-    "codex.expand": ["codex_entry"],
-    "gate.request": ["gatecheck_report"],
-    "gate.decide": ["merge_decision"],
-    "gate.audit": ["spoiler_audit"],
-    "bind.request": ["cold_book", "cold_manifest"],
-    "bind.deliver": ["export_manifest"],
-    "narrate.dry_run": ["narration_script", "session_log"],
-    "art.brief": ["art_brief", "art_asset_spec"],
-    "art.deliver": ["art_asset", "cold_art_manifest"],
-    "audio.brief": ["audio_brief", "audio_asset_spec"],
-    "audio.deliver": ["audio_asset"],
-    "translate.request": ["translation_glossary"],
-    "translate.deliver": ["translated_artifact"],
-    "research.request": ["research_report"],
-    "research.deliver": ["source_citation"],
-    "tu.open": ["tu_card"],
-    "tu.close": ["tu_card"],
-    "tu.checkpoint": ["tu_card"],
-}
+from typing import Any, Dict, Iterable, Optional
+
+INDEX_VERSION = "0.4.0"
+CACHE_FILE = Path(".qfspec-cache") / "schema_index.json"
+CACHE_VERSION = 1
+
+# Match the repo's Prettier settings (spec-tools/.prettierrc.json) for JSON
+PRINT_WIDTH = 100
+_SCALAR_ARRAY = re.compile(r'\[\n(?:\s*(?:"(?:[^"\\\n]|\\.)*"|[-\w.+]+),?\n)+\s*\]')
+
+INTENTS_DOC = Path("04-protocol") / "INTENTS.md"
+ROLE_ABBREVIATIONS_DOC = Path("02-dictionary") / "role_abbreviations.md"
+PROMPTS_DIR = Path("05-prompts")
+
+# Intent Summary Table rows: | `intent` | purpose | sender | receiver | payload schema |
+_INTENT_ROW = re.compile(r"^\|\s*`([\w.]+)`\s*\|([^|]*)\|([^|]*)\|([^|]*)\|([^|]*)\|\s*$")
+# Role abbreviation rows: | # | Role | Abbreviation | ...
+_ABBREVIATION_ROW = re.compile(r"^\|\s*\d+\s*\|\s*([^|]+?)\s*\|\s*([A-Za-z]+)\s*\|")
+_SCHEMA_FILE = re.compile(r"([a-z][a-z0-9_]*)\.schema\.json")
+_IDENTIFIER = re.compile(r"[a-z][a-z0-9_]*")
+
+
+@dataclass(frozen=True)
+class IntentSpec:
+    """One row of the INTENTS.md Intent Summary Table."""
+    intent: str
+    purpose: str
+    senders: tuple[str, ...]  # As written, e.g. ("SR", "Owner (A)") or ("Any",)
+    receivers: tuple[str, ...]
+    schema: Optional[str]  # Payload schema key, None if the intent has no payload schema
+
+
+@dataclass
+class SchemaMappings:
+    """Role/intent ↔ schema mappings derived from the spec, with inverted indexes."""
+    role_schemas: Dict[str, list[str]]
+    intent_schema: Dict[str, Optional[str]]
+    schema_roles: Dict[str, list[str]]
+    schema_intents: Dict[str, list[str]]
+
+
+def load_role_abbreviations(repo_root: Path) -> Dict[str, str]:
+    """
+    Map role abbreviations to role folder names (e.g. "SR" -> "showrunner").
+
+    Read from the table in 02-dictionary/role_abbreviations.md; empty if missing.
+    """
+    abbreviations = {}
+    try:
+        lines = (repo_root / ROLE_ABBREVIATIONS_DOC).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return abbreviations
+    for line in lines:
+        match = _ABBREVIATION_ROW.match(line)
+        if match:
+            role = re.sub(r"[\s-]+", "_", match.group(1).strip().lower())
+            abbreviations[match.group(2)] = role
+    return abbreviations
+
+
+def parse_intents(repo_root: Path) -> list[IntentSpec]:
+    """
+    Parse the Intent Summary Table in 04-protocol/INTENTS.md.
+
+    Returns:
+        One IntentSpec per table row, in document order (empty if the file is missing)
+    """
+    try:
+        lines = (repo_root / INTENTS_DOC).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+
+    intents = []
+    for line in lines:
+        match = _INTENT_ROW.match(line)
+        if not match:
+            continue
+        intent, purpose, senders, receivers, payload = (g.strip() for g in match.groups())
+        schema = _SCHEMA_FILE.search(payload)
+        intents.append(IntentSpec(
+            intent=intent,
+            purpose=purpose,
+            senders=tuple(part.strip() for part in senders.split("/") if part.strip()),
+            receivers=tuple(part.strip() for part in receivers.split("/") if part.strip()),
+            schema=schema.group(1) if schema else None,
+        ))
+    return intents
+
+
+def role_folders(repo_root: Path) -> list[Path]:
+    """Layer 5 role folders: 05-prompts/*/ directories with a system_prompt.md."""
+    prompts_dir = repo_root / PROMPTS_DIR
+    if not prompts_dir.exists():
+        return []
+    return sorted(d for d in prompts_dir.iterdir() if (d / "system_prompt.md").is_file())
+
+
+def derive_schema_mappings(repo_root: Path, schema_keys: Iterable[str]) -> SchemaMappings:
+    """
+    Derive role and intent mappings for the given schemas from the spec itself.
+
+    A role uses a schema if any file in its 05-prompts/<role>/ folder names the
+    schema key (e.g. `hook_card` or `hook_card.schema.json`), or if it is a
+    sender or receiver of an intent carrying that schema in INTENTS.md.
+    Intents map to the payload schema in the INTENTS.md Intent Summary Table.
+    Each source is read once and the inverted (schema -> roles/intents)
+    indexes are filled in the same pass; unknown schemas are ignored.
+    """
+    keys = frozenset(schema_keys)
+    roles_by_schema: Dict[str, set[str]] = {key: set() for key in keys}
+    intents_by_schema: Dict[str, set[str]] = {key: set() for key in keys}
+    schemas_by_role: Dict[str, set[str]] = {}
+
+    for folder in role_folders(repo_root):
+        used = schemas_by_role.setdefault(folder.name, set())
+        for path in folder.rglob("*"):
+            if path.suffix in (".md", ".json") and path.is_file():
+                used.update(keys.intersection(_IDENTIFIER.findall(path.read_text(encoding="utf-8"))))
+        for key in used:
+            roles_by_schema[key].add(folder.name)
+
+    abbreviations = load_role_abbreviations(repo_root)
+    intent_schema: Dict[str, Optional[str]] = {}
+    for spec in parse_intents(repo_root):
+        schema = spec.schema if spec.schema in keys else None
+        intent_schema[spec.intent] = schema
+        if schema is None:
+            continue
+        intents_by_schema[schema].add(spec.intent)
+        for party in spec.senders + spec.receivers:
+            role = abbreviations.get(party)
+            if role in schemas_by_role:
+                roles_by_schema[schema].add(role)
+                schemas_by_role[role].add(schema)
+
+    return SchemaMappings(
+        role_schemas={role: sorted(used) for role, used in sorted(schemas_by_role.items())},
+        intent_schema=dict(sorted(intent_schema.items())),
+        schema_roles={key: sorted(roles) for key, roles in roles_by_schema.items()},
+        schema_intents={key: sorted(intents) for key, intents in intents_by_schema.items()},
+    )
 
 
 def compute_sha256(file_path: Path) -> str:
@@ -150,24 +200,6 @@ def get_schema_key(filename: str) -> str:
     return filename.replace(".schema.json", "")
 
 
-def get_roles_for_schema(schema_key: str) -> list[str]:
-    """Find all roles that use this schema."""
-    roles = []
-    for role, schemas in ROLE_SCHEMAS.items():
-        if schema_key in schemas:
-            roles.append(role)
-    return sorted(roles)
-
-
-def get_intents_for_schema(schema_key: str) -> list[str]:
-    """Find all intents that use this schema."""
-    intents = []
-    for intent, schemas in INTENT_SCHEMAS.items():
-        if schema_key in schemas:
-            intents.append(intent)
-    return sorted(intents)
-
-
 def extract_draft_version(schema_uri: str) -> str:
     """Extract draft version from $schema URI."""
     # Examples:
@@ -185,49 +217,107 @@ def extract_draft_version(schema_uri: str) -> str:
         return "unknown"
 
 
-def generate_schema_index(repo_root: Path, output_path: Path) -> None:
+class SchemaScanCache:
     """
-    Generate SCHEMA_INDEX.json from schemas in 03-schemas/.
+    Per-schema scan results from the previous run, in .qfspec-cache/schema_index.json.
+
+    An entry (sha256 plus extracted metadata) is reused while the schema
+    file's size and mtime are unchanged.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.rehashed = 0
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("schemas", {})
+        except (OSError, ValueError, AttributeError):
+            pass  # No (usable) cache: every schema is scanned
+
+    def scan(self, schema_path: Path, rel_path: str) -> Dict[str, Any]:
+        """Return {"sha256", "metadata"} for a schema, re-reading it only if its size or mtime moved."""
+        stat = schema_path.stat()
+        entry = self.entries.get(rel_path)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+
+        entry = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": compute_sha256(schema_path),
+            "metadata": extract_schema_metadata(schema_path),
+        }
+        self.entries[rel_path] = entry
+        self.rehashed += 1
+        self._dirty = True
+        return entry
+
+    def save(self, keep: set[str]) -> None:
+        """Persist the cache, dropping schemas that no longer exist; failures are ignored."""
+        stale = set(self.entries) - keep
+        if self.path is None or not (self._dirty or stale):
+            return
+        for rel_path in stale:
+            del self.entries[rel_path]
+        try:
+            _write_atomic(self.path, json.dumps({"version": CACHE_VERSION, "schemas": self.entries}))
+        except OSError:
+            pass  # Read-only checkout: next run rescans
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def build_schema_index(repo_root: Path, cache: Optional[SchemaScanCache] = None) -> Dict[str, Any]:
+    """
+    Build the SCHEMA_INDEX.json content from schemas in 03-schemas/.
 
     Args:
         repo_root: Path to repository root
-        output_path: Where to write SCHEMA_INDEX.json
+        cache: Scan cache to reuse unchanged schemas from (None: scan everything); not saved here
+
+    Returns:
+        The index as a dict
     """
     schemas_dir = repo_root / "03-schemas"
     if not schemas_dir.exists():
         raise FileNotFoundError(f"Schemas directory not found: {schemas_dir}")
+    cache = cache or SchemaScanCache(None)
 
     index = {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
         "title": "QuestFoundry Schema Index",
         "description": "Index of all Layer 3 schemas with integrity hashes and role mappings",
-        "version": "0.2.0",
-        "generated": "2025-11-06",
+        "version": INDEX_VERSION,
         "schemas": {}
     }
 
     # Scan all .schema.json files
     schema_files = sorted(schemas_dir.glob("*.schema.json"))
+    mappings = derive_schema_mappings(repo_root, (get_schema_key(p.name) for p in schema_files))
 
     for schema_path in schema_files:
         schema_key = get_schema_key(schema_path.name)
 
-        # Extract metadata from schema file
-        metadata = extract_schema_metadata(schema_path)
-
-        # Compute SHA-256 hash
-        sha256 = compute_sha256(schema_path)
-
         # Relative path from repo root
         rel_path = schema_path.relative_to(repo_root).as_posix()
 
+        # SHA-256 hash and metadata (reused if the file is unchanged)
+        scanned = cache.scan(schema_path, rel_path)
+        metadata = scanned["metadata"]
+
         # Draft version
         draft = extract_draft_version(metadata.get("$schema", ""))
 
-        # Role and intent mappings
-        roles = get_roles_for_schema(schema_key)
-        intents = get_intents_for_schema(schema_key)
-
         # Add to index
         index["schemas"][schema_key] = {
             "$id": metadata["$id"],
@@ -235,18 +325,85 @@ def generate_schema_index(repo_root: Path, output_path: Path) -> None:
             "description": metadata.get("description", ""),
             "path": rel_path,
             "draft": draft,
-            "sha256": sha256,
-            "roles": roles,
-            "intent": intents,
+            "sha256": scanned["sha256"],
+            "roles": mappings.schema_roles[schema_key],
+            "intent": mappings.schema_intents[schema_key],
         }
 
-    # Write index to output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
-        f.write("\n")  # Add trailing newline
+    # Precomputed forward lookups for runtime consumers
+    index["lookup"] = {
+        "intent_schema": mappings.intent_schema,
+        "role_schemas": mappings.role_schemas,
+    }
+
+    return index
+
+
+def render_schema_index(index: Dict[str, Any]) -> str:
+    """
+    Serialize the index as it is written to disk.
+
+    Arrays of scalars are put on one line when they fit PRINT_WIDTH, as
+    Prettier does, so a regenerated index does not fight the format hook.
+    """
+    text = json.dumps(index, indent=2, ensure_ascii=False)
+
+    def collapse(match: re.Match) -> str:
+        items = [line.strip().rstrip(",") for line in match.group(0).splitlines()[1:-1]]
+        flat = "[" + ", ".join(items) + "]"
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        rest = text[match.end():line_end if line_end != -1 else len(text)]
+        if match.start() - line_start + len(flat) + len(rest) <= PRINT_WIDTH:
+            return flat
+        return match.group(0)
+
+    return _SCALAR_ARRAY.sub(collapse, text) + "\n"
+
+
+def generate_schema_index(repo_root: Path, output_path: Path, check: bool = False,
+                          use_cache: bool = True) -> bool:
+    """
+    Generate SCHEMA_INDEX.json from schemas in 03-schemas/, if it is stale.
 
-    print(f"✅ Generated SCHEMA_INDEX.json with {len(index['schemas'])} schemas")
+    Args:
+        repo_root: Path to repository root
+        output_path: Where to write SCHEMA_INDEX.json
+        check: Only report whether the index is stale; never write
+        use_cache: Reuse unchanged schemas from .qfspec-cache/schema_index.json
+
+    Returns:
+        True if the index was stale (and, unless check, was rewritten)
+    """
+    cache = SchemaScanCache(repo_root / CACHE_FILE if use_cache else None)
+    index = build_schema_index(repo_root, cache)
+    content = render_schema_index(index)
+
+    # Compare parsed content, so formatting-only differences (e.g. Prettier) are not stale
+    try:
+        stale = json.loads(output_path.read_text(encoding="utf-8")) != index
+    except (OSError, ValueError):
+        stale = True
+
+    count = len(index["schemas"])
+    if check:
+        # Read-only: the scan cache is used but not saved
+        if stale:
+            print(f"❌ {output_path} is stale; run qfspec-generate-schema-index")
+        else:
+            print(f"✅ {output_path.name} is up to date ({count} schemas)")
+        return stale
+
+    cache.save({entry["path"] for entry in index["schemas"].values()})
+
+    if not stale:
+        print(f"✅ {output_path.name} is up to date ({count} schemas, {cache.rehashed} rehashed)")
+        return False
+
+    # Write index to output (atomically, so readers never see a partial file)
+    _write_atomic(output_path, content)
+
+    print(f"✅ Generated SCHEMA_INDEX.json with {count} schemas ({cache.rehashed} rehashed)")
     print(f"📄 Output: {output_path}")
 
     # Print summary
@@ -256,10 +413,15 @@ def generate_schema_index(repo_root: Path, output_path: Path) -> None:
         if len(schema_info["roles"]) > 3:
             roles_str += f" (+{len(schema_info['roles']) - 3} more)"
         print(f"  • {schema_key:30s} — {roles_str or 'No roles'}")
+    return True
 
 
 def main() -> None:
     """CLI entry point."""
+    args = sys.argv[1:]
+    check = "--check" in args
+    use_cache = "--no-cache" not in args and not os.environ.get("QFSPEC_NO_CACHE")
+
     # Determine repo root (script is in spec-tools/src/questfoundry_spec_tools/)
     script_dir = Path(__file__).parent
     repo_root = script_dir.parent.parent.parent
@@ -268,7 +430,9 @@ def main() -> None:
     output_path = repo_root / "05-prompts" / "SCHEMA_INDEX.json"
 
     print(f"🔍 Scanning schemas in: {repo_root / '03-schemas'}")
-    generate_schema_index(repo_root, output_path)
+    stale = generate_schema_index(repo_root, output_path, check=check, use_cache=use_cache)
+    if check and stale:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,17 +4,27 @@ Validates artifact instances against their schemas.
 """
 
 import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
 
 try:
     import jsonschema
-    from jsonschema import Draft202012Validator
 except ImportError as e:
     raise ImportError(
         "jsonschema library is required. Install with: uv sync"
     ) from e
 
+from .routing import RoutingTable, build_routing_table, get_routing_table
+from .schema_registry import SchemaEntry, SchemaRegistry, get_registry
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_DOCUMENTS = 64
+
 
 def list_available_schemas(base_dir: Path, layer: str = "03-schemas") -> list[str]:
     """
@@ -54,10 +64,40 @@ def find_schema_file(base_dir: Path, schema_name: str, layer: str = "03-schemas"
     return schema_path if schema_path.exists() else None
 
 
+def validate_instance_data(schema_path: Path, instance: object) -> Tuple[bool, str]:
+    """
+    Validate an already-parsed instance against a schema.
+
+    Args:
+        schema_path: Path to the schema file
+        instance: Parsed instance data
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    try:
+        # Compiled validator (cached, rebuilt only when the schema file changes)
+        validator = get_registry().validator_for_path(schema_path)
+        validator.validate(instance)
+
+        return True, ""
+    except json.JSONDecodeError as e:
+        return False, f"Invalid JSON: {e}"
+    except jsonschema.ValidationError as e:
+        # Format the error message nicely with path
+        error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
+        return False, f"Validation error at '{error_path}': {e.message}"
+    except Exception as e:
+        return False, f"Unexpected error: {e}"
+
+
 def validate_instance(schema_path: Path, instance_path: Path) -> Tuple[bool, str]:
     """
     Validate an instance file against a schema.
 
+    The compiled validator comes from the process-wide schema registry, so
+    validating many instances against one schema compiles it only once.
+
     Args:
         schema_path: Path to the schema file
         instance_path: Path to the instance file
@@ -68,36 +108,75 @@ def validate_instance(schema_path: Path, instance_path: Path) -> Tuple[bool, str
         - error_message: Empty string if valid, error description if invalid
     """
     try:
-        # Load schema
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-
         # Load instance
         with open(instance_path, 'r') as f:
             instance = json.load(f)
-
-        # Validate
-        validator = Draft202012Validator(schema)
-        validator.validate(instance)
-
-        return True, ""
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON: {e}"
-    except jsonschema.ValidationError as e:
-        # Format the error message nicely with path
-        error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
-        return False, f"Validation error at '{error_path}': {e.message}"
     except Exception as e:
         return False, f"Unexpected error: {e}"
 
+    return validate_instance_data(schema_path, instance)
+
+
+def _chunks(items: list, jobs: int) -> list[list]:
+    """Split items into contiguous chunks, several per worker for load balancing."""
+    size = max(1, -(-len(items) // (jobs * 4)))
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
-def validate_instances(schema_path: Path, instance_paths: list[Path]) -> dict:
+
+def _map_ordered(func: Callable[[list], list], items: list, jobs: int,
+                 min_items: int = PARALLEL_MIN_DOCUMENTS) -> Iterator:
+    """
+    Apply a chunk function to items, yielding per-item results in input order.
+
+    With jobs > 1 and at least min_items items, the chunks are spread across
+    a process pool; each worker process builds its own compiled validators
+    through its own registry. Smaller inputs run in-process.
+    """
+    if jobs <= 1 or len(items) < min_items:
+        if items:
+            yield from func(items)
+        return
+
+    chunks = _chunks(items, jobs)
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        for chunk_results in pool.map(func, chunks):
+            yield from chunk_results
+
+
+def _validate_instance_chunk(schema_path: Path, instance_paths: list[Path]) -> list[Tuple[bool, str]]:
+    return [validate_instance(schema_path, instance_path) for instance_path in instance_paths]
+
+
+def iter_validate_instances(
+    schema_path: Path,
+    instance_paths: list[Path],
+    jobs: int = 1,
+) -> Iterator[Tuple[bool, str]]:
+    """
+    Validate instance files against a schema, optionally in parallel.
+
+    Args:
+        schema_path: Path to the schema file
+        instance_paths: List of paths to instance files
+        jobs: Number of worker processes (1 validates in-process)
+
+    Yields:
+        (is_valid, error_message) per instance, in input order
+    """
+    return _map_ordered(partial(_validate_instance_chunk, schema_path), list(instance_paths), jobs)
+
+
+def validate_instances(schema_path: Path, instance_paths: list[Path], jobs: int = 1) -> dict:
     """
     Validate multiple instances against a schema.
 
     Args:
         schema_path: Path to the schema file
         instance_paths: List of paths to instance files
+        jobs: Number of worker processes (1 validates in-process)
 
     Returns:
         Dictionary with validation results:
@@ -117,13 +196,16 @@ def validate_instances(schema_path: Path, instance_paths: list[Path]) -> dict:
         "errors": []
     }
 
+    existing = [p for p in instance_paths if p.exists()]
+    outcomes = iter_validate_instances(schema_path, existing, jobs=jobs)
+
     for instance_path in instance_paths:
         if not instance_path.exists():
             results["failed"] += 1
             results["errors"].append((instance_path.name, "File not found"))
             continue
 
-        is_valid, error_msg = validate_instance(schema_path, instance_path)
+        is_valid, error_msg = next(outcomes)
 
         if is_valid:
             results["passed"] += 1
@@ -134,10 +216,206 @@ def validate_instances(schema_path: Path, instance_paths: list[Path]) -> dict:
     return results
 
 
+@dataclass
+class EnvelopeResult:
+    """Result of validating a single envelope."""
+    source: str  # File path, or "<envelope>" for in-memory envelopes
+    index: int  # Position in the batch passed to validate_envelopes
+    is_valid: bool
+    error_message: str
+    payload_type: Optional[str] = None
+
+
+class EnvelopeValidator:
+    """
+    Two-pass envelope validator bound to one repository.
+
+    Dispatches through the repository's routing table (see routing), which
+    maps payload.type to its compiled Layer 3 schema and intent to its
+    expected payload type, so validating an envelope never touches the
+    filesystem. Envelopes whose payload.type does not match their intent's
+    row in the INTENTS.md Intent Summary Table are rejected before Pass 2.
+
+    With check_roles=True the sender and receiver roles must also match that
+    row (rows with placeholder roles such as "Owner (A)" accept any role).
+
+    A validator is cheap to keep: with the process-wide registry it follows
+    the shared routing table, which re-checks its source files at most once
+    every routing.ROUTING_RECHECK_SECONDS (or on reload()). A validator with a
+    private registry builds its own table once and only rebuilds on reload().
+    """
+
+    def __init__(self, base_dir: Path, registry: Optional[SchemaRegistry] = None,
+                 check_roles: bool = False):
+        self.base_dir = base_dir
+        self.registry = registry if registry is not None else get_registry(base_dir)
+        self.check_roles = check_roles
+        self._private = registry is not None and registry is not get_registry()
+        self._routing = get_routing_table(base_dir, registry)
+
+    @property
+    def routing(self) -> RoutingTable:
+        """Current routing table (see get_routing_table)."""
+        if not self._private:
+            self._routing = get_routing_table(self.base_dir)
+        return self._routing
+
+    def reload(self) -> None:
+        """Re-check the envelope schema, INTENTS.md and Layer 3 schemas now."""
+        if self._private:
+            self._routing = build_routing_table(Path(os.path.abspath(self.base_dir)), self.registry)
+        else:
+            self._routing = get_routing_table(self.base_dir, reload=True)
+
+    @staticmethod
+    def _collect_errors(entry: SchemaEntry, instance: object) -> list:
+        """Full jsonschema error collection, skipped when the fast path accepts."""
+        if entry.fast_check is not None and entry.fast_check(instance):
+            return []
+        return list(entry.validator.iter_errors(instance))
+
+    def validate(self, envelope: dict) -> Tuple[bool, str]:
+        """
+        Validate an already-parsed envelope (see validate_envelope for the passes).
+
+        Between the passes, payload.type is checked against the envelope's
+        intent (and, with check_roles, the sender/receiver roles) using the
+        routing table. Each pass first tries the schema's compiled fast-path
+        checker and only runs full jsonschema error collection when the fast
+        path rejects.
+
+        Args:
+            envelope: Parsed envelope object
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        routing = self.routing
+        try:
+            # === PASS 1: Validate envelope structure ===
+            # No RefResolver needed - envelope schema now has no $ref to Layer 3
+            envelope_entry = routing.envelope
+            if envelope_entry is None:
+                return False, "Envelope schema not found at 04-protocol/envelope.schema.json"
+
+            envelope_errors = self._collect_errors(envelope_entry, envelope)
+            if envelope_errors:
+                error_msgs = []
+                for error in envelope_errors:
+                    error_path = " -> ".join(str(p) for p in error.path) if error.path else "root"
+                    error_msgs.append(f"{error_path}: {error.message}")
+                return False, f"Envelope validation errors (Pass 1):\n  " + "\n  ".join(error_msgs)
+
+            # === Routing: payload.type must match the intent ===
+            route_error = routing.route_error(envelope, self.check_roles)
+            if route_error:
+                return False, f"Routing error: {route_error}"
+
+            # === PASS 2: Validate payload data against Layer 3 schema ===
+            payload = envelope.get("payload", {})
+            payload_type = payload.get("type")
+
+            # Skip payload validation if type is "none" or missing
+            if not payload_type or payload_type == "none":
+                return True, ""
+
+            payload_data = payload.get("data", {})
+
+            # Find corresponding Layer 3 schema
+            payload_entry = routing.payload_entry(payload_type)
+            if payload_entry is None:
+                return False, f"Layer 3 schema not found: 03-schemas/{payload_type}.schema.json"
+
+            # Validate only payload.data against Layer 3 schema
+            payload_errors = self._collect_errors(payload_entry, payload_data)
+
+            if payload_errors:
+                error_msgs = []
+                for error in payload_errors:
+                    error_path = " -> ".join(str(p) for p in error.path) if error.path else "payload.data"
+                    error_msgs.append(f"{error_path}: {error.message}")
+                return False, f"Payload validation errors (Pass 2, type: {payload_type}):\n  " + "\n  ".join(error_msgs)
+
+            return True, ""
+
+        except json.JSONDecodeError as e:
+            return False, f"Invalid JSON: {e}"
+        except FileNotFoundError as e:
+            return False, f"File not found: {e}"
+        except Exception as e:
+            return False, f"Unexpected error: {e}"
+
+
+    def validate_item(self, item: Union[dict, str, os.PathLike], index: int = 0) -> EnvelopeResult:
+        """
+        Validate one envelope given as a parsed dict or a path to a file.
+
+        Args:
+            item: Parsed envelope, or path (str or Path) to an envelope file
+            index: Position of the item in its batch
+
+        Returns:
+            EnvelopeResult for the item
+        """
+        if isinstance(item, (str, os.PathLike)):
+            source = str(item)
+            envelope, error_msg = _load_envelope(Path(item))
+            if envelope is None:
+                return EnvelopeResult(source, index, False, error_msg)
+        else:
+            source = "<envelope>"
+            envelope = item
+
+        payload = envelope.get("payload") if isinstance(envelope, dict) else None
+        payload_type = payload.get("type") if isinstance(payload, dict) else None
+        is_valid, error_msg = self.validate(envelope)
+        return EnvelopeResult(source, index, is_valid, error_msg, payload_type)
+
+
+def _load_envelope(envelope_path: Path) -> Tuple[Optional[dict], str]:
+    """Load an envelope file, returning (envelope, error_message)."""
+    try:
+        with open(envelope_path, 'r') as f:
+            return json.load(f), ""
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON: {e}"
+    except FileNotFoundError as e:
+        return None, f"File not found: {e}"
+    except Exception as e:
+        return None, f"Unexpected error: {e}"
+
+
+_ENVELOPE_VALIDATORS: dict[Path, EnvelopeValidator] = {}
+_ENVELOPE_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_envelope_validator(base_dir: Path) -> EnvelopeValidator:
+    """
+    Return the process-wide EnvelopeValidator for a repository.
+
+    Args:
+        base_dir: Repository root directory
+
+    Returns:
+        The shared EnvelopeValidator for base_dir (process-wide registry, no role checks)
+    """
+    root = Path(os.path.abspath(base_dir))
+    validator = _ENVELOPE_VALIDATORS.get(root)
+    if validator is None:
+        with _ENVELOPE_VALIDATORS_LOCK:
+            validator = _ENVELOPE_VALIDATORS.get(root)
+            if validator is None:
+                validator = EnvelopeValidator(root)
+                _ENVELOPE_VALIDATORS[root] = validator
+    return validator
+
+
 def validate_envelope(envelope_path: Path, base_dir: Path) -> Tuple[bool, str]:
     """
-    Validate an envelope file using two-pass validation:
+    Validate an envelope file using two-pass validation (uses the shared
+    validator from get_envelope_validator):
     - Pass 1: Validate envelope structure against envelope.schema.json (Layer 4)
+    - Routing: payload.type must match the intent's payload schema (INTENTS.md)
     - Pass 2: Validate payload.data against Layer 3 schema based on payload.type
 
     Args:
@@ -149,65 +427,276 @@ def validate_envelope(envelope_path: Path, base_dir: Path) -> Tuple[bool, str]:
         - is_valid: True if both passes succeed, False otherwise
         - error_message: Empty string if valid, error description if invalid
     """
-    try:
-        # Load envelope
-        with open(envelope_path, 'r') as f:
-            envelope = json.load(f)
-
-        # === PASS 1: Validate envelope structure ===
-        envelope_schema_path = base_dir / "04-protocol" / "envelope.schema.json"
-        if not envelope_schema_path.exists():
-            return False, "Envelope schema not found at 04-protocol/envelope.schema.json"
-
-        with open(envelope_schema_path, 'r') as f:
-            envelope_schema = json.load(f)
-
-        # Validate entire envelope against envelope.schema.json
-        # No RefResolver needed - envelope schema now has no $ref to Layer 3
-        validator = Draft202012Validator(envelope_schema)
-
-        envelope_errors = list(validator.iter_errors(envelope))
-        if envelope_errors:
-            error_msgs = []
-            for error in envelope_errors:
-                error_path = " -> ".join(str(p) for p in error.path) if error.path else "root"
-                error_msgs.append(f"{error_path}: {error.message}")
-            return False, f"Envelope validation errors (Pass 1):\n  " + "\n  ".join(error_msgs)
-
-        # === PASS 2: Validate payload data against Layer 3 schema ===
-        payload = envelope.get("payload", {})
-        payload_type = payload.get("type")
-
-        # Skip payload validation if type is "none" or missing
-        if not payload_type or payload_type == "none":
-            return True, ""
+    envelope, error_msg = _load_envelope(envelope_path)
+    if envelope is None:
+        return False, error_msg
+    return get_envelope_validator(base_dir).validate(envelope)
 
-        payload_data = payload.get("data", {})
 
-        # Find corresponding Layer 3 schema
-        layer3_schema_path = base_dir / "03-schemas" / f"{payload_type}.schema.json"
-        if not layer3_schema_path.exists():
-            return False, f"Layer 3 schema not found: 03-schemas/{payload_type}.schema.json"
+def validate_envelopes(
+    envelopes: Iterable[Union[dict, Path]],
+    base_dir: Path,
+) -> list[EnvelopeResult]:
+    """
+    Validate a batch of envelopes with the shared EnvelopeValidator.
 
-        with open(layer3_schema_path, 'r') as f:
-            layer3_schema = json.load(f)
+    Args:
+        envelopes: Already-parsed envelope dicts and/or paths (str or Path) to envelope files
+        base_dir: Repository root directory
 
-        # Validate only payload.data against Layer 3 schema
-        payload_validator = Draft202012Validator(layer3_schema)
-        payload_errors = list(payload_validator.iter_errors(payload_data))
+    Returns:
+        One EnvelopeResult per input, in input order
+    """
+    validator = get_envelope_validator(base_dir)
+    return [validator.validate_item(item, index) for index, item in enumerate(envelopes)]
 
-        if payload_errors:
-            error_msgs = []
-            for error in payload_errors:
-                error_path = " -> ".join(str(p) for p in error.path) if error.path else "payload.data"
-                error_msgs.append(f"{error_path}: {error.message}")
-            return False, f"Payload validation errors (Pass 2, type: {payload_type}):\n  " + "\n  ".join(error_msgs)
 
-        return True, ""
+def _validate_envelope_chunk(base_dir: Path, envelope_paths: list[Path]) -> list[Tuple[bool, str]]:
+    return [
+        (result.is_valid, result.error_message)
+        for result in validate_envelopes(envelope_paths, base_dir)
+    ]
 
-    except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {e}"
-    except FileNotFoundError as e:
-        return False, f"File not found: {e}"
-    except Exception as e:
-        return False, f"Unexpected error: {e}"
+
+def iter_validate_envelopes(
+    envelope_paths: list[Path],
+    base_dir: Path,
+    jobs: int = 1,
+) -> Iterator[Tuple[bool, str]]:
+    """
+    Validate envelope files, optionally in parallel.
+
+    Args:
+        envelope_paths: List of paths to envelope files
+        base_dir: Repository root directory
+        jobs: Number of worker processes (1 validates in-process)
+
+    Yields:
+        (is_valid, error_message) per envelope, in input order
+    """
+    return _map_ordered(partial(_validate_envelope_chunk, base_dir), list(envelope_paths), jobs)
+
+
+# === Streaming validation (NDJSON / top-level JSON array) ===
+
+STREAM_CHUNK_SIZE = 1 << 16
+MAX_STREAM_ENVELOPE_BYTES = 64 << 20
+
+
+class _JSONValueStream:
+    """Incrementally decode whitespace-separated JSON values from a text stream."""
+
+    def __init__(self, f, max_value_chars: int = MAX_STREAM_ENVELOPE_BYTES):
+        self._f = f
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._line = 1
+        self._line_pos = 0
+        self._max_value_chars = max_value_chars
+
+    def _read_more(self) -> bool:
+        if self._eof:
+            return False
+        # Drop consumed text so the buffer only ever holds the current value
+        self.line()
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        self._line_pos = 0
+        chunk = self._f.read(max(STREAM_CHUNK_SIZE, len(self._buf)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def line(self) -> int:
+        """Line number (1-based) of the current position."""
+        self._line += self._buf.count("\n", self._line_pos, self._pos)
+        self._line_pos = self._pos
+        return self._line
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read_more():
+                return ""
+
+    def advance(self) -> None:
+        self._pos += 1
+
+    def skip_line(self) -> None:
+        """Discard input up to and including the next newline."""
+        while True:
+            newline = self._buf.find("\n", self._pos)
+            if newline != -1:
+                self._pos = newline + 1
+                return
+            self._pos = len(self._buf)
+            if not self._read_more():
+                return
+
+    def _maybe_truncated(self, error: json.JSONDecodeError) -> bool:
+        # Errors caused by the buffer edge point at (or just before) its end;
+        # an unterminated string reports the string's start instead.
+        return error.pos >= len(self._buf) - 6 or error.msg.startswith("Unterminated string")
+
+    def decode(self):
+        """
+        Decode the value at the current position, reading more input as needed.
+
+        Raises:
+            json.JSONDecodeError: If the value is malformed or truncated
+            ValueError: If the value exceeds the per-envelope size limit
+        """
+        self.peek()  # raw_decode does not skip leading whitespace
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the buffer edge may be cut short (e.g. numbers)
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof or not self._maybe_truncated(e):
+                    raise
+            if len(self._buf) - self._pos > self._max_value_chars:
+                raise ValueError(
+                    f"Envelope exceeds {self._max_value_chars} characters or is malformed"
+                )
+            self._read_more()
+
+
+def _stream_error(error: ValueError) -> str:
+    # Decoder positions are buffer-relative, so report only the message
+    msg = error.msg if isinstance(error, json.JSONDecodeError) else str(error)
+    return f"Invalid JSON: {msg}"
+
+
+def iter_envelope_stream(stream_path: Path) -> Iterator[Tuple[str, object, str]]:
+    """
+    Parse envelopes one at a time from an NDJSON file or a top-level JSON array.
+
+    Only one envelope is held in memory at a time. Outside an array, values
+    are read as a whitespace-separated sequence (NDJSON, or pretty-printed
+    envelopes back to back); a malformed value is reported and the rest of
+    its line skipped. A malformed array element ends the stream, since the
+    remaining elements cannot be located reliably.
+
+    Args:
+        stream_path: Path to the NDJSON or JSON array file
+
+    Yields:
+        Tuple of (location, envelope, error_message)
+        - location: "file:line" for NDJSON, "file[#index]" for arrays
+        - envelope: Parsed envelope, or None if error_message is set
+        - error_message: Empty string if parsed, error description otherwise
+    """
+    with open(stream_path, 'r', encoding='utf-8') as f:
+        stream = _JSONValueStream(f)
+
+        if stream.peek() != "[":
+            while stream.peek():
+                location = f"{stream_path}:{stream.line()}"
+                try:
+                    yield location, stream.decode(), ""
+                except ValueError as e:
+                    yield location, None, _stream_error(e)
+                    stream.skip_line()
+            return
+
+        stream.advance()  # Opening '['
+        if stream.peek() == "]":
+            return
+
+        index = 0
+        while True:
+            location = f"{stream_path}[#{index}]"
+            try:
+                yield location, stream.decode(), ""
+            except ValueError as e:
+                yield location, None, _stream_error(e)
+                return
+
+            separator = stream.peek()
+            if separator == ",":
+                stream.advance()
+                index += 1
+            elif separator == "]":
+                return
+            else:
+                found = repr(separator) if separator else "end of file"
+                yield (
+                    f"{stream_path}[#{index + 1}]",
+                    None,
+                    f"Invalid JSON: expected ',' or ']', found {found}",
+                )
+                return
+
+
+def validate_envelope_stream(stream_path: Path, base_dir: Path) -> Iterator[EnvelopeResult]:
+    """
+    Validate every envelope in an NDJSON or JSON array file, one at a time.
+
+    Args:
+        stream_path: Path to the NDJSON or JSON array file
+        base_dir: Repository root directory
+
+    Yields:
+        One EnvelopeResult per envelope, with `source` set to "file:line" or
+        "file[#index]"
+    """
+    validator = get_envelope_validator(base_dir)
+    for index, (location, envelope, error_msg) in enumerate(iter_envelope_stream(stream_path)):
+        if envelope is None:
+            yield EnvelopeResult(location, index, False, error_msg)
+            continue
+
+        payload = envelope.get("payload") if isinstance(envelope, dict) else None
+        payload_type = payload.get("type") if isinstance(payload, dict) else None
+        is_valid, error_msg = validator.validate(envelope)
+        yield EnvelopeResult(location, index, is_valid, error_msg, payload_type)
+
+
+def _summarize_stream_chunk(base_dir: Path, stream_paths: list[Path]) -> list[Tuple[int, list[Tuple[str, str]]]]:
+    summaries = []
+    for stream_path in stream_paths:
+        total = 0
+        failures = []
+        try:
+            for result in validate_envelope_stream(stream_path, base_dir):
+                total += 1
+                if not result.is_valid:
+                    failures.append((result.source, result.error_message))
+        except (OSError, UnicodeDecodeError) as e:
+            total += 1
+            failures.append((str(stream_path), f"Unexpected error: {e}"))
+        summaries.append((total, failures))
+    return summaries
+
+
+def iter_validate_envelope_streams(
+    stream_paths: list[Path],
+    base_dir: Path,
+    jobs: int = 1,
+) -> Iterator[Tuple[int, list[Tuple[str, str]]]]:
+    """
+    Validate NDJSON / JSON array envelope files, optionally in parallel.
+
+    Each file is streamed by a single worker; only failures are kept.
+
+    Args:
+        stream_paths: List of paths to stream files
+        base_dir: Repository root directory
+        jobs: Number of worker processes (1 validates in-process)
+
+    Yields:
+        (envelope_count, [(location, error_message), ...]) per file, in input order
+    """
+    # Each stream can hold millions of envelopes, so two files are enough to fan out
+    return _map_ordered(partial(_summarize_stream_chunk, base_dir), list(stream_paths), jobs, min_items=2)
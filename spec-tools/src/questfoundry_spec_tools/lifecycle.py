@@ -0,0 +1,391 @@
+"""
+Lifecycle state-machine engine for QuestFoundry protocol messages.
+
+Compiles the normative state machines in 04-protocol/LIFECYCLES/ (hooks.md,
+tu.md, gate.md, view.md) into transition tables and replays a stream of
+envelopes against them, tracking the state of every hook, TU, gatecheck and
+view it sees.
+
+Each document's "States" list, "Terminal states" line and "Transition Matrix"
+table are parsed; what the documents leave implicit (which intent creates an
+entity, where its id lives in the payload, which payload field names the
+requested state) is declared per lifecycle in LIFECYCLE_SOURCES.
+
+Per envelope the engine does a constant number of dict lookups: intent ->
+lifecycle, (state, intent) -> allowed targets, target -> allowed senders.
+Entity state is kept as a small integer per id, so a single pass can track
+millions of entities.
+
+Violations use the error codes from the lifecycle documents:
+INVALID_STATE_TRANSITION, NOT_AUTHORIZED, VALIDATION_FAILED, plus
+UNKNOWN_ENTITY (strict mode only).
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+LIFECYCLES_DIR = Path("04-protocol") / "LIFECYCLES"
+
+# Allowed-sender token standing for the entity's owner roles
+OWNER = "Owner"
+
+_STATE_ITEM = re.compile(r"^- `([\w:-]+)` —")
+_TERMINAL_LINE = re.compile(r"^\*\*Terminal states:\*\*(.*)")
+_BACKTICKED = re.compile(r"`([\w:-]+)`")
+# Transition Matrix rows: | `from` | `to` | allowed sender | `intent` | ...
+_MATRIX_ROW = re.compile(r"^\|\s*`([\w:-]+)`\s*\|\s*`([\w:-]+)`\s*\|([^|]*)\|\s*`([\w.]+)`\s*\|")
+
+
+def _data(envelope: dict) -> dict:
+    payload = envelope.get("payload")
+    data = payload.get("data") if isinstance(payload, dict) else None
+    return data if isinstance(data, dict) else {}
+
+
+def _context(envelope: dict, name: str) -> Optional[str]:
+    context = envelope.get("context")
+    value = context.get(name) if isinstance(context, dict) else None
+    return value if isinstance(value, str) else None
+
+
+def _string(value: object) -> Optional[str]:
+    return value if isinstance(value, str) and value else None
+
+
+def _hook_key(envelope: dict) -> Optional[str]:
+    header = _data(envelope).get("header")
+    return _string(header.get("id")) if isinstance(header, dict) else None
+
+
+def _hook_target(envelope: dict) -> Optional[str]:
+    header = _data(envelope).get("header")
+    return _string(header.get("status")) if isinstance(header, dict) else None
+
+
+def _hook_owners(envelope: dict) -> Optional[frozenset[str]]:
+    step = _data(envelope).get("proposed_next_step")
+    owner = step.get("owner_r") if isinstance(step, dict) else None
+    return frozenset([owner]) if isinstance(owner, str) else None
+
+
+def _tu_key(envelope: dict) -> Optional[str]:
+    return _string(_data(envelope).get("id")) or _context(envelope, "tu")
+
+
+def _tu_owners(envelope: dict) -> Optional[frozenset[str]]:
+    data = _data(envelope)
+    owners = [data["owner_a"]] if isinstance(data.get("owner_a"), str) else []
+    responsible = data.get("responsible_r")
+    if isinstance(responsible, list):
+        owners.extend(role for role in responsible if isinstance(role, str))
+    return frozenset(owners) or None
+
+
+def _gate_key(envelope: dict) -> Optional[str]:
+    data = _data(envelope)
+    return _string(data.get("title")) or _string(data.get("id")) or _context(envelope, "tu")
+
+
+def _gate_target(envelope: dict) -> Optional[str]:
+    if envelope.get("intent") != "gate.decision":
+        return None
+    decision = _string(_data(envelope).get("decision"))
+    # Payloads say "conditional pass" (schema) or "conditional_pass" (gate.md)
+    return "decision:" + re.sub(r"[\s_]+", "-", decision) if decision else None
+
+
+def _view_key(envelope: dict) -> Optional[str]:
+    data = _data(envelope)
+    return (_context(envelope, "snapshot") or _string(data.get("cold_snapshot"))
+            or _string(data.get("snapshot")))
+
+
+def _none(envelope: dict) -> None:
+    return None
+
+
+@dataclass(frozen=True)
+class LifecycleSource:
+    """What a lifecycle document leaves implicit, declared per lifecycle."""
+    name: str
+    doc: str  # File in 04-protocol/LIFECYCLES/
+    create_intents: frozenset[str]  # Intents creating an entity in the initial state; empty: implicit
+    key: Callable[[dict], Optional[str]]  # Entity id from an envelope
+    target: Callable[[dict], Optional[str]]  # Requested state named in the payload, None if implied
+    owners: Callable[[dict], Optional[frozenset[str]]]  # Roles filling "Owner" in the matrix
+
+
+LIFECYCLE_SOURCES = (
+    LifecycleSource("hook", "hooks.md", frozenset({"hook.create"}), _hook_key, _hook_target, _hook_owners),
+    LifecycleSource("tu", "tu.md", frozenset({"tu.open"}), _tu_key, _none, _tu_owners),
+    LifecycleSource("gate", "gate.md", frozenset(), _gate_key, _gate_target, _none),
+    LifecycleSource("view", "view.md", frozenset(), _view_key, _none, _none),
+)
+
+
+@dataclass
+class Lifecycle:
+    """A compiled state machine; states are referred to by index."""
+    source: LifecycleSource
+    states: tuple[str, ...]  # states[0] is the initial state
+    terminal: frozenset[int]
+    # (from state, intent) -> {to state: allowed sender roles, OWNER for the entity's owners}
+    transitions: dict[Tuple[int, str], dict[int, frozenset[str]]]
+    implied: dict[str, int]  # intent -> target state, for intents with a single target
+
+    @property
+    def name(self) -> str:
+        return self.source.name
+
+    @property
+    def intents(self) -> frozenset[str]:
+        return frozenset(intent for _, intent in self.transitions) | self.source.create_intents
+
+
+def _sender_tokens(cell: str) -> frozenset[str]:
+    """'SR or Owner (A)' -> {'SR', 'Owner'}."""
+    tokens = set()
+    for part in re.split(r"\s+or\s+|/", cell.strip()):
+        part = part.strip()
+        if part:
+            tokens.add(OWNER if part.startswith(OWNER) else part)
+    return frozenset(tokens)
+
+
+def parse_lifecycle(text: str, source: LifecycleSource) -> Lifecycle:
+    """
+    Compile one lifecycle document.
+
+    States and terminal states are read from the "State Machine" section,
+    transitions from the table in the "State Transitions" section.
+
+    Args:
+        text: Contents of the 04-protocol/LIFECYCLES/ document
+        source: Declarations for what the document leaves implicit
+
+    Raises:
+        ValueError: If the document lists no states or no transitions, or a
+            transition names an undeclared state
+    """
+    states: list[str] = []
+    terminal: set[str] = set()
+    rows: list[Tuple[str, str, frozenset[str], str]] = []
+
+    section = ""
+    for line in text.splitlines():
+        if line.startswith("## "):
+            section = line
+            continue
+        if "State Machine" in section:
+            match = _STATE_ITEM.match(line)
+            if match and match.group(1) not in states:
+                states.append(match.group(1))
+                continue
+            match = _TERMINAL_LINE.match(line)
+            if match:
+                terminal.update(_BACKTICKED.findall(match.group(1)))
+        elif "State Transitions" in section:
+            match = _MATRIX_ROW.match(line)
+            if match:
+                from_state, to_state, senders, intent = match.groups()
+                rows.append((from_state, to_state, _sender_tokens(senders), intent))
+
+    if not states or not rows:
+        raise ValueError(f"{source.doc}: no states or transition matrix found")
+
+    index = {state: i for i, state in enumerate(states)}
+    transitions: dict[Tuple[int, str], dict[int, frozenset[str]]] = {}
+    targets_by_intent: dict[str, set[int]] = {}
+    for from_state, to_state, senders, intent in rows:
+        if from_state not in index or to_state not in index:
+            raise ValueError(f"{source.doc}: transition {from_state} -> {to_state} uses an undeclared state")
+        transitions.setdefault((index[from_state], intent), {})[index[to_state]] = senders
+        targets_by_intent.setdefault(intent, set()).add(index[to_state])
+
+    return Lifecycle(
+        source=source,
+        states=tuple(states),
+        terminal=frozenset(index[state] for state in terminal if state in index),
+        transitions=transitions,
+        implied={intent: next(iter(t)) for intent, t in targets_by_intent.items() if len(t) == 1},
+    )
+
+
+def load_lifecycles(repo_root: Path) -> list[Lifecycle]:
+    """
+    Compile every lifecycle in LIFECYCLE_SOURCES whose document exists.
+
+    Raises:
+        ValueError: If a lifecycle document cannot be compiled
+    """
+    lifecycles = []
+    for source in LIFECYCLE_SOURCES:
+        path = repo_root / LIFECYCLES_DIR / source.doc
+        if path.is_file():
+            lifecycles.append(parse_lifecycle(path.read_text(encoding="utf-8"), source))
+    return lifecycles
+
+
+@dataclass
+class LifecycleViolation:
+    """One envelope that breaks a lifecycle rule."""
+    location: str  # As passed to LifecycleEngine.check (e.g. "file:line")
+    lifecycle: str
+    entity: Optional[str]
+    code: str
+    message: str
+
+
+class LifecycleEngine:
+    """
+    Replays envelopes against compiled lifecycles, tracking per-entity state.
+
+    Envelopes whose intent is not in any transition matrix (ack, human.*,
+    tu.checkpoint, ...) are ignored. An entity seen for the first time in a
+    non-creating transition is adopted in the requested state, since a session
+    log may start mid-lifecycle; with strict=True that is an UNKNOWN_ENTITY
+    violation instead. Gatecheck and view entities have no creating intent and
+    start in their initial state (pre-gate, snapshot-selected).
+
+    "Owner" senders in a matrix resolve to the roles recorded for the entity
+    (hook proposed_next_step.owner_r, TU owner_a and responsible_r); if none
+    were recorded, any role may act as owner.
+    """
+
+    def __init__(self, lifecycles: Iterable[Lifecycle], strict: bool = False, check_roles: bool = True):
+        self.lifecycles = list(lifecycles)
+        self.strict = strict
+        self.check_roles = check_roles
+        self._by_intent: dict[str, Lifecycle] = {}
+        for lifecycle in self.lifecycles:
+            for intent in lifecycle.intents:
+                self._by_intent.setdefault(intent, lifecycle)
+        self._by_name = {lc.name: lc for lc in self.lifecycles}
+        self._index = {lc.name: {state: i for i, state in enumerate(lc.states)} for lc in self.lifecycles}
+        self._states: dict[str, dict[str, int]] = {lc.name: {} for lc in self.lifecycles}
+        self._owners: dict[str, dict[str, frozenset[str]]] = {lc.name: {} for lc in self.lifecycles}
+        self._interned: dict[frozenset[str], frozenset[str]] = {}
+        self.transitions = 0
+
+    @classmethod
+    def from_repo(cls, repo_root: Path, strict: bool = False, check_roles: bool = True) -> "LifecycleEngine":
+        """Engine over the lifecycles documented in a repository."""
+        return cls(load_lifecycles(repo_root), strict=strict, check_roles=check_roles)
+
+    def state(self, lifecycle: str, entity: str) -> Optional[str]:
+        """Current state of an entity, or None if it has not been seen."""
+        index = self._states[lifecycle].get(entity)
+        return self._by_name[lifecycle].states[index] if index is not None else None
+
+    def counts(self) -> dict[str, int]:
+        """Number of tracked entities per lifecycle."""
+        return {name: len(states) for name, states in self._states.items()}
+
+    def _record(self, lifecycle: Lifecycle, entity: str, state: int, envelope: dict) -> None:
+        self._states[lifecycle.name][entity] = state
+        owners = lifecycle.source.owners(envelope)
+        if owners is not None:
+            self._owners[lifecycle.name][entity] = self._interned.setdefault(owners, owners)
+        self.transitions += 1
+
+    def check(self, envelope: dict, location: str = "") -> Optional[LifecycleViolation]:
+        """
+        Apply one envelope.
+
+        Args:
+            envelope: Parsed envelope
+            location: Where the envelope came from, copied into any violation
+
+        Returns:
+            LifecycleViolation if the envelope breaks a rule (entity state is
+            then left unchanged), else None
+        """
+        lifecycle = self._by_intent.get(envelope.get("intent"))
+        if lifecycle is None:
+            return None
+        intent = envelope["intent"]
+        name = lifecycle.name
+
+        def violation(code: str, message: str) -> LifecycleViolation:
+            return LifecycleViolation(location, name, entity, code, message)
+
+        entity = lifecycle.source.key(envelope)
+        if entity is None:
+            return violation("VALIDATION_FAILED", f"{intent}: no {name} id in envelope")
+
+        requested = lifecycle.source.target(envelope)
+        target = self._index[name].get(requested) if requested is not None else None
+        if requested is not None and target is None:
+            return violation("VALIDATION_FAILED", f"{intent}: unknown {name} state '{requested}'")
+
+        current = self._states[name].get(entity)
+        if intent in lifecycle.source.create_intents:
+            if current is not None:
+                return violation(
+                    "INVALID_STATE_TRANSITION",
+                    f"{name} {entity} already exists (state '{lifecycle.states[current]}')",
+                )
+            self._record(lifecycle, entity, 0, envelope)
+            return None
+
+        first_seen = current is None
+        if first_seen:
+            if lifecycle.source.create_intents:
+                if self.strict:
+                    return violation("UNKNOWN_ENTITY", f"{intent}: {name} {entity} was never created")
+            else:
+                current = 0
+
+        allowed = lifecycle.transitions.get((current, intent)) if current is not None else None
+        if target is None and allowed is not None and len(allowed) == 1:
+            target = next(iter(allowed))
+        if allowed is None or target not in allowed:
+            if first_seen and not self.strict:
+                # Log started mid-lifecycle: adopt the requested state
+                adopted = target if target is not None else lifecycle.implied.get(intent)
+                if adopted is not None:
+                    self._record(lifecycle, entity, adopted, envelope)
+                return None
+            from_state = lifecycle.states[current]
+            reason = " (terminal state)" if current in lifecycle.terminal else ""
+            if target is None:
+                message = f"{name} {entity}: {intent} not allowed in state '{from_state}'{reason}"
+            else:
+                message = (f"{name} {entity}: cannot transition from '{from_state}' to "
+                           f"'{lifecycle.states[target]}' via {intent}{reason}")
+            return violation("INVALID_STATE_TRANSITION", message)
+
+        if self.check_roles:
+            senders = allowed[target]
+            sender = envelope.get("sender")
+            role = sender.get("role") if isinstance(sender, dict) else None
+            if role not in senders:
+                owners = self._owners[name].get(entity)
+                if OWNER not in senders or (owners is not None and role not in owners):
+                    permitted = senders - {OWNER}
+                    if OWNER in senders:
+                        permitted |= owners
+                    return violation(
+                        "NOT_AUTHORIZED",
+                        f"{name} {entity}: role {role!r} may not transition "
+                        f"'{lifecycle.states[current]}' -> '{lifecycle.states[target]}' "
+                        f"(allowed: {', '.join(sorted(permitted))})",
+                    )
+
+        self._record(lifecycle, entity, target, envelope)
+        return None
+
+    def run(self, envelopes: Iterable[Tuple[str, object]]) -> Iterator[LifecycleViolation]:
+        """
+        Check a sequence of (location, envelope) pairs in order.
+
+        Yields:
+            Each LifecycleViolation as it is found
+        """
+        for location, envelope in envelopes:
+            if isinstance(envelope, dict):
+                found = self.check(envelope, location)
+                if found is not None:
+                    yield found
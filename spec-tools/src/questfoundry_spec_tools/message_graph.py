@@ -0,0 +1,282 @@
+"""
+Reply/correlation graph checks for QuestFoundry envelope logs.
+
+Streams envelopes once, in log order, keeping a hash index of message ids:
+- every `id` must be unique;
+- every `reply_to` must name the `id` of a message in the log (ENVELOPE.md
+  §2.9); a reply may appear before its target, so unresolved replies are
+  held until the end of the log and then reported as orphans;
+- a reply SHOULD keep its target's `correlation_id`; mismatches are counted;
+- request/response latency is the reply's `time` minus its target's `time`,
+  aggregated per reply intent in fixed log-scale buckets.
+
+Ids are kept as 64-bit BLAKE2b digests mapped to one packed integer (time in
+milliseconds, correlation digest), and only the first MAX_REPORTED
+duplicates, orphans and mismatches are kept as samples. With a spill
+directory, the index moves to a scratch SQLite file there whenever it holds `max_in_memory`
+entries, so multi-million-message logs run in bounded RAM; only replies
+still waiting for their target stay in memory.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+DEFAULT_MAX_IN_MEMORY = 1 << 20
+MAX_REPORTED = 100
+LATENCY_BUCKETS = 48  # Bucket i holds latencies below 2**i ms; the last is open-ended
+
+_NO_TIME = (1 << 63) - 1
+_KEY_OFFSET = 1 << 63
+_CORRELATION_MASK = (1 << 32) - 1
+
+
+def _digest(value: str, size: int = 8) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=size).digest(), "big")
+
+
+def _time_ms(value: object) -> Optional[int]:
+    """Milliseconds since the epoch for an RFC 3339 `time`, None if unparseable or naive."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    time_ms = int(parsed.timestamp() * 1000)
+    return time_ms if time_ms >= 0 else None
+
+
+def _correlation(value: object) -> int:
+    """32-bit correlation digest; 0 for a message without correlation_id."""
+    if not isinstance(value, str) or not value:
+        return 0
+    return _digest(value, 4) or 1
+
+
+def _pack(time_ms: Optional[int], correlation: int) -> int:
+    return ((_NO_TIME if time_ms is None else time_ms) << 32) | correlation
+
+
+def _unpack(packed: int) -> Tuple[Optional[int], int]:
+    time_ms = packed >> 32
+    return (None if time_ms == _NO_TIME else time_ms), packed & _CORRELATION_MASK
+
+
+class MessageIndex:
+    """
+    Set of message-id digests with a packed value each.
+
+    Held in a dict; with a spill directory, the dict is flushed to a SQLite
+    table whenever it reaches max_in_memory entries and lookups fall through
+    to it. The spill file is scratch space: each index creates its own
+    uniquely named file in the directory and deletes it on close, so
+    concurrent runs never share one.
+    """
+
+    def __init__(self, spill_dir: Optional[Path] = None, max_in_memory: int = DEFAULT_MAX_IN_MEMORY):
+        self.max_in_memory = max_in_memory
+        self._memory: dict[int, int] = {}
+        self._spilled = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._spill_path: Optional[Path] = None
+        if spill_dir is not None:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            fd, name = tempfile.mkstemp(prefix="message_graph-", suffix=".sqlite", dir=spill_dir)
+            os.close(fd)
+            self._spill_path = Path(name)
+            self._conn = sqlite3.connect(name)
+            self._conn.execute("PRAGMA journal_mode=OFF")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute(
+                "CREATE TABLE messages (key INTEGER PRIMARY KEY, time_ms INTEGER, correlation INTEGER NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        return len(self._memory) + self._spilled
+
+    def get(self, key: int) -> Optional[int]:
+        value = self._memory.get(key)
+        if value is None and self._spilled:
+            row = self._conn.execute(
+                "SELECT time_ms, correlation FROM messages WHERE key = ?", (key - _KEY_OFFSET,)
+            ).fetchone()
+            value = _pack(*row) if row else None
+        return value
+
+    def add(self, key: int, value: int) -> bool:
+        """Insert a key; False (and no change) if it is already present."""
+        if self.get(key) is not None:
+            return False
+        self._memory[key] = value
+        if self._conn is not None and len(self._memory) >= self.max_in_memory:
+            self._spill()
+        return True
+
+    def _spill(self) -> None:
+        # SQLite INTEGER is signed 64-bit: digests are stored offset, values unpacked
+        self._conn.executemany(
+            "INSERT INTO messages (key, time_ms, correlation) VALUES (?, ?, ?)",
+            ((key - _KEY_OFFSET, *_unpack(value)) for key, value in self._memory.items()),
+        )
+        self._conn.commit()
+        self._spilled += len(self._memory)
+        self._memory.clear()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._spill_path.unlink(missing_ok=True)
+
+
+@dataclass
+class LatencyStats:
+    """Latency aggregate for one reply intent, in milliseconds."""
+    count: int = 0
+    total_ms: int = 0
+    min_ms: Optional[int] = None
+    max_ms: Optional[int] = None
+    buckets: list[int] = field(default_factory=lambda: [0] * LATENCY_BUCKETS)
+
+    def add(self, latency_ms: int) -> None:
+        self.count += 1
+        self.total_ms += latency_ms
+        self.min_ms = latency_ms if self.min_ms is None else min(self.min_ms, latency_ms)
+        self.max_ms = latency_ms if self.max_ms is None else max(self.max_ms, latency_ms)
+        self.buckets[min(latency_ms.bit_length(), LATENCY_BUCKETS - 1)] += 1
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound (ms) of the bucket holding the given fraction of latencies."""
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min((1 << i) - 1 if i else 0, self.max_ms)
+        return self.max_ms
+
+
+@dataclass
+class GraphIssue:
+    """One sampled duplicate, orphan or correlation mismatch."""
+    location: str
+    message_id: str
+    detail: str
+
+
+@dataclass
+class GraphReport:
+    """Outcome of a pass over one or more envelope logs."""
+    messages: int = 0
+    replies: int = 0
+    skipped: int = 0  # Not an object, or no string `id`
+    duplicates: int = 0
+    orphans: int = 0
+    correlation_mismatches: int = 0
+    negative_latencies: int = 0  # Reply timestamped before its target
+    samples: dict[str, list[GraphIssue]] = field(
+        default_factory=lambda: {"duplicate": [], "orphan": [], "correlation": []}
+    )
+    latency: dict[str, LatencyStats] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.duplicates == 0 and self.orphans == 0
+
+    def _sample(self, kind: str, issue: GraphIssue) -> None:
+        if len(self.samples[kind]) < MAX_REPORTED:
+            self.samples[kind].append(issue)
+
+
+class MessageGraphChecker:
+    """
+    Single-pass checker for ids, reply_to links, correlation ids and latency.
+
+    Feed envelopes in log order with add(), then call finish() once to
+    resolve replies whose target appeared later in the log.
+    """
+
+    def __init__(self, spill_dir: Optional[Path] = None, max_in_memory: int = DEFAULT_MAX_IN_MEMORY):
+        self.report = GraphReport()
+        self._index = MessageIndex(spill_dir, max_in_memory)
+        # Replies whose target has not been seen yet: target digest -> [(location, id, intent, packed)]
+        self._pending: dict[int, list[Tuple[str, str, str, int]]] = {}
+
+    def _link(self, location: str, message_id: str, intent: str, packed: int, target: int) -> None:
+        report = self.report
+        reply_time, reply_correlation = _unpack(packed)
+        target_time, target_correlation = _unpack(target)
+        if reply_correlation != target_correlation:
+            report.correlation_mismatches += 1
+            report._sample("correlation", GraphIssue(
+                location, message_id, "correlation_id differs from the replied-to message"
+            ))
+        if reply_time is not None and target_time is not None:
+            latency = reply_time - target_time
+            if latency < 0:
+                report.negative_latencies += 1
+            else:
+                report.latency.setdefault(intent, LatencyStats()).add(latency)
+
+    def add(self, envelope: object, location: str = "") -> None:
+        """Record one envelope."""
+        report = self.report
+        message_id = envelope.get("id") if isinstance(envelope, dict) else None
+        if not isinstance(message_id, str):
+            report.skipped += 1
+            return
+        report.messages += 1
+
+        packed = _pack(_time_ms(envelope.get("time")), _correlation(envelope.get("correlation_id")))
+        key = _digest(message_id)
+        if not self._index.add(key, packed):
+            report.duplicates += 1
+            report._sample("duplicate", GraphIssue(location, message_id, "id already used earlier in the log"))
+        else:
+            # Earlier replies that were waiting for this message
+            for waiting in self._pending.pop(key, ()):
+                self._link(*waiting, packed)
+
+        reply_to = envelope.get("reply_to")
+        if not isinstance(reply_to, str):
+            return
+        report.replies += 1
+        intent = envelope.get("intent") if isinstance(envelope.get("intent"), str) else "?"
+        target_key = _digest(reply_to)
+        target = self._index.get(target_key)
+        if target is None:
+            self._pending.setdefault(target_key, []).append((location, message_id, intent, packed))
+        else:
+            self._link(location, message_id, intent, packed, target)
+
+    def finish(self) -> GraphReport:
+        """Report replies whose target never appeared as orphans and release the index."""
+        report = self.report
+        for waiting in self._pending.values():
+            for location, message_id, _, _ in waiting:
+                report.orphans += 1
+                report._sample("orphan", GraphIssue(location, message_id, "reply_to names no message in the log"))
+        self._pending.clear()
+        self._index.close()
+        return report
+
+    def run(self, envelopes: Iterable[Tuple[str, object]]) -> GraphReport:
+        """Check a sequence of (location, envelope) pairs and return the report."""
+        for location, envelope in envelopes:
+            self.add(envelope, location)
+        return self.finish()
+
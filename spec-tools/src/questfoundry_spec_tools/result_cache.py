@@ -0,0 +1,208 @@
+"""
+Persistent validation result cache for QuestFoundry specification tools.
+
+Stores validation outcomes in .qfspec-cache/results.sqlite at the repository
+root, keyed by (instance SHA-256, schema SHA-256, tool version), so re-running
+qfspec-validate, qfspec-check-instance or qfspec-check-envelope skips every
+pair that has not changed since the last run. qfspec-validate-epub stores
+art asset digests here as well (kind "zip-member-sha256").
+
+The cache is bounded by total stored size; the least recently used entries
+are evicted first. Pass --no-cache to any of the commands to bypass it.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from . import __version__
+from .generate_schema_index import INTENTS_DOC, compute_sha256
+from .schema_registry import ENVELOPE_SCHEMA, SchemaRegistry
+
+CACHE_DIR = ".qfspec-cache"
+CACHE_FILE = "results.sqlite"
+DEFAULT_MAX_BYTES = 64 << 20
+ENTRY_OVERHEAD_BYTES = 64
+
+Result = Tuple[bool, str]
+
+
+def schemas_digest(base_dir: Path, registry: SchemaRegistry) -> str:
+    """
+    Combined SHA-256 of every Layer 3 schema, the envelope schema and INTENTS.md.
+
+    Envelope results depend on the envelope schema, on whichever payload
+    schema payload.type selects and on the intent routing table, so they are
+    keyed on all of them together.
+    """
+    layer_dir = base_dir / "03-schemas"
+    schema_paths = sorted(layer_dir.glob("*.schema.json")) if layer_dir.exists() else []
+    envelope_path = base_dir / ENVELOPE_SCHEMA
+    if envelope_path.exists():
+        schema_paths.append(envelope_path)
+
+    combined = hashlib.sha256()
+    for schema_path in schema_paths:
+        try:
+            sha256 = registry.entry_for_path(schema_path).sha256
+        except (OSError, ValueError):
+            sha256 = compute_sha256(schema_path)
+        combined.update(f"{schema_path.name}:{sha256}\n".encode("utf-8"))
+    intents_path = base_dir / INTENTS_DOC
+    if intents_path.exists():
+        combined.update(f"{intents_path.name}:{compute_sha256(intents_path)}\n".encode("utf-8"))
+    return combined.hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed LRU cache of (instance, schema, tool version) -> result."""
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_MAX_BYTES,
+                 tool_version: str = __version__):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.tool_version = tool_version
+        self._touched: list[Tuple[int, str]] = []
+        self._dirty = False
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " is_valid INTEGER NOT NULL,"
+            " message TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_lru ON results(last_used)")
+        self._conn.commit()
+
+    def key(self, instance_sha256: str, schema_sha256: str, kind: str = "instance") -> str:
+        """Build the cache key for an (instance, schema) pair."""
+        return f"{kind}:{instance_sha256}:{schema_sha256}:{self.tool_version}"
+
+    def get(self, key: str) -> Optional[Result]:
+        """Return the cached result for a key, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT is_valid, message FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touched.append((time.time_ns(), key))
+        return bool(row[0]), row[1]
+
+    def put(self, key: str, result: Result) -> None:
+        """Store a result."""
+        is_valid, message = result
+        size = len(key) + len(message.encode("utf-8")) + ENTRY_OVERHEAD_BYTES
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (key, is_valid, message, size, last_used)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, int(is_valid), message, size, time.time_ns()),
+        )
+        self._dirty = True
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY last_used ASC"):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def close(self) -> None:
+        """Record LRU touches, evict down to max_bytes and close the database."""
+        try:
+            if self._touched:
+                self._conn.executemany(
+                    "UPDATE results SET last_used = ? WHERE key = ?", self._touched
+                )
+                self._touched = []
+            if self._dirty:
+                self._evict()
+            self._conn.commit()
+        finally:
+            self._conn.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def open_result_cache(repo_root: Path, enabled: bool = True) -> Optional[ResultCache]:
+    """
+    Open the repository's result cache.
+
+    Args:
+        repo_root: Repository root directory
+        enabled: False (e.g. from --no-cache) returns None
+
+    Returns:
+        ResultCache, or None if disabled or the cache cannot be opened
+        (e.g. read-only checkout); callers then validate everything
+    """
+    if not enabled or os.environ.get("QFSPEC_NO_CACHE"):
+        return None
+    try:
+        return ResultCache(repo_root / CACHE_DIR / CACHE_FILE)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def validate_cached(
+    cache: Optional[ResultCache],
+    paths: list[Path],
+    schema_sha256: str,
+    run: Callable[[list[Path]], Iterable[Result]],
+    kind: str = "instance",
+) -> Iterator[Result]:
+    """
+    Yield results for paths in order, running validation only for cache misses.
+
+    Args:
+        cache: Open ResultCache, or None to validate everything
+        paths: Files to validate
+        schema_sha256: Digest of the schema(s) the files are validated against
+        run: Validates a list of paths, yielding results in input order
+        kind: Namespace for the key (e.g. "instance", "envelope")
+
+    Yields:
+        (is_valid, error_message) per path, in input order
+    """
+    if cache is None:
+        yield from run(paths)
+        return
+
+    keys = []
+    for path in paths:
+        try:
+            keys.append(cache.key(compute_sha256(path), schema_sha256, kind))
+        except OSError:
+            keys.append(None)
+
+    cached = {key: cache.get(key) for key in keys if key is not None}
+    misses = [path for path, key in zip(paths, keys) if key is None or cached.get(key) is None]
+    fresh = iter(run(misses))
+
+    for key in keys:
+        hit = cached.get(key) if key is not None else None
+        if hit is not None:
+            yield hit
+            continue
+        result = next(fresh)
+        if key is not None:
+            cache.put(key, result)
+        yield result
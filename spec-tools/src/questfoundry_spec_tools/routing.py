@@ -0,0 +1,214 @@
+"""
+Precomputed envelope routing table for QuestFoundry specification tools.
+
+Built once per repository from three sources:
+- the `payload_type` enum in 04-protocol/envelope.schema.json, each entry
+  resolved to its compiled Layer 3 schema (03-schemas/<type>.schema.json);
+- the Intent Summary Table in 04-protocol/INTENTS.md, giving each intent's
+  payload schema and its sender/receiver roles;
+- the `role_name` enum, which tells concrete roles (SR, GK, ...) apart from
+  placeholders such as "Owner (A)" or "Any".
+
+Dispatching an envelope is then a pair of dict lookups (intent, payload.type)
+with no filesystem access. The table is cached process-wide and rebuilt when
+one of its source files changes on disk; the source files are re-checked at
+most once every ROUTING_RECHECK_SECONDS, or on an explicit reload.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .generate_schema_index import INTENTS_DOC, parse_intents
+from .schema_registry import ENVELOPE_SCHEMA, SchemaEntry, SchemaRegistry, get_registry
+
+LAYER3_DIR = "03-schemas"
+NO_PAYLOAD = "none"
+BROADCAST = "*"
+
+# How long a cached table is trusted before its source files are stat'ed again
+ROUTING_RECHECK_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class IntentRoute:
+    """Routing rule for one intent from the INTENTS.md Intent Summary Table."""
+    intent: str
+    payload_type: str  # Expected payload.type ("none" for intents without a payload schema)
+    senders: Optional[frozenset[str]]  # Allowed sender roles, None if any role may send
+    receivers: Optional[frozenset[str]]  # Allowed receiver roles ("*" = broadcast), None if any
+
+    def role_error(self, sender: object, receiver: object) -> str:
+        """Describe a sender/receiver role the table does not allow, or return ""."""
+        if self.senders is not None and sender not in self.senders:
+            allowed = ", ".join(sorted(self.senders))
+            return f"sender role {sender!r} not allowed for intent '{self.intent}' (allowed: {allowed})"
+        if self.receivers is not None and receiver not in self.receivers:
+            allowed = ", ".join(sorted(self.receivers))
+            return f"receiver role {receiver!r} not allowed for intent '{self.intent}' (allowed: {allowed})"
+        return ""
+
+
+@dataclass
+class RoutingTable:
+    """Envelope schema, payload.type -> Layer 3 schema, and intent -> IntentRoute."""
+    envelope: Optional[SchemaEntry]  # None if envelope.schema.json is missing or broken
+    payloads: dict[str, Optional[SchemaEntry]]  # None: type is in the enum but has no schema
+    intents: dict[str, IntentRoute]
+    fingerprint: tuple = field(default=(), repr=False)
+    checked_at: float = field(default=0.0, repr=False)  # time.monotonic() of the last fingerprint check
+
+    def payload_entry(self, payload_type: str) -> Optional[SchemaEntry]:
+        """Compiled Layer 3 schema for a payload type, or None if there is none."""
+        return self.payloads.get(payload_type)
+
+    def route_error(self, envelope: dict, check_roles: bool = False) -> str:
+        """
+        Check an envelope against its intent's route.
+
+        Intents missing from the summary table are routed on payload.type
+        alone. A "none" payload carries no data to misroute and is accepted
+        for any intent (envelope.schema.json already pins ack/error to it).
+
+        Args:
+            envelope: Envelope that already passed envelope.schema.json
+            check_roles: Also require the sender/receiver roles listed for the intent
+
+        Returns:
+            Error description, or "" if the envelope is routed correctly
+        """
+        route = self.intents.get(envelope.get("intent"))
+        if route is None:
+            return ""
+        payload_type = envelope["payload"]["type"]
+        if payload_type != NO_PAYLOAD and payload_type != route.payload_type:
+            return (f"intent '{route.intent}' carries payload type '{route.payload_type}', "
+                    f"got '{payload_type}'")
+        if check_roles:
+            return route.role_error(envelope["sender"]["role"], envelope["receiver"]["role"])
+        return ""
+
+
+def _source_fingerprint(base_dir: Path) -> tuple:
+    """(name, mtime_ns) of every file the table is built from; mtime None if missing."""
+    stamps = []
+    for rel_path in (ENVELOPE_SCHEMA, INTENTS_DOC):
+        try:
+            stamps.append((str(rel_path), os.stat(base_dir / rel_path).st_mtime_ns))
+        except OSError:
+            stamps.append((str(rel_path), None))
+    try:
+        with os.scandir(base_dir / LAYER3_DIR) as entries:
+            stamps.extend(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries if entry.name.endswith(".schema.json")
+            ))
+    except OSError:
+        pass
+    return tuple(stamps)
+
+
+def _role_set(tokens: tuple[str, ...], known_roles: frozenset[str]) -> Optional[frozenset[str]]:
+    """Concrete roles for an INTENTS.md sender/receiver cell, None if any role may fill it."""
+    roles = set()
+    for token in tokens:
+        if token == "Broadcast":
+            roles.add(BROADCAST)
+        elif token in known_roles:
+            roles.add(token)
+        else:
+            return None  # Placeholder ("Owner (A)", "Any", ...) or unknown token
+    return frozenset(roles) or None
+
+
+def build_routing_table(base_dir: Path, registry: Optional[SchemaRegistry] = None) -> RoutingTable:
+    """
+    Build the routing table for a repository.
+
+    Args:
+        base_dir: Repository root directory
+        registry: Schema registry to take compiled validators from (default: process-wide)
+
+    Returns:
+        RoutingTable; payload types without a Layer 3 schema map to None
+    """
+    registry = registry if registry is not None else get_registry(base_dir)
+    fingerprint = _source_fingerprint(base_dir)
+
+    try:
+        envelope = registry.entry_for_path(base_dir / ENVELOPE_SCHEMA)
+    except (OSError, ValueError):
+        envelope = None
+
+    defs = envelope.schema.get("$defs", {}) if envelope is not None else {}
+    payload_types = defs.get("payload_type", {}).get("enum", [])
+    known_roles = frozenset(defs.get("role_name", {}).get("enum", []))
+
+    payloads: dict[str, Optional[SchemaEntry]] = {}
+    for payload_type in payload_types:
+        if payload_type == NO_PAYLOAD:
+            continue
+        try:
+            payloads[payload_type] = registry.entry_for_path(
+                base_dir / LAYER3_DIR / f"{payload_type}.schema.json"
+            )
+        except (OSError, ValueError):
+            payloads[payload_type] = None
+
+    intents = {
+        spec.intent: IntentRoute(
+            intent=spec.intent,
+            payload_type=spec.schema or NO_PAYLOAD,
+            senders=_role_set(spec.senders, known_roles),
+            receivers=_role_set(spec.receivers, known_roles),
+        )
+        for spec in parse_intents(base_dir)
+    }
+
+    return RoutingTable(envelope=envelope, payloads=payloads, intents=intents,
+                        fingerprint=fingerprint, checked_at=time.monotonic())
+
+
+_TABLES: dict[Path, RoutingTable] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def get_routing_table(base_dir: Path, registry: Optional[SchemaRegistry] = None,
+                      reload: bool = False) -> RoutingTable:
+    """
+    Return the process-wide routing table for a repository.
+
+    The table is rebuilt when the envelope schema, INTENTS.md or any Layer 3
+    schema has changed since it was built. Those files are stat'ed at most
+    once every ROUTING_RECHECK_SECONDS; in between, a call is a dict lookup.
+
+    Args:
+        base_dir: Repository root directory
+        registry: Schema registry to take compiled validators from (default: process-wide)
+        reload: Re-check the source files now instead of waiting for the recheck interval
+
+    Returns:
+        The current RoutingTable for base_dir
+    """
+    root = Path(os.path.abspath(base_dir))
+    if registry is not None and registry is not get_registry():
+        # Private registries get a private table
+        return build_routing_table(root, registry)
+
+    table = _TABLES.get(root)
+    if (table is not None and not reload
+            and time.monotonic() - table.checked_at < ROUTING_RECHECK_SECONDS):
+        return table
+
+    with _TABLES_LOCK:
+        table = _TABLES.get(root)
+        fingerprint = _source_fingerprint(root)
+        if table is None or table.fingerprint != fingerprint:
+            table = build_routing_table(root)
+            _TABLES[root] = table
+        else:
+            table.checked_at = time.monotonic()
+        return table
@@ -0,0 +1,199 @@
+"""
+Compiled-validator registry for QuestFoundry specification schemas.
+
+Loads every Layer 3 schema (03-schemas/*.schema.json) and the Layer 4
+envelope schema (04-protocol/envelope.schema.json) once, compiles a
+Draft202012Validator for each, and keeps them in a process-wide cache.
+
+Entries are keyed by schema name (e.g. "hook_card", "envelope"), by `$id`
+and by resolved file path. An entry is rebuilt when its file's mtime changes
+and the SHA-256 of its contents no longer matches.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError as e:
+    raise ImportError(
+        "jsonschema library is required. Install with: uv sync"
+    ) from e
+
+from .fast_check import compile_fast_check
+
+
+ENVELOPE_SCHEMA = Path("04-protocol") / "envelope.schema.json"
+SCHEMA_KEY = re.compile(r"[a-z0-9_]+")  # Bare Layer 3 schema name, never a path
+
+
+@dataclass
+class SchemaEntry:
+    """A compiled schema and the file state it was compiled from."""
+    name: str
+    path: Path
+    schema_id: str
+    mtime_ns: int
+    sha256: str
+    schema: dict
+    validator: Draft202012Validator
+    fast_check: Optional[Callable[[object], bool]] = None  # None: schema not fast-path compilable
+
+
+def schema_name_for_path(schema_path: Path) -> str:
+    """Convert a schema filename to its registry name (remove .schema.json suffix)."""
+    return schema_path.name.replace(".schema.json", "")
+
+
+def _sha256_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class SchemaRegistry:
+    """
+    Cache of compiled Draft 2020-12 validators, invalidated on file change.
+
+    Lookups stat the schema file; the file is only re-read when its mtime has
+    moved, and the validator is only rebuilt when the content hash differs.
+    """
+
+    def __init__(self, base_dir: Path | None = None):
+        self._entries: dict[Path, SchemaEntry] = {}
+        self._by_name: dict[str, Path] = {}
+        self._by_id: dict[str, Path] = {}
+        self._lock = threading.RLock()
+        if base_dir is not None:
+            self.load(base_dir)
+
+    def load(self, base_dir: Path, layer: str = "03-schemas") -> None:
+        """
+        Register every schema in a layer plus the envelope schema.
+
+        Args:
+            base_dir: Repository root directory
+            layer: Layer directory name (e.g., "03-schemas")
+        """
+        layer_dir = base_dir / layer
+        schema_paths = sorted(layer_dir.glob("*.schema.json")) if layer_dir.exists() else []
+        envelope_path = base_dir / ENVELOPE_SCHEMA
+        if envelope_path.exists():
+            schema_paths.append(envelope_path)
+
+        for schema_path in schema_paths:
+            try:
+                self.entry_for_path(schema_path)
+            except (OSError, ValueError):
+                # Broken schemas surface when they are looked up directly
+                continue
+
+    def entry_for_path(self, schema_path: Path) -> SchemaEntry:
+        """
+        Return the (fresh) entry for a schema file, compiling it if needed.
+
+        Raises:
+            FileNotFoundError: If the schema file does not exist
+            json.JSONDecodeError: If the schema file is not valid JSON
+        """
+        key = Path(os.path.abspath(schema_path))
+        mtime_ns = os.stat(key).st_mtime_ns
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == mtime_ns:
+                return entry
+
+            content = key.read_bytes()
+            sha256 = _sha256_bytes(content)
+            if entry is not None and entry.sha256 == sha256:
+                # Touched but unchanged: keep the compiled validator
+                entry.mtime_ns = mtime_ns
+                return entry
+
+            schema = json.loads(content)
+            entry = SchemaEntry(
+                name=schema_name_for_path(key),
+                path=key,
+                schema_id=schema.get("$id", "") if isinstance(schema, dict) else "",
+                mtime_ns=mtime_ns,
+                sha256=sha256,
+                schema=schema,
+                validator=Draft202012Validator(schema),
+                fast_check=compile_fast_check(schema),
+            )
+            self._register(entry)
+            return entry
+
+    def _register(self, entry: SchemaEntry) -> None:
+        old = self._entries.get(entry.path)
+        if old is not None and old.schema_id and self._by_id.get(old.schema_id) == old.path:
+            del self._by_id[old.schema_id]
+
+        self._entries[entry.path] = entry
+        self._by_name[entry.name] = entry.path
+        if entry.schema_id:
+            self._by_id[entry.schema_id] = entry.path
+
+    def validator_for_path(self, schema_path: Path) -> Draft202012Validator:
+        """Return the compiled validator for a schema file."""
+        return self.entry_for_path(schema_path).validator
+
+    def get(self, key: str) -> Draft202012Validator:
+        """
+        Return the compiled validator for a registered schema.
+
+        Args:
+            key: Schema name (e.g., "hook_card", "envelope") or `$id` URI
+
+        Raises:
+            KeyError: If no schema is registered under that name or `$id`
+        """
+        path = self._by_name.get(key) or self._by_id.get(key)
+        if path is None:
+            raise KeyError(f"Schema not registered: {key}")
+        return self.validator_for_path(path)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_name or key in self._by_id
+
+    def names(self) -> list[str]:
+        """Sorted list of registered schema names."""
+        return sorted(self._by_name)
+
+    def clear(self) -> None:
+        """Drop every compiled validator."""
+        with self._lock:
+            self._entries.clear()
+            self._by_name.clear()
+            self._by_id.clear()
+
+
+_REGISTRY = SchemaRegistry()
+_LOADED_ROOTS: set[Path] = set()
+
+
+def get_registry(base_dir: Path | None = None) -> SchemaRegistry:
+    """
+    Return the process-wide schema registry.
+
+    Args:
+        base_dir: Repository root; its schemas are registered on first use
+
+    Returns:
+        The shared SchemaRegistry instance
+    """
+    if base_dir is not None:
+        root = Path(os.path.abspath(base_dir))
+        if root not in _LOADED_ROOTS:
+            _REGISTRY.load(root)
+            _LOADED_ROOTS.add(root)
+    return _REGISTRY
@@ -0,0 +1,218 @@
+"""
+Long-running validation daemon for QuestFoundry specification tools.
+
+Keeps the schema registry warm and answers envelope and instance validation
+requests over localhost HTTP or a Unix domain socket, so callers avoid paying
+interpreter startup and schema compilation per message.
+
+Endpoints (JSON in, JSON out):
+- GET  /health                     Registered schemas and repository root
+- POST /validate/envelope          Body: one envelope, or an array of envelopes
+- POST /validate/instance/<schema> Body: one artifact instance
+
+Schemas are hot-reloaded: every lookup goes through the registry (or the
+envelope routing table, whose source files are re-checked at most once every
+routing.ROUTING_RECHECK_SECONDS), which recompiles a schema once its file
+changes on disk.
+
+Usage via uv:
+  uv run qfspec-serve                       # http://127.0.0.1:8765
+  uv run qfspec-serve --port 9000
+  uv run qfspec-serve --socket /tmp/qfspec.sock
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from .cli import find_repo_root
+from .instance_validator import (
+    EnvelopeValidator,
+    find_schema_file,
+    get_envelope_validator,
+    validate_instance_data,
+)
+from .schema_registry import SCHEMA_KEY, get_registry
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_REQUEST_BYTES = 64 << 20
+
+
+def _envelope_result(validator: EnvelopeValidator, envelope: object) -> dict:
+    is_valid, error_msg = validator.validate(envelope)
+    payload = envelope.get("payload") if isinstance(envelope, dict) else None
+    return {
+        "valid": is_valid,
+        "error": error_msg,
+        "payload_type": payload.get("type") if isinstance(payload, dict) else None,
+    }
+
+
+def handle_request(repo_root: Path, method: str, path: str, body: bytes,
+                   envelope_validator: EnvelopeValidator | None = None) -> tuple[int, dict]:
+    """
+    Dispatch one validation request.
+
+    Args:
+        repo_root: Repository root directory
+        method: HTTP method ("GET" or "POST")
+        path: Request path (e.g., "/validate/envelope")
+        body: Raw request body
+        envelope_validator: Validator for /validate/envelope (default: get_envelope_validator)
+
+    Returns:
+        Tuple of (http_status, response_object)
+    """
+    if method == "GET" and path == "/health":
+        registry = get_registry(repo_root)
+        return 200, {"status": "ok", "repository": str(repo_root), "schemas": registry.names()}
+
+    if method != "POST" or not path.startswith("/validate/"):
+        return 404, {"error": f"Unknown endpoint: {method} {path}"}
+
+    try:
+        data = json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return 400, {"error": f"Invalid JSON: {e}"}
+
+    if path == "/validate/envelope":
+        validator = envelope_validator or get_envelope_validator(repo_root)
+        if isinstance(data, list):
+            return 200, {"results": [_envelope_result(validator, envelope) for envelope in data]}
+        return 200, _envelope_result(validator, data)
+
+    if path.startswith("/validate/instance/"):
+        schema_name = path[len("/validate/instance/"):]
+        # Only bare Layer 3 schema keys; never resolve a path from the URL
+        if not SCHEMA_KEY.fullmatch(schema_name):
+            return 404, {"error": f"Schema not found: {schema_name}"}
+        schema_path = find_schema_file(repo_root, schema_name)
+        if not schema_path:
+            return 404, {"error": f"Schema not found: {schema_name}"}
+        is_valid, error_msg = validate_instance_data(schema_path, data)
+        return 200, {"valid": is_valid, "error": error_msg, "schema": schema_name}
+
+    return 404, {"error": f"Unknown endpoint: {method} {path}"}
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler that forwards requests to handle_request()."""
+
+    repo_root: Path = Path(".")
+    envelope_validator: EnvelopeValidator | None = None
+    quiet = False
+
+    def _respond(self, status: int, response: dict) -> None:
+        payload = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._respond(413, {"error": f"Request body exceeds {MAX_REQUEST_BYTES} bytes"})
+            return
+        body = self.rfile.read(length) if length else b""
+        status, response = handle_request(self.repo_root, method, self.path, body,
+                                          self.envelope_validator)
+        self._respond(status, response)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def address_string(self) -> str:
+        # Unix domain sockets have no (host, port) client address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server bound to a Unix domain socket."""
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def serve(repo_root: Path, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+          socket_path: Path | None = None, quiet: bool = False) -> None:
+    """
+    Warm the schema registry and serve validation requests until interrupted.
+
+    Args:
+        repo_root: Repository root directory
+        host: Interface for HTTP mode (localhost by default)
+        port: Port for HTTP mode
+        socket_path: Unix domain socket path; overrides host/port when given
+        quiet: Suppress per-request logging
+    """
+    registry = get_registry(repo_root)
+    # One validator for the server's lifetime; its routing table follows source changes
+    envelope_validator = get_envelope_validator(repo_root)
+
+    handler = type("Handler", (ValidationRequestHandler,), {
+        "repo_root": repo_root,
+        "envelope_validator": envelope_validator,
+        "quiet": quiet,
+    })
+
+    if socket_path is not None:
+        if socket_path.exists():
+            socket_path.unlink()
+        server = UnixHTTPServer(str(socket_path), handler)
+        address = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        address = f"http://{host}:{server.server_address[1]}"
+
+    print("=== QuestFoundry Spec: Validation Server ===")
+    print(f"Repository: {repo_root}")
+    print(f"Schemas loaded: {len(registry.names())}")
+    print(f"Listening on {address}")
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path is not None and socket_path.exists():
+            os.unlink(socket_path)
+
+
+def serve_cli():
+    """
+    CLI entry point for qfspec-serve command.
+    Runs the validation daemon.
+    """
+    parser = argparse.ArgumentParser(
+        prog="qfspec-serve",
+        description="Serve envelope and instance validation over localhost HTTP or a Unix socket",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"HTTP interface (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"HTTP port (default: {DEFAULT_PORT})")
+    parser.add_argument("--socket", type=Path, help="Listen on a Unix domain socket instead of HTTP")
+    parser.add_argument("--quiet", action="store_true", help="Do not log each request")
+    args = parser.parse_args()
+
+    serve(find_repo_root(), host=args.host, port=args.port, socket_path=args.socket, quiet=args.quiet)
+
+
+if __name__ == "__main__":
+    serve_cli()
@@ -0,0 +1,312 @@
+"""
+Cross-artifact reference checks for QuestFoundry Hot/Cold snapshots.
+
+A snapshot directory is a project root holding `hot/` and `cold/` (see
+00-north-star/COLD_SOT_FORMAT.md). Checking it takes two steps:
+
+1. Every JSON artifact is validated against its Layer 3 schema, in parallel.
+   Each worker also extracts the ids the artifact declares (TU ids, hook ids,
+   section anchors, snapshot ids) and the references it makes.
+2. The declarations are merged into one index (kind -> value -> path), and
+   every reference is resolved against it in a single pass.
+
+An artifact's schema comes from its fixed location (`cold/book.json`,
+`hot/manifest.json`, ...), its `$schema` URL, or the `artifact_type` given
+for its path in the Hot manifest's `$defs/artifact_reference` entries. JSON
+files matching none of these are indexed by path but not validated.
+
+Which fields declare and which reference what is listed in DECLARATIONS and
+REFERENCES below.
+"""
+
+import json
+import os
+import posixpath
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from .instance_validator import _map_ordered, validate_instance_data
+from .schema_registry import SCHEMA_KEY, get_registry
+
+LAYER3_DIR = "03-schemas"
+SCHEMA_URL_PREFIX = "https://questfoundry.liesdonk.nl/schemas/"
+HOT_MANIFEST = "hot/manifest.json"
+
+# Artifacts with a fixed location in the snapshot
+SNAPSHOT_FILES = {
+    "cold/manifest.json": "cold_manifest",
+    "cold/book.json": "cold_book",
+    "cold/art_manifest.json": "cold_art_manifest",
+    "cold/fonts.json": "cold_fonts",
+    "cold/build.lock.json": "cold_build_lock",
+    "cold/style.json": "style_manifest",
+    "cold/project_metadata.json": "project_metadata",
+    HOT_MANIFEST: "hot_manifest",
+}
+
+# Anchors an asset may use without a section behind them
+SPECIAL_ANCHORS = frozenset({"cover", "icon", "logo"})
+
+# Hot manifest lists of $defs/artifact_reference
+HOT_ARTIFACT_LISTS = (
+    "trace_units", "hooks", "research_memos", "canon_packs", "style_addenda",
+    "art_plans", "audio_plans", "gatecheck_reports", "view_logs",
+)
+
+# Artifacts whose top-level `tu` names the TU that produced them
+TU_LINKED = (
+    "art_plan", "audio_plan", "canon_pack", "codex_entry", "cuelist", "edit_notes",
+    "language_pack", "pn_playtest_notes", "register_map", "research_memo", "shotlist",
+    "style_addendum", "view_log",
+)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A field path ("a.b", "a[].b") and the index kind its values belong to."""
+    path: str
+    kind: str  # "file", "anchor", "tu", "hook" or "snapshot"
+    prefix: str = ""  # Prepended to each value (e.g. "assets/" for art filenames)
+    skip: frozenset = frozenset()  # Values that are not references
+    unique: bool = True  # Declarations only: a second declaration is a duplicate
+
+
+# schema name -> fields that declare an id, anchor or snapshot
+DECLARATIONS: dict[str, tuple[Rule, ...]] = {
+    "tu_brief": (Rule("id", "tu"),),
+    "hook_card": (Rule("header.id", "hook"),),
+    "cold_book": (Rule("sections[].anchor", "anchor"),),
+    "cold_manifest": (Rule("snapshot_id", "snapshot"),),
+    # A Hot section may be a revision of a Cold one, so its anchor may repeat
+    "hot_manifest": (Rule("snapshot_id", "snapshot"), Rule("sections[].anchor", "anchor", unique=False)),
+}
+
+# schema name -> fields that must resolve to a declaration (or, for "file", to a file)
+REFERENCES: dict[str, tuple[Rule, ...]] = {
+    "hot_manifest": (
+        Rule("cold_reference", "snapshot"),
+        Rule("trace_units[].id", "tu"),
+        Rule("hooks[].id", "hook"),
+        *(Rule(f"{name}[].path", "file") for name in HOT_ARTIFACT_LISTS),
+        Rule("sections[].text_file", "file"),
+        Rule("sections[].tu_id", "tu"),
+        Rule("proposed_assets[].path", "file"),
+        Rule("proposed_assets[].anchor", "anchor", skip=SPECIAL_ANCHORS),
+    ),
+    "cold_manifest": (Rule("files[].path", "file"),),
+    "cold_book": (Rule("sections[].text_file", "file"), Rule("start_section", "anchor")),
+    "cold_art_manifest": (
+        Rule("assets[].anchor", "anchor", skip=SPECIAL_ANCHORS),
+        Rule("assets[].filename", "file", prefix="assets/"),
+    ),
+    "hook_card": (Rule("header.tu", "tu"),),
+    **{name: (Rule("tu", "tu"),) for name in TU_LINKED},
+}
+
+
+def _values(data: object, path: str) -> Iterator[str]:
+    """String values at a field path; "[]" after a key iterates a list."""
+    nodes = [data]
+    for part in path.split("."):
+        many = part.endswith("[]")
+        key = part[:-2] if many else part
+        found = []
+        for node in nodes:
+            value = node.get(key) if isinstance(node, dict) else None
+            if many:
+                if isinstance(value, list):
+                    found.extend(value)
+            elif value is not None:
+                found.append(value)
+        nodes = found
+    return (node for node in nodes if isinstance(node, str))
+
+
+def normalize_path(value: str) -> str:
+    """Snapshot-relative POSIX path for a reference ("./hot/x.json", "/hot/x.json" -> "hot/x.json")."""
+    return posixpath.normpath(value.replace("\\", "/").lstrip("/"))
+
+
+@dataclass
+class ArtifactResult:
+    """Validation outcome and index entries for one JSON file."""
+    path: str  # Snapshot-relative POSIX path
+    schema: Optional[str]  # None: untyped, indexed by path only
+    is_valid: bool
+    error: str
+    declarations: list[Tuple[str, str, bool]] = field(default_factory=list)  # (kind, value, unique)
+    references: list[Tuple[str, str, str]] = field(default_factory=list)  # (field path, kind, value)
+
+
+@dataclass
+class SnapshotIssue:
+    """A dangling reference or a value declared by more than one artifact."""
+    path: str
+    field: str
+    kind: str
+    value: str
+    detail: str
+
+
+@dataclass
+class SnapshotReport:
+    """Outcome of checking one snapshot directory."""
+    files: int = 0
+    artifacts: list[ArtifactResult] = field(default_factory=list)
+    references: int = 0
+    dangling: list[SnapshotIssue] = field(default_factory=list)
+    duplicates: list[SnapshotIssue] = field(default_factory=list)
+
+    @property
+    def invalid(self) -> list[ArtifactResult]:
+        return [result for result in self.artifacts if not result.is_valid]
+
+    @property
+    def untyped(self) -> int:
+        return sum(1 for result in self.artifacts if result.schema is None)
+
+    @property
+    def ok(self) -> bool:
+        return not self.dangling and not self.duplicates and not self.invalid
+
+
+def _schema_for(rel_path: str, data: object, hints: dict[str, str]) -> Optional[str]:
+    if rel_path in SNAPSHOT_FILES:
+        return SNAPSHOT_FILES[rel_path]
+    if isinstance(data, dict):
+        url = data.get("$schema")
+        if isinstance(url, str) and url.startswith(SCHEMA_URL_PREFIX) and url.endswith(".schema.json"):
+            return url[len(SCHEMA_URL_PREFIX):-len(".schema.json")]
+    return hints.get(rel_path)
+
+
+def check_artifact(snapshot_dir: Path, base_dir: Path, rel_path: str,
+                   hints: Optional[dict[str, str]] = None) -> ArtifactResult:
+    """
+    Load, validate and index one JSON artifact.
+
+    Args:
+        snapshot_dir: Snapshot root directory
+        base_dir: Repository root directory (for 03-schemas/)
+        rel_path: Snapshot-relative POSIX path of the artifact
+        hints: Snapshot-relative path -> schema name (from the Hot manifest)
+
+    Returns:
+        ArtifactResult with the artifact's declarations and references
+    """
+    try:
+        with open(os.path.join(snapshot_dir, rel_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        return ArtifactResult(rel_path, None, False, f"Invalid JSON: {e}")
+    except (OSError, UnicodeDecodeError) as e:
+        return ArtifactResult(rel_path, None, False, f"Unexpected error: {e}")
+
+    schema = _schema_for(rel_path, data, hints or {})
+    if schema is None:
+        return ArtifactResult(rel_path, None, True, "")
+
+    if not SCHEMA_KEY.fullmatch(schema):
+        return ArtifactResult(rel_path, schema, False, f"Unknown schema '{schema}'")
+    schema_path = base_dir / LAYER3_DIR / f"{schema}.schema.json"
+    try:
+        entry = get_registry().entry_for_path(schema_path)
+    except OSError:
+        return ArtifactResult(rel_path, schema, False, f"Unknown schema '{schema}'")
+    except ValueError as e:
+        return ArtifactResult(rel_path, schema, False, f"Invalid schema '{schema}': {e}")
+
+    # Fast path for valid artifacts; jsonschema only to describe a failure
+    if entry.fast_check is not None and entry.fast_check(data):
+        is_valid, error = True, ""
+    else:
+        is_valid, error = validate_instance_data(schema_path, data)
+
+    result = ArtifactResult(rel_path, schema, is_valid, error)
+    for rule in DECLARATIONS.get(schema, ()):
+        result.declarations.extend((rule.kind, value, rule.unique) for value in _values(data, rule.path))
+    for rule in REFERENCES.get(schema, ()):
+        result.references.extend(
+            (rule.path, rule.kind, rule.prefix + value)
+            for value in _values(data, rule.path) if value not in rule.skip
+        )
+    return result
+
+
+def _check_artifact_chunk(snapshot_dir: Path, base_dir: Path, hints: dict[str, str],
+                          rel_paths: list[str]) -> list[ArtifactResult]:
+    return [check_artifact(snapshot_dir, base_dir, rel_path, hints) for rel_path in rel_paths]
+
+
+def list_snapshot_files(snapshot_dir: Path) -> list[str]:
+    """Snapshot-relative POSIX paths of every file, skipping hidden directories."""
+    files = []
+    for root, dirs, names in os.walk(snapshot_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        rel_root = Path(root).relative_to(snapshot_dir).as_posix()
+        for name in sorted(names):
+            files.append(name if rel_root == "." else f"{rel_root}/{name}")
+    return files
+
+
+def _hot_manifest_hints(snapshot_dir: Path) -> dict[str, str]:
+    """Path -> artifact_type from the Hot manifest's artifact references (empty if unreadable)."""
+    try:
+        with open(snapshot_dir / HOT_MANIFEST, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    hints = {}
+    for name in HOT_ARTIFACT_LISTS:
+        entries = manifest.get(name) if isinstance(manifest, dict) else None
+        for entry in entries if isinstance(entries, list) else ():
+            if isinstance(entry, dict) and isinstance(entry.get("path"), str) \
+                    and isinstance(entry.get("artifact_type"), str):
+                hints[normalize_path(entry["path"])] = entry["artifact_type"]
+    return hints
+
+
+def check_snapshot(snapshot_dir: Path, base_dir: Path, jobs: int = 1) -> SnapshotReport:
+    """
+    Validate every JSON artifact in a snapshot and resolve cross-artifact references.
+
+    Args:
+        snapshot_dir: Snapshot root directory (holding hot/ and cold/)
+        base_dir: Repository root directory (for 03-schemas/)
+        jobs: Number of worker processes for per-file validation (1 runs in-process)
+
+    Returns:
+        SnapshotReport; artifacts are in path order
+    """
+    report = SnapshotReport()
+    files = list_snapshot_files(snapshot_dir)
+    report.files = len(files)
+    json_files = [rel_path for rel_path in files if rel_path.endswith(".json")]
+
+    chunk = partial(_check_artifact_chunk, snapshot_dir, base_dir, _hot_manifest_hints(snapshot_dir))
+    report.artifacts = list(_map_ordered(chunk, json_files, jobs))
+
+    # Merge declarations into one index: kind -> value -> (declaring path, unique)
+    index: dict[str, dict[str, Tuple[str, bool]]] = {"file": dict.fromkeys(files, ("", True))}
+    for result in report.artifacts:
+        for kind, value, unique in result.declarations:
+            declared = index.setdefault(kind, {})
+            first = declared.get(value)
+            if first is None:
+                declared[value] = (result.path, unique)
+            elif unique and first[1]:
+                report.duplicates.append(SnapshotIssue(
+                    result.path, "", kind, value, f"already declared in {first[0]}"
+                ))
+
+    for result in report.artifacts:
+        for field_path, kind, value in result.references:
+            report.references += 1
+            target = normalize_path(value) if kind == "file" else value
+            if target not in index.get(kind, ()):
+                detail = "file not found" if kind == "file" else f"no artifact declares this {kind}"
+                report.dangling.append(SnapshotIssue(result.path, field_path, kind, value, detail))
+
+    return report
@@ -5,17 +5,62 @@ Creates dist/upload_kits/* with ORIGINAL DIRECTORY STRUCTURE PRESERVED in zips.
 This allows multiple files named system_prompt.md to coexist via their parent paths.
 Falls back to copying if symlinks are not permitted on the system.
 
+Builds are incremental: each kit's fingerprint (manifest content plus path,
+size and SHA-256 of every listed file) is recorded in
+dist/upload_kits/.build-state.json, and kits whose fingerprint is unchanged
+are skipped. File hashes are reused while a file's size and mtime are unchanged.
+
+Stale kits are built in parallel (--jobs, default: CPU count). The manifests
+overlap heavily, so each distinct source file is deflated once and the
+compressed bytes are copied into every archive that lists it.
+
+Zips are reproducible: members carry a fixed timestamp and permissions and
+are stored in manifest order, so identical inputs give byte-identical
+archives. dist/upload_kits/kits.lock.json records the SHA-256 of every kit
+and of each of its members, for sync jobs that upload only changed kits.
+
+Kits can carry a budget (maximum files, bytes and estimated tokens, plus
+required leading files). Every budget is checked before anything is
+written, and split kits (e.g. the Gemini kits, 10 files per zip) are
+bin-packed from a single manifest into the fewest parts that fit.
+
 Usage via uv:
-  uv run qfspec-build-kits
+  uv run qfspec-build-kits            # rebuild changed kits only
+  uv run qfspec-build-kits --force    # rebuild everything
+  uv run qfspec-build-kits --jobs 4   # at most 4 worker threads
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
 import os
 import shutil
+import struct
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import Iterator
+
+try:
+    from .generate_schema_index import compute_sha256
+except ImportError:  # Run as a script
+    from generate_schema_index import compute_sha256
+
+STATE_FILE = ".build-state.json"
+STATE_VERSION = 2
+LOCK_FILE = "kits.lock.json"
+LOCK_VERSION = 1
+
+# Rough size of one LLM token in bytes of Markdown/JSON, for token budgets
+BYTES_PER_TOKEN = 4
+
+# Fixed member metadata so identical inputs give byte-identical zips
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE = 0o100644
 
 
 def _find_repo_root() -> Path:
@@ -29,6 +74,25 @@ def _find_repo_root() -> Path:
     return repo_root
 
 
+def _parse_jobs(args: list[str]) -> int:
+    # Mirror --jobs/-j handling in cli.parse_jobs_option (this module also runs as a script)
+    jobs = os.cpu_count() or 1
+    for i, arg in enumerate(args):
+        value = None
+        if arg in ("--jobs", "-j"):
+            value = args[i + 1] if i + 1 < len(args) else ""
+        elif arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+        elif arg.startswith("-j") and len(arg) > 2:
+            value = arg[2:]
+        if value is not None:
+            if not value.isdigit() or int(value) < 1:
+                print(f"Error: {arg} requires a positive integer")
+                sys.exit(1)
+            jobs = int(value)
+    return jobs
+
+
 def _ensure_link_or_copy(src: Path, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -50,98 +114,542 @@ def _read_manifest(manifest: Path) -> list[str]:
     return items
 
 
-def _build_folder_from_manifest(repo_root: Path, manifest: Path, out_folder: Path) -> None:
-    """Build a folder with files from manifest, preserving original directory structure."""
-    if out_folder.exists():
-        shutil.rmtree(out_folder)
+class BuildState:
+    """
+    Fingerprints from the previous build, persisted in dist/upload_kits/.build-state.json.
+
+    Tracks per-file (size, mtime_ns, sha256) so unchanged files are not
+    re-hashed, and per-kit fingerprints so unchanged kits are not rebuilt.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.files: dict[str, dict] = {}
+        self.kits: dict[str, str] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == STATE_VERSION:
+                self.files = data.get("files", {})
+                self.kits = data.get("kits", {})
+        except (OSError, ValueError, AttributeError):
+            pass  # No (usable) state: everything is rebuilt
+
+    def file_sha256(self, repo_root: Path, rel: str) -> tuple[int, str]:
+        """
+        Return (size, sha256) of a manifest entry, re-hashing only if its size or mtime moved.
+
+        Raises:
+            FileNotFoundError: If the manifest entry does not exist
+        """
+        src = repo_root / rel
+        try:
+            stat = src.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Manifest entry not found: {rel}") from None
+
+        entry = self.files.get(rel)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["size"], entry["sha256"]
+
+        sha256 = hashlib.sha256(src.read_bytes()).hexdigest()
+        self.files[rel] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        return stat.st_size, sha256
+
+    def fingerprint(self, repo_root: Path, manifest_path: Path, items: list[str]) -> str:
+        """Fingerprint of a kit: manifest bytes plus path, size and hash of each listed file."""
+        combined = hashlib.sha256(manifest_path.read_bytes())
+        for rel in items:
+            size, sha256 = self.file_sha256(repo_root, rel)
+            combined.update(f"\n{rel}\t{size}\t{sha256}".encode("utf-8"))
+        return combined.hexdigest()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": STATE_VERSION, "files": self.files, "kits": self.kits}, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+
+def _is_current(src: Path, dest: Path) -> bool:
+    """True if dest already mirrors src (symlink to it, or an up-to-date copy)."""
+    if dest.is_symlink():
+        return Path(os.readlink(dest)) == src
+    if dest.is_file():
+        src_stat, dest_stat = src.stat(), dest.stat()
+        # copy2 preserves mtime
+        return src_stat.st_size == dest_stat.st_size and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+    return False
+
+
+def _build_folder(repo_root: Path, items: list[str], out_folder: Path) -> None:
+    """
+    Sync a folder with a kit's files, preserving original directory structure.
+
+    Existing links (or up-to-date copies) are kept; only missing or stale
+    entries are recreated and entries no longer in the manifest are removed.
+    """
     out_folder.mkdir(parents=True, exist_ok=True)
+    wanted = set()
 
-    for rel in _read_manifest(manifest):
+    for rel in items:
         src = (repo_root / rel).resolve()
         if not src.exists():
             raise FileNotFoundError(f"Manifest entry not found: {rel}")
         # Preserve original directory structure (e.g., 05-prompts/showrunner/system_prompt.md)
         dest = out_folder / rel
-        _ensure_link_or_copy(src, dest)
+        wanted.add(dest)
+        if not _is_current(src, dest):
+            _ensure_link_or_copy(src, dest)
 
+    # Drop entries removed from the manifest, then any directories left empty
+    for path in sorted(out_folder.rglob("*"), key=lambda p: len(p.parts), reverse=True):
+        if path.is_dir() and not path.is_symlink():
+            if not any(path.iterdir()):
+                path.rmdir()
+        elif path not in wanted:
+            path.unlink()
 
-def _zip_folder(folder: Path, zip_path: Path, manifest_order: list[str] | None = None) -> None:
+
+@dataclass(frozen=True)
+class DeflatedFile:
+    """A source file compressed once, ready to be copied into any number of zips."""
+    data: bytes
+    crc32: int
+    size: int
+
+
+def _deflate_file(path: Path) -> DeflatedFile:
+    """Raw-deflate a file with the same settings ZipFile uses for ZIP_DEFLATED."""
+    raw = path.read_bytes()
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    data = compressor.compress(raw) + compressor.flush()
+    return DeflatedFile(data, zlib.crc32(raw), len(raw))
+
+
+def _dos_datetime(date_time: tuple[int, int, int, int, int, int]) -> tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def _write_zip(zip_path: Path, members: list[tuple[str, DeflatedFile]]) -> None:
     """
-    Create a zip archive from a folder.
+    Write a reproducible zip archive from pre-deflated members, in the given order.
 
-    If manifest_order is provided, files are added to the zip in that order.
-    This ensures validation files (validation_contract.md, SCHEMA_INDEX.json)
-    appear first in the zip, which is critical for LLM file loading order.
+    Members are added in list order, so callers pass manifest order: validation
+    files (validation_contract.md, SCHEMA_INDEX.json) then appear first in
+    the zip, which is critical for LLM file loading order. Compressed bytes
+    are copied as-is, so a file shared by several kits is deflated only once.
+    Every member gets ZIP_DATE_TIME and ZIP_FILE_MODE, so the archive bytes
+    depend only on member names, order and contents.
     """
+    if len(members) >= 0xFFFF:
+        raise ValueError(f"{zip_path.name}: too many files for a zip without ZIP64")
+
     zip_path.parent.mkdir(parents=True, exist_ok=True)
-    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zf:
-        if manifest_order:
-            # Add files in manifest order (preserves validation file precedence)
-            for rel_path in manifest_order:
-                file_path = folder / rel_path
-                if file_path.is_file():
-                    zf.write(file_path, rel_path)
-        else:
-            # Fallback to rglob (alphabetical/filesystem order)
-            for p in folder.rglob("*"):
-                if p.is_file():
-                    zf.write(p, p.relative_to(folder))
-
-
-def _build_kit(repo_root: Path, manifests_dir: Path, out_dir: Path, manifest_name: str, output_name: str) -> None:
-    """Build a single kit from a manifest file."""
-    manifest_path = manifests_dir / manifest_name
+    # Write beside the target and swap in, so an interrupted build never leaves a truncated zip
+    tmp_path = zip_path.with_name(zip_path.name + ".tmp")
+    dos_time, dos_date = _dos_datetime(ZIP_DATE_TIME)
+    central = []
+    with open(tmp_path, "wb") as f:
+        for name, member in members:
+            if max(member.size, len(member.data), f.tell()) >= 0xFFFFFFFF:
+                raise ValueError(f"{zip_path.name}: {name} needs ZIP64, which is not supported")
+            encoded = name.encode("utf-8")
+            flags = 0 if encoded.isascii() else 0x800  # UTF-8 file name
+            fields = (8, dos_time, dos_date, member.crc32, len(member.data), member.size, len(encoded))
+
+            offset = f.tell()
+            f.write(struct.pack("<IHHHHHIIIHH", 0x04034B50, 20, flags, *fields, 0))
+            f.write(encoded)
+            f.write(member.data)
+            central.append(
+                struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50, (3 << 8) | 20, 20, flags, *fields,
+                            0, 0, 0, 0, ZIP_FILE_MODE << 16, offset)
+                + encoded
+            )
+
+        directory = b"".join(central)
+        offset = f.tell()
+        f.write(directory)
+        f.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                            len(directory), offset, 0))
+    os.replace(tmp_path, zip_path)
+
+
+class KitBudgetError(ValueError):
+    """Raised when a kit cannot be planned within its budget."""
+
+
+@dataclass(frozen=True)
+class KitBudget:
+    """
+    Upload limits for a kit, or for each part of a split kit.
+
+    Leading files must be the first manifest entries, in this order; they
+    open the kit (the first part of a split kit) so the model reads them first.
+    """
+    max_files: int | None = None
+    max_bytes: int | None = None
+    max_tokens: int | None = None
+    leading: tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        limits = [
+            f"{self.max_files} files" if self.max_files is not None else "",
+            f"{self.max_bytes} bytes" if self.max_bytes is not None else "",
+            f"~{self.max_tokens} tokens" if self.max_tokens is not None else "",
+        ]
+        return ", ".join(limit for limit in limits if limit) or "unlimited"
+
+
+@dataclass(frozen=True)
+class KitSpec:
+    """
+    A kit definition: manifest, output name and optional budget.
+
+    A split kit is packed into output-1..N, each part within the budget;
+    any other kit with a budget must fit it whole.
+    """
+    manifest: str
+    output: str
+    budget: KitBudget | None = None
+    split: bool = False
+
+
+def estimate_tokens(size: int) -> int:
+    """Rough token estimate for a file of the given size in bytes."""
+    return math.ceil(size / BYTES_PER_TOKEN)
+
+
+@dataclass
+class _Part:
+    items: list[str] = field(default_factory=list)
+    size: int = 0
+    tokens: int = 0
+
+    def fits(self, size: int, budget: KitBudget) -> bool:
+        return (
+            (budget.max_files is None or len(self.items) < budget.max_files)
+            and (budget.max_bytes is None or self.size + size <= budget.max_bytes)
+            and (budget.max_tokens is None or self.tokens + estimate_tokens(size) <= budget.max_tokens)
+        )
+
+    def add(self, rel: str, size: int) -> None:
+        self.items.append(rel)
+        self.size += size
+        self.tokens += estimate_tokens(size)
+
+
+def pack_kit(name: str, items: list[str], sizes: dict[str, int], budget: KitBudget) -> list[list[str]]:
+    """
+    Pack a kit's files into the fewest parts that each fit the budget.
+
+    Files are first filled into parts in manifest order. If that uses more
+    parts than the lower bound set by the budget, first-fit decreasing is
+    tried as well and kept if it needs fewer parts; each part then lists its
+    files in manifest order. The leading files always open the first part.
+
+    Args:
+        name: Kit name, for error messages
+        items: Repo-relative paths in manifest order
+        sizes: Size in bytes of each path
+        budget: Limits for every part
+
+    Returns:
+        Parts as lists of paths; a single part if the kit fits whole
+
+    Raises:
+        KitBudgetError: If a leading file is missing or out of place, or a
+            single file or the leading files alone exceed the budget
+    """
+    leading = list(budget.leading)
+    if items[:len(leading)] != leading:
+        raise KitBudgetError(
+            f"{name}: manifest must start with the leading files: {', '.join(leading)}"
+        )
+    first = _Part()
+    for rel in leading:
+        if not first.fits(sizes[rel], budget):
+            raise KitBudgetError(f"{name}: leading files alone exceed the budget ({budget})")
+        first.add(rel, sizes[rel])
+    rest = items[len(leading):]
+    for rel in rest:
+        if not _Part().fits(sizes[rel], budget):
+            raise KitBudgetError(
+                f"{name}: {rel} ({sizes[rel]} bytes, ~{estimate_tokens(sizes[rel])} tokens) "
+                f"exceeds the budget ({budget})"
+            )
+
+    # In order: fill each part until the next file does not fit
+    ordered = [_Part(list(first.items), first.size, first.tokens)]
+    for rel in rest:
+        if not ordered[-1].fits(sizes[rel], budget):
+            ordered.append(_Part())
+        ordered[-1].add(rel, sizes[rel])
+
+    total = sum(sizes[rel] for rel in items)
+    lower_bound = max(
+        math.ceil(len(items) / budget.max_files) if budget.max_files else 1,
+        math.ceil(total / budget.max_bytes) if budget.max_bytes else 1,
+        math.ceil(sum(estimate_tokens(sizes[rel]) for rel in items) / budget.max_tokens)
+        if budget.max_tokens else 1,
+    )
+    if len(ordered) <= lower_bound:
+        return [part.items for part in ordered]
+
+    # First-fit decreasing by each file's largest share of a per-part limit
+    def weight(rel: str) -> float:
+        return max(
+            1 / budget.max_files if budget.max_files else 0,
+            sizes[rel] / budget.max_bytes if budget.max_bytes else 0,
+            estimate_tokens(sizes[rel]) / budget.max_tokens if budget.max_tokens else 0,
+        )
+
+    packed = [first]
+    for rel in sorted(rest, key=weight, reverse=True):
+        part = next((part for part in packed if part.fits(sizes[rel], budget)), None)
+        if part is None:
+            part = _Part()
+            packed.append(part)
+        part.add(rel, sizes[rel])
+    if len(packed) >= len(ordered):
+        return [part.items for part in ordered]
+
+    position = {rel: i for i, rel in enumerate(items)}
+    parts = [sorted(part.items, key=position.__getitem__) for part in packed]
+    return parts[:1] + sorted(parts[1:], key=lambda part: position[part[0]])
+
+
+@dataclass
+class KitPlan:
+    """A kit (or one part of a split kit) resolved from its manifest, and whether it must be rebuilt."""
+    output_name: str
+    manifest_path: Path
+    items: list[str]
+    fingerprint: str | None
+    stale: bool
+
+
+def plan_kit(
+    repo_root: Path,
+    manifests_dir: Path,
+    out_dir: Path,
+    spec: KitSpec,
+    state: BuildState | None = None,
+) -> list[KitPlan] | None:
+    """
+    Resolve a kit definition into the kits to write, checking its budget.
+
+    With a BuildState, a kit is not stale when its fingerprint matches the
+    previous build and both outputs still exist.
+
+    Returns:
+        One KitPlan (or one per part of a split kit), or None if the
+        manifest file does not exist
+
+    Raises:
+        KitBudgetError: If the kit cannot be planned within its budget
+    """
+    manifest_path = manifests_dir / spec.manifest
     if not manifest_path.exists():
-        print(f"  Skipping {output_name}: manifest {manifest_name} not found")
-        return
+        return None
+
+    items = _read_manifest(manifest_path)
+    parts = [items]
+    if spec.budget:
+        sizes = {}
+        for rel in items:
+            try:
+                sizes[rel] = (repo_root / rel).stat().st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Manifest entry not found: {rel}") from None
+        parts = pack_kit(spec.output, items, sizes, spec.budget)
+        if len(parts) > 1 and not spec.split:
+            raise KitBudgetError(
+                f"{spec.output}: {len(items)} files ({sum(sizes.values())} bytes) "
+                f"do not fit the budget ({spec.budget}); split the manifest or mark the kit split=True"
+            )
+
+    plans = []
+    for i, part in enumerate(parts, 1):
+        output_name = f"{spec.output}-{i}" if spec.split else spec.output
+        fingerprint = state.fingerprint(repo_root, manifest_path, part) if state else None
+        stale = not (
+            state
+            and state.kits.get(output_name) == fingerprint
+            and (out_dir / output_name).is_dir()
+            and (out_dir / f"{output_name}.zip").is_file()
+        )
+        plans.append(KitPlan(output_name, manifest_path, part, fingerprint, stale))
+    return plans
+
 
-    folder = out_dir / output_name
-    zip_path = out_dir / f"{output_name}.zip"
+def _remove_stale_parts(out_dir: Path, spec: KitSpec, parts: int) -> None:
+    """Delete outputs of split-kit parts beyond the current part count."""
+    n = parts + 1
+    while (out_dir / f"{spec.output}-{n}").exists() or (out_dir / f"{spec.output}-{n}.zip").exists():
+        shutil.rmtree(out_dir / f"{spec.output}-{n}", ignore_errors=True)
+        (out_dir / f"{spec.output}-{n}.zip").unlink(missing_ok=True)
+        n += 1
 
-    manifest_order = _read_manifest(manifest_path)
-    _build_folder_from_manifest(repo_root, manifest_path, folder)
-    _zip_folder(folder, zip_path, manifest_order=manifest_order)
-    print(f"  ✓ {output_name}.zip ({len(manifest_order)} files)")
+
+def write_lock(out_dir: Path, repo_root: Path, kits: list[KitPlan], state: BuildState) -> bool:
+    """
+    Write dist/upload_kits/kits.lock.json for the given kits, if its content changed.
+
+    Each kit lists its zip's SHA-256 and size plus the path, SHA-256 and size
+    of every member in archive order. Member hashes come from the build
+    state (already computed for the fingerprints); kits that were not
+    rebuilt are still listed.
+
+    Returns:
+        True if the lock file was (re)written
+    """
+    lock = {"version": LOCK_VERSION, "kits": {}}
+    for kit in kits:
+        zip_path = out_dir / f"{kit.output_name}.zip"
+        files = []
+        for rel in kit.items:
+            size, sha256 = state.file_sha256(repo_root, rel)
+            files.append({"path": rel, "sha256": sha256, "size": size})
+        lock["kits"][kit.output_name] = {
+            "zip": zip_path.name,
+            "sha256": compute_sha256(zip_path),
+            "size": zip_path.stat().st_size,
+            "files": files,
+        }
+
+    content = json.dumps(lock, indent=2) + "\n"
+    lock_path = out_dir / LOCK_FILE
+    try:
+        if lock_path.read_text(encoding="utf-8") == content:
+            return False
+    except OSError:
+        pass
+    tmp_path = lock_path.with_suffix(".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, lock_path)
+    return True
+
+
+def _build_kit(repo_root: Path, out_dir: Path, kit: KitPlan, deflated: dict[str, DeflatedFile]) -> None:
+    """Sync a kit's folder and write its zip from the shared deflated files."""
+    _build_folder(repo_root, kit.items, out_dir / kit.output_name)
+    _write_zip(out_dir / f"{kit.output_name}.zip", [(rel, deflated[rel]) for rel in kit.items])
+
+
+def build_kits(
+    repo_root: Path,
+    out_dir: Path,
+    kits: list[KitPlan],
+    jobs: int = 1,
+) -> Iterator[KitPlan]:
+    """
+    Build kits in a thread pool, yielding each kit once it is written, in input order.
+
+    Every distinct source file across the kits is deflated once up front;
+    each archive then only copies compressed bytes.
+    """
+    sources = list(dict.fromkeys(rel for kit in kits for rel in kit.items))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        deflated = dict(zip(sources, pool.map(_deflate_file, (repo_root / rel for rel in sources))))
+        futures = [pool.submit(_build_kit, repo_root, out_dir, kit, deflated) for kit in kits]
+        for kit, future in zip(kits, futures):
+            future.result()
+            yield kit
+
+
+LEADING_FILES = ("05-prompts/_shared/validation_contract.md", "05-prompts/SCHEMA_INDEX.json")
+
+# Gemini accepts at most 10 files per zip
+GEMINI_BUDGET = KitBudget(max_files=10)
+GEMINI_LEADING_BUDGET = KitBudget(max_files=10, leading=LEADING_FILES)
+
+# (heading, [KitSpec, ...]) in build order
+KIT_GROUPS: list[tuple[str, list[KitSpec]]] = [
+    # Standalone kits (for traditional role-based usage)
+    ("Standalone Kits", [
+        KitSpec("chatgpt_minimal.list", "minimal-standalone"),
+        KitSpec("optional.list", "optional-standalone"),
+        KitSpec("full-standalone.list", "full-standalone"),
+    ]),
+    # Gemini kits for standalone usage; the full kit is split automatically
+    ("Gemini Standalone Splits", [
+        KitSpec("gemini_core_zip.list", "gemini-minimal-standalone", GEMINI_LEADING_BUDGET),
+        KitSpec("gemini_optional_zip.list", "gemini-optional-standalone", GEMINI_BUDGET),
+        KitSpec("full-standalone.list", "gemini-full-standalone", GEMINI_LEADING_BUDGET, split=True),
+    ]),
+    # Orchestration kits (for loop-focused architecture)
+    ("Orchestration Kits", [
+        KitSpec("orchestration-complete.list", "orchestration-complete"),
+    ]),
+    # Gemini splits for orchestration
+    ("Gemini Orchestration Splits", [
+        KitSpec("orchestration-complete.list", "gemini-orchestration", GEMINI_LEADING_BUDGET, split=True),
+    ]),
+]
 
 
 def build_kits_cli() -> None:
     repo_root = _find_repo_root()
     manifests_dir = repo_root / "05-prompts" / "upload_kits" / "manifests"
     out_dir = repo_root / "dist" / "upload_kits"
+    args = sys.argv[1:]
+    force = "--force" in args
+    jobs = _parse_jobs(args)
 
     if not manifests_dir.exists():
         print(f"Manifests not found: {manifests_dir}")
         sys.exit(1)
 
+    state = BuildState(out_dir / STATE_FILE)
+    if force:
+        state.kits.clear()
+
     print("Building upload kits with preserved directory structure...\n")
 
-    # Standalone kits (for traditional role-based usage)
-    print("Standalone Kits:")
-    _build_kit(repo_root, manifests_dir, out_dir, "chatgpt_minimal.list", "minimal-standalone")
-    _build_kit(repo_root, manifests_dir, out_dir, "optional.list", "optional-standalone")
-    _build_kit(repo_root, manifests_dir, out_dir, "full-standalone.list", "full-standalone")
-
-    # Gemini splits for full standalone (10-file limit per zip)
-    print("\nGemini Standalone Splits:")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini_core_zip.list", "gemini-minimal-standalone")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini_optional_zip.list", "gemini-optional-standalone")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-full-standalone-1.list", "gemini-full-standalone-1")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-full-standalone-2.list", "gemini-full-standalone-2")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-full-standalone-3.list", "gemini-full-standalone-3")
+    # Plan (and check the budget of) every kit before writing anything
+    try:
+        plans = [
+            (heading, [(spec, plan_kit(repo_root, manifests_dir, out_dir, spec, state)) for spec in specs])
+            for heading, specs in KIT_GROUPS
+        ]
+    except KitBudgetError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    stale = [kit for _, kits in plans for _, parts in kits for kit in parts or () if kit.stale]
+    built = build_kits(repo_root, out_dir, stale, jobs)
 
-    # Orchestration kits (for loop-focused architecture)
-    print("\nOrchestration Kits:")
-    _build_kit(repo_root, manifests_dir, out_dir, "orchestration-complete.list", "orchestration-complete")
-
-    # Gemini splits for orchestration (10-file limit per zip)
-    print("\nGemini Orchestration Splits:")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-orchestration-1-foundation.list", "gemini-orchestration-1-foundation")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-orchestration-2-playbooks.list", "gemini-orchestration-2-playbooks")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-orchestration-3-playbooks-extra.list", "gemini-orchestration-3-playbooks-extra")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-orchestration-4-adapters-core.list", "gemini-orchestration-4-adapters-core")
-    _build_kit(repo_root, manifests_dir, out_dir, "gemini-orchestration-5-adapters-extra.list", "gemini-orchestration-5-adapters-extra")
-
-    print(f"\n✓ Upload kits built under: {out_dir}")
+    rebuilt = skipped = 0
+    for i, (heading, kits) in enumerate(plans):
+        print(f"{chr(10) if i else ''}{heading}:")
+        for spec, parts in kits:
+            if parts is None:
+                print(f"  Skipping {spec.output}: manifest {spec.manifest} not found")
+                skipped += 1
+                continue
+            if spec.split:
+                _remove_stale_parts(out_dir, spec, len(parts))
+            for kit in parts:
+                if kit.stale:
+                    next(built)
+                    state.kits[kit.output_name] = kit.fingerprint
+                    state.save()
+                    print(f"  ✓ {kit.output_name}.zip ({len(kit.items)} files)")
+                    rebuilt += 1
+                else:
+                    print(f"  = {kit.output_name}.zip unchanged ({len(kit.items)} files)")
+                    skipped += 1
+    state.save()
+
+    planned = [kit for _, kits in plans for _, parts in kits for kit in parts or ()]
+    if write_lock(out_dir, repo_root, planned, state):
+        print(f"\n  ✓ {LOCK_FILE} updated")
+
+    print(f"\n✓ Upload kits built under: {out_dir} ({rebuilt} rebuilt, {skipped} unchanged)")
 
 
 if __name__ == "__main__":